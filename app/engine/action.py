@@ -114,20 +114,22 @@ class Move(Action):
         game.movement.begin_move(self.unit, self.path, self.event, self.follow)
 
     def execute(self):
-        game.leave(self.unit)
-        if self.new_movement_left is not None:
-            self.unit.movement_left = self.new_movement_left
-        self.unit.has_moved = True
-        self.unit.position = self.new_pos
-        game.arrive(self.unit)
+        with aura_funcs.moving(game):
+            game.leave(self.unit)
+            if self.new_movement_left is not None:
+                self.unit.movement_left = self.new_movement_left
+            self.unit.has_moved = True
+            self.unit.position = self.new_pos
+            game.arrive(self.unit)
 
     def reverse(self):
-        game.leave(self.unit)
-        self.new_movement_left = self.unit.movement_left
-        self.unit.movement_left = self.prev_movement_left
-        self.unit.has_moved = self.has_moved
-        self.unit.position = self.old_pos
-        game.arrive(self.unit)
+        with aura_funcs.moving(game):
+            game.leave(self.unit)
+            self.new_movement_left = self.unit.movement_left
+            self.unit.movement_left = self.prev_movement_left
+            self.unit.has_moved = self.has_moved
+            self.unit.position = self.old_pos
+            game.arrive(self.unit)
 
 
 # Just another name for move
@@ -147,22 +149,25 @@ class SimpleMove(Move):
         self.update_fow_action = UpdateFogOfWar(self.unit)
 
     def do(self):
-        game.leave(self.unit)
-        self.unit.position = self.new_pos
-        game.arrive(self.unit)
+        with aura_funcs.moving(game):
+            game.leave(self.unit)
+            self.unit.position = self.new_pos
+            game.arrive(self.unit)
         self.update_fow_action.do()
 
     def execute(self):
-        game.leave(self.unit)
-        self.unit.position = self.new_pos
-        game.arrive(self.unit)
+        with aura_funcs.moving(game):
+            game.leave(self.unit)
+            self.unit.position = self.new_pos
+            game.arrive(self.unit)
         self.update_fow_action.execute()
 
     def reverse(self):
         self.update_fow_action.reverse()
-        game.leave(self.unit)
-        self.unit.position = self.old_pos
-        game.arrive(self.unit)
+        with aura_funcs.moving(game):
+            game.leave(self.unit)
+            self.unit.position = self.old_pos
+            game.arrive(self.unit)
 
 
 class Teleport(SimpleMove):
@@ -177,9 +182,10 @@ class ForcedMovement(SimpleMove):
         self.unit.sprite.offset = [x_offset, y_offset]
         self.unit.sprite.set_transition('fake_in')
 
-        game.leave(self.unit)
-        self.unit.position = self.new_pos
-        game.arrive(self.unit)
+        with aura_funcs.moving(game):
+            game.leave(self.unit)
+            self.unit.position = self.new_pos
+            game.arrive(self.unit)
         self.update_fow_action.do()
 
 
@@ -189,35 +195,38 @@ class Swap(Action):
         self.unit2 = unit2
         self.pos1 = unit1.position
         self.pos2 = unit2.position
-        self.update_fow_action1 = UpdateFogOfWar(self.unit)
-        self.update_fow_action2 = UpdateFogOfWar(self.unit)
+        self.update_fow_action1 = UpdateFogOfWar(self.unit1)
+        self.update_fow_action2 = UpdateFogOfWar(self.unit2)
 
     def do(self):
-        game.leave(self.unit1)
-        game.leave(self.unit2)
-        self.unit1.position, self.unit2.position = self.pos2, self.pos1
-        game.arrive(self.unit2)
-        game.arrive(self.unit1)
+        with aura_funcs.moving(game):
+            game.leave(self.unit1)
+            game.leave(self.unit2)
+            self.unit1.position, self.unit2.position = self.pos2, self.pos1
+            game.arrive(self.unit2)
+            game.arrive(self.unit1)
         self.update_fow_action1.do()
         self.update_fow_action2.do()
 
     def reverse(self):
         self.update_fow_action1.reverse()
         self.update_fow_action2.reverse()
-        game.leave(self.unit1)
-        game.leave(self.unit2)
-        self.unit1.position, self.unit2.position = self.pos1, self.pos2
-        game.arrive(self.unit2)
-        game.arrive(self.unit1)
+        with aura_funcs.moving(game):
+            game.leave(self.unit1)
+            game.leave(self.unit2)
+            self.unit1.position, self.unit2.position = self.pos1, self.pos2
+            game.arrive(self.unit2)
+            game.arrive(self.unit1)
 
 
 class Warp(SimpleMove):
     def do(self):
         self.unit.sprite.set_transition('warp_move')
 
-        game.leave(self.unit)
-        self.unit.position = self.new_pos
-        game.arrive(self.unit)
+        with aura_funcs.moving(game):
+            game.leave(self.unit)
+            self.unit.position = self.new_pos
+            game.arrive(self.unit)
         self.update_fow_action.do()
 
 
@@ -225,9 +234,10 @@ class Swoosh(SimpleMove):
     def do(self):
         self.unit.sprite.set_transition('swoosh_move')
 
-        game.leave(self.unit)
-        self.unit.position = self.new_pos
-        game.arrive(self.unit)
+        with aura_funcs.moving(game):
+            game.leave(self.unit)
+            self.unit.position = self.new_pos
+            game.arrive(self.unit)
         self.update_fow_action.do()
 
 
@@ -235,9 +245,10 @@ class FadeMove(SimpleMove):
     def do(self):
         self.unit.sprite.set_transition('fade_move')
 
-        game.leave(self.unit)
-        self.unit.position = self.new_pos
-        game.arrive(self.unit)
+        with aura_funcs.moving(game):
+            game.leave(self.unit)
+            self.unit.position = self.new_pos
+            game.arrive(self.unit)
         self.update_fow_action.do()
 
 
@@ -962,14 +973,22 @@ class SetObjData(Action):
         self.value = value
         self.old_value = None
 
+    def _clear_owner_stats(self):
+        # Skill data can change the stat bonuses the skill gives
+        owner = game.get_unit(self.obj.owner_nid) if self.obj.owner_nid else None
+        if owner:
+            owner.clear_stat_cache()
+
     def do(self):
         if self.keyword in self.obj.data:
             self.old_value = self.obj.data[self.keyword]
             self.obj.data[self.keyword] = self.value
+            self._clear_owner_stats()
 
     def reverse(self):
         if self.keyword in self.obj.data:
             self.obj.data[self.keyword] = self.old_value
+            self._clear_owner_stats()
 
 
 class GainMoney(Action):
@@ -1019,9 +1038,11 @@ class IncLevel(Action):
 
     def do(self):
         self.unit.level += 1
+        self.unit.clear_stat_cache()
 
     def reverse(self):
         self.unit.level -= 1
+        self.unit.clear_stat_cache()
 
 
 class SetLevel(Action):
@@ -1032,9 +1053,11 @@ class SetLevel(Action):
 
     def do(self):
         self.unit.level = self.new_level
+        self.unit.clear_stat_cache()
 
     def reverse(self):
         self.unit.level = self.old_level
+        self.unit.clear_stat_cache()
 
 
 class AutoLevel(Action):
@@ -1650,6 +1673,7 @@ class AddRegion(Action):
             pass
         else:
             game.level.regions.append(self.region)
+            game.board.add_region(self.region)
             self.did_add = True
             # Remember to add the status from the unit
             if self.region.region_type == 'status':
@@ -1665,6 +1689,7 @@ class AddRegion(Action):
             for act in self.subactions:
                 act.reverse()
             game.level.regions.delete(self.region)
+            game.board.remove_region(self.region)
 
 
 class ChangeRegionCondition(Action):
@@ -1699,11 +1724,13 @@ class RemoveRegion(Action):
                 act.do()
 
             game.level.regions.delete(self.region)
+            game.board.remove_region(self.region)
             self.did_remove = True
 
     def reverse(self):
         if self.did_remove:
             game.level.regions.append(self.region)
+            game.board.add_region(self.region)
 
             for act in self.subactions:
                 act.reverse()
@@ -4,7 +4,8 @@ from app.utilities import utils
 from app.data.database import DB
 
 from app.engine import engine, action, combat_calcs, pathfinding, target_system, \
-    equations, item_system, item_funcs, skill_system, line_of_sight, evaluate
+    equations, item_system, item_funcs, skill_system, line_of_sight, evaluate, \
+    ai_snapshot
 from app.engine.combat import interaction
 from app.engine.game_state import game
 
@@ -115,12 +116,14 @@ class AIController():
         elif self.goal_position and self.behaviour and self.behaviour.action == 'Interact':
             # Get region
             region = None
-            for r in game.level.regions:
-                if r.contains(self.goal_position) and r.region_type == 'event' and r.sub_nid == self.behaviour.target_spec:
+            for r in game.board.get_regions(self.goal_position):
+                if r.region_type == 'event' and r.sub_nid == self.behaviour.target_spec:
                     try:
-                        if not r.condition or evaluate.evaluate(r.condition, self.unit, position=self.goal_position):
+                        if not r.condition or evaluate.evaluate(r.condition, self.unit, position=self.goal_position, owner=r.nid):
                             region = r
                             break
+                    except SyntaxError:  # Already reported
+                        pass
                     except:
                         logging.warning("Could not evaluate region conditional %s" % r.condition)
             if region:
@@ -134,7 +137,7 @@ class AIController():
 
     def canto_retreat(self):
         valid_positions = self.get_true_valid_moves()
-        enemy_positions = {u.position for u in game.units if u.position and skill_system.check_enemy(self.unit, u)}
+        enemy_positions = {u.position for u in game.unit_index.query(on_map=True) if skill_system.check_enemy(self.unit, u)}
         self.goal_position = utils.farthest_away_pos(self.unit.position, valid_positions, enemy_positions)
 
     def smart_retreat(self) -> bool:
@@ -167,7 +170,7 @@ class AIController():
 
     def get_true_valid_moves(self) -> set:
         valid_moves = target_system.get_valid_moves(self.unit)
-        other_unit_positions = {unit.position for unit in game.units if unit.position and unit is not self.unit}
+        other_unit_positions = {unit.position for unit in game.unit_index.query(on_map=True) if unit is not self.unit}
         valid_moves -= other_unit_positions
         return valid_moves
 
@@ -228,9 +231,6 @@ class AIController():
                     else:
                         self.inner_ai = self.build_secondary()
                         self.state = "Secondary"  # Try secondary
-                elif over_time:
-                    # Make sure to quick move back so that the in-between frames aren't flickering around
-                    self.inner_ai.quick_move(self.inner_ai.orig_pos)
 
             elif self.state == 'Secondary':
                 done, self.goal_position = self.inner_ai.run()
@@ -323,6 +323,8 @@ class PrimaryAI():
         if self.item_index < len(self.items):
             logging.info("Testing %s" % self.items[self.item_index])
             self.unit.equip(self.items[self.item_index])
+            # Equipping can change the unit's skills
+            self.snapshot = ai_snapshot.EvaluationSnapshot(self.unit)
             self.get_all_valid_targets()
             self.possible_moves = self.get_possible_moves()
             logging.info(self.possible_moves)
@@ -365,14 +367,8 @@ class PrimaryAI():
         else:
             return []
 
-    def quick_move(self, move):
-        game.leave(self.unit, test=True)
-        self.unit.position = move
-        game.arrive(self.unit, test=True)
-
     def run(self):
         if self.item_index >= len(self.items):
-            self.quick_move(self.orig_pos)
             if self.orig_item:
                 self.unit.equip(self.orig_item)
             return (True, self.best_target, self.best_position, self.best_item)
@@ -393,24 +389,26 @@ class PrimaryAI():
             # If too many legal targets, just try for the best move first
             # Otherwise it spends way too long trying every possible position to strike from
             if len(self.valid_targets) > 10:
-                enemy_positions = {u.position for u in game.units if u.position and skill_system.check_enemy(self.unit, u)}
+                enemy_positions = {u.position for u in game.unit_index.query(on_map=True) if skill_system.check_enemy(self.unit, u)}
                 move = utils.farthest_away_pos(self.orig_pos, self.possible_moves, enemy_positions)
+                # No enemies on the map to run from
+                if not move:
+                    move = self.possible_moves[self.move_index]
             else:
                 move = self.possible_moves[self.move_index]
 
-            if self.unit.position != move:
-                self.quick_move(move)
-
-            # Check line of sight
-            line_of_sight_flag = True
-            if DB.constants.value('line_of_sight'):
-                max_item_range = max(item_funcs.get_range(self.unit, item))
-                valid_targets = line_of_sight.line_of_sight([move], [target], max_item_range)
-                if not valid_targets:
-                    line_of_sight_flag = False
-
-            if line_of_sight_flag:
-                self.determine_utility(move, target, item)
+            # Score the move as if we were standing there
+            with self.snapshot.at(move):
+                # Check line of sight
+                line_of_sight_flag = True
+                if DB.constants.value('line_of_sight'):
+                    max_item_range = max(item_funcs.get_range(self.unit, item))
+                    valid_targets = line_of_sight.line_of_sight([move], [target], max_item_range)
+                    if not valid_targets:
+                        line_of_sight_flag = False
+
+                if line_of_sight_flag:
+                    self.determine_utility(move, target, item)
             self.move_index += 1
             # If too many legal targets, do not bother with every possible move
             if len(self.valid_targets) > 10:
@@ -580,18 +578,20 @@ def handle_unit_spec(all_targets, behaviour):
 def get_targets(unit, behaviour):
     all_targets = []
     if behaviour.target == 'Unit':
-        all_targets = [u.position for u in game.units if u.position]
+        all_targets = [u.position for u in game.unit_index.query(on_map=True)]
     elif behaviour.target == 'Enemy':
-        all_targets = [u.position for u in game.units if u.position and skill_system.check_enemy(unit, u)]
+        all_targets = [u.position for u in game.unit_index.query(on_map=True) if skill_system.check_enemy(unit, u)]
     elif behaviour.target == 'Ally':
-        all_targets = [u.position for u in game.units if u.position and skill_system.check_ally(unit, u)]
+        all_targets = [u.position for u in game.unit_index.query(on_map=True) if skill_system.check_ally(unit, u)]
     elif behaviour.target == 'Event':
         target_spec = behaviour.target_spec
         all_targets = []
         for region in game.level.regions:
             try:
-                if region.region_type == 'event' and region.sub_nid == target_spec and (not region.condition or evaluate.evaluate(region.condition, unit)):
+                if region.region_type == 'event' and region.sub_nid == target_spec and (not region.condition or evaluate.evaluate(region.condition, unit, owner=region.nid)):
                     all_targets += region.get_all_positions()
+            except SyntaxError:  # Already reported
+                pass
             except:
                 logging.warning("Region Condition: Could not parse %s" % region.condition)
         all_targets = list(set(all_targets))  # Remove duplicates
@@ -631,7 +631,7 @@ class SecondaryAI():
         movement_group = game.movement.get_movement_group(self.unit)
         self.grid = game.board.get_grid(movement_group)
         self.pathfinder = \
-            pathfinding.AStar(self.unit.position, None, self.grid, 
+            pathfinding.ArrayAStar(self.unit.position, None, game.board.get_cost_grid(movement_group), 
                               game.tilemap.width, game.tilemap.height, 
                               self.unit.team, skill_system.pass_through(self.unit),
                               DB.constants.value('ai_fog_of_war'))
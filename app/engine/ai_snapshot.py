@@ -0,0 +1,135 @@
+from contextlib import contextmanager
+
+from app.data.database import DB
+
+from app.engine import skill_system, item_funcs, aura_funcs
+from app.engine.hook_index import SkillList
+from app.engine.game_state import game
+
+class EvaluationSnapshot():
+    """
+    A frozen record of the parts of the board that decide what a unit
+    is like while standing on a tile: where it started, the terrain
+    and region statuses, and which auras cover which tiles.
+
+    The AI uses it to score hypothetical positions. Instead of moving
+    the unit through game.leave and game.arrive with test=True, which
+    changes the unit's skill list, the unit is presented at the position
+    with the skills it would have there only for the length of a
+    `with snapshot.at(position):` block. The board, the auras and the
+    skill registries are never touched.
+    """
+    def __init__(self, unit):
+        self.unit = unit
+        self.orig_pos = unit.position
+        # Key: position, Value: tuple of (child skill, owner, target)
+        self.aura_coverage = {}
+        # Statuses that the unit would gain that have not been created yet
+        # Key: terrain key or region nid, Value: skill object
+        self.unregistered_statuses = {}
+
+        self.base_skills = tuple(self._get_base_skills())
+        # Key: position, Value: skills the unit would have there
+        self.skills = {self.orig_pos: SkillList(unit.skills)}
+
+    def _get_terrain_key(self, position) -> tuple:
+        layer = game.tilemap.get_layer(position)
+        return (*position, layer)
+
+    def _get_base_skills(self) -> list:
+        """
+        The unit's skills with everything its current position gives it removed
+        """
+        skills = list(self.unit.skills)
+        position = self.orig_pos
+        for child_aura_uid, target in self.get_auras(position):
+            child_skill = game.get_skill(child_aura_uid)
+            if child_skill in skills:
+                skills.remove(child_skill)
+        for region in game.board.get_regions(position):
+            if region.region_type == 'status':
+                skill_obj = game.get_skill(game.get_terrain_status(region.nid))
+                if skill_obj and skill_obj in skills:
+                    skills.remove(skill_obj)
+        skill_obj = game.get_skill(game.get_terrain_status(self._get_terrain_key(position)))
+        if skill_obj and skill_obj in skills:
+            skills.remove(skill_obj)
+        return skills
+
+    def get_auras(self, position) -> tuple:
+        if position not in self.aura_coverage:
+            self.aura_coverage[position] = tuple(game.board.get_auras(position))
+        return self.aura_coverage[position]
+
+    def _get_terrain_status(self, position):
+        terrain_key = self._get_terrain_key(position)
+        skill_obj = game.get_skill(game.get_terrain_status(terrain_key))
+        if not skill_obj:
+            if terrain_key not in self.unregistered_statuses:
+                terrain = DB.terrain.get(game.tilemap.get_terrain(position))
+                if terrain and terrain.status:
+                    self.unregistered_statuses[terrain_key] = item_funcs.create_skill(self.unit, terrain.status)
+                else:
+                    self.unregistered_statuses[terrain_key] = None
+            skill_obj = self.unregistered_statuses[terrain_key]
+        return skill_obj
+
+    def _get_region_status(self, region):
+        skill_obj = game.get_skill(game.get_terrain_status(region.nid))
+        if not skill_obj:
+            if region.nid not in self.unregistered_statuses:
+                self.unregistered_statuses[region.nid] = item_funcs.create_skill(self.unit, region.sub_nid)
+            skill_obj = self.unregistered_statuses[region.nid]
+        return skill_obj
+
+    def _compute_skills(self, position) -> tuple:
+        """
+        Mirrors what game.arrive does to the unit's skills
+        """
+        unit = self.unit
+        skills = SkillList(self.base_skills)
+        with self._present(position, skills):
+            # Tiles
+            if not skill_system.ignore_terrain(unit):
+                skill_obj = self._get_terrain_status(position)
+                if skill_obj and skill_obj not in skills:
+                    skills.append(skill_obj)
+            # Regions
+            if not skill_system.ignore_region_status(unit):
+                for region in game.board.get_regions(position):
+                    if region.region_type == 'status':
+                        skill_obj = self._get_region_status(region)
+                        if skill_obj and skill_obj not in skills:
+                            skills.append(skill_obj)
+            # Auras
+            for child_aura_uid, target in self.get_auras(position):
+                child_skill = game.get_skill(child_aura_uid)
+                owner = game.get_unit(child_skill.parent_skill.owner_nid)
+                if owner is not unit and aura_funcs.aura_applies(owner, unit, target):
+                    if child_skill.stack or child_skill.nid not in [skill.nid for skill in skills]:
+                        skills.append(child_skill)
+        return skills
+
+    def get_skills(self, position) -> list:
+        if position not in self.skills:
+            self.skills[position] = self._compute_skills(position)
+        return self.skills[position]
+
+    @contextmanager
+    def _present(self, position, skills: SkillList):
+        unit = self.unit
+        old_position, old_skills = unit.position, unit.skills
+        unit.position, unit.skills = position, skills
+        try:
+            yield unit
+        finally:
+            unit.position, unit.skills = old_position, old_skills
+
+    def at(self, position):
+        """
+        Context manager that presents the unit as if it were standing at
+        position. The unit's own skill list is swapped out, never changed.
+        The presented list is shared between calls so its hook index is
+        only built once per position, so it must not be changed either.
+        """
+        return self._present(position, self.get_skills(position))
@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 from app.data.database import DB
 
 from app.engine import action, skill_system, target_system, line_of_sight
@@ -5,12 +7,23 @@ from app.engine import action, skill_system, target_system, line_of_sight
 import logging
 
 def pull_auras(unit, game, test=False):
+    # Auras the unit kept when it left its last position during a move
+    held = () if test else game.board.held_auras.pop(unit.nid, (unit, ()))[1]
+    auras = []
     for aura_data in game.board.get_auras(unit.position):
         child_aura_uid, target = aura_data
         child_skill = game.get_skill(child_aura_uid)
         owner_nid = child_skill.parent_skill.owner_nid
         owner = game.get_unit(owner_nid)
         if owner is not unit:
+            auras.append((owner, child_skill, target))
+    kept = {child_skill for owner, child_skill, target in auras
+            if child_skill in held and child_skill in unit.skills and aura_applies(owner, unit, target)}
+    for child_skill in held:
+        if child_skill not in kept:
+            remove_aura(unit, child_skill)
+    for owner, child_skill, target in auras:
+        if child_skill not in kept:
             apply_aura(owner, unit, child_skill, target, test)
 
 def repull_aura(unit, old_skill, game):
@@ -23,14 +36,19 @@ def repull_aura(unit, old_skill, game):
             if owner is not unit:
                 apply_aura(owner, unit, child_skill, target)
 
-def apply_aura(owner, unit, child_skill, target, test=False):
+def aura_applies(owner, unit, target) -> bool:
     if target == 'enemy' and skill_system.check_enemy(owner, unit) or \
             target == 'ally' and skill_system.check_ally(owner, unit) or \
             target == 'unit':
         # Confirm that we have line of sight
         if DB.constants.value('aura_los') and \
                 not line_of_sight.line_of_sight({owner.position}, {unit.position}, 99):
-            return
+            return False
+        return True
+    return False
+
+def apply_aura(owner, unit, child_skill, target, test=False):
+    if aura_applies(owner, unit, target):
         logging.debug("Applying Aura %s to %s", child_skill, unit)
         if test:
             # Doesn't need to use action system
@@ -51,14 +69,26 @@ def remove_aura(unit, child_skill, test=False):
 
 def propagate_aura(unit, skill, game):
     game.board.reset_aura(skill.subskill)
+    # Units that kept this aura when its owner left its last position during a move
+    held = game.board.released_auras.pop(skill.subskill.uid, ())
     aura_range = skill.aura_range.value
     aura_range = set(range(1, aura_range + 1))
     positions = target_system.get_shell({unit.position}, aura_range, game.tilemap.width, game.tilemap.height)
+    others = []
     for pos in positions:
         game.board.add_aura(pos, unit, skill.subskill, skill.aura_target.value)
-        # Propagate my aura to others
         other = game.board.get_unit(pos)
         if other:
+            others.append(other)
+    kept = {other for other in held if other in others and skill.subskill in other.skills and
+            aura_applies(unit, other, skill.aura_target.value)}
+    for other in held:
+        if other not in kept and skill.subskill in other.skills:
+            remove_aura(other, skill.subskill)
+            repull_aura(other, skill.subskill, game)
+    # Propagate my aura to others
+    for other in others:
+        if other not in kept:
             apply_aura(unit, other, skill.subskill, skill.aura_target.value)
 
 def release_aura(unit, skill, game):
@@ -70,3 +100,48 @@ def release_aura(unit, skill, game):
             remove_aura(other, skill.subskill)
             repull_aura(other, skill.subskill, game)
     game.board.reset_aura(skill.subskill)
+
+def lift_auras(unit, game):
+    """
+    Called by leave during a move in place of removing the unit's
+    auras and releasing its own. The unit and the units its own
+    auras cover keep them until it arrives again
+    """
+    game.board.held_auras[unit.nid] = \
+        (unit, [game.get_skill(child_aura_uid) for child_aura_uid, target in game.board.get_auras(unit.position)])
+    for skill in unit.skills:
+        if skill.aura:
+            positions = list(game.board.get_aura_positions(skill.subskill))
+            others = [game.board.get_unit(pos) for pos in positions]
+            game.board.released_auras[skill.subskill.uid] = \
+                [other for other in others if other and skill.subskill in other.skills]
+            for pos in positions:
+                game.board.remove_aura(pos, skill.subskill)
+            game.board.reset_aura(skill.subskill)
+
+@contextmanager
+def moving(game):
+    """
+    Wrap a leave and an arrive that happen right after each other.
+    When the unit arrives, only the auras that it or its own auras'
+    targets actually gained or lost are added or removed, instead of
+    removing every aura and adding it back. Anything that left and
+    did not arrive again is released as normal at the end
+    """
+    board = game.board
+    board.aura_move_depth += 1
+    try:
+        yield
+    finally:
+        board.aura_move_depth -= 1
+        if not board.aura_move_depth:
+            for unit, held in board.held_auras.values():
+                for child_skill in held:
+                    remove_aura(unit, child_skill)
+            for child_aura_uid, held in board.released_auras.items():
+                child_skill = game.get_skill(child_aura_uid)
+                for other in held:
+                    remove_aura(other, child_skill)
+                    repull_aura(other, child_skill, game)
+            board.held_auras.clear()
+            board.released_auras.clear()
@@ -43,7 +43,7 @@ class Banner():
     def draw(self, surf):
         if not self.surf:
             w, h = self.size
-            bg_surf = base_surf.create_base_surf(w, h, 'menu_bg_base')
+            bg_surf = base_surf.get_base_surf(w, h, 'menu_bg_base')
             self.surf = engine.create_surface((w + 2, h + 4), transparent=True)
             self.surf.blit(bg_surf, (2, 4))
             self.surf.blit(SPRITES.get('menu_gem_small'), (0, 0))
@@ -1,8 +1,35 @@
+from collections import OrderedDict
+
 from app.engine.sprites import SPRITES
 from app.engine import engine
 
+# How many different backgrounds to keep around
+MAX_CACHED_SURFS = 64
+# Key: (width, height, base, sprite), Value: background surface
+cache = OrderedDict()
+
 def create_base_surf(width, height, base='menu_bg_base'):
+    """
+    Returns a new background surface that can be drawn on
+    """
+    return engine.copy_surface(get_base_surf(width, height, base))
+
+def get_base_surf(width, height, base='menu_bg_base'):
+    """
+    Returns a shared background surface. Only blit it, never draw on it
+    """
     sprite = SPRITES.get(base)
+    key = (width, height, base, sprite)
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+    surf = build_base_surf(width, height, sprite)
+    cache[key] = surf
+    if len(cache) > MAX_CACHED_SURFS:
+        cache.popitem(last=False)
+    return surf
+
+def build_base_surf(width, height, sprite):
     
     base_width = sprite.get_width()
     base_height = sprite.get_height()
@@ -1,5 +1,40 @@
+from collections import OrderedDict
+import logging
+
 from app.engine import engine
 
+# How many rendered strings to keep around, across all fonts
+MAX_CACHED_STRINGS = 512
+
+class TextCache():
+    """
+    Rendered strings, keyed by font and string.
+    Each text color is its own font, so the font covers the color too
+    """
+    def __init__(self, max_size=MAX_CACHED_STRINGS):
+        self.max_size = max_size
+        self.images = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, font, string):
+        key = (font, string)
+        if key in self.images:
+            self.hits += 1
+            self.images.move_to_end(key)
+            return self.images[key]
+        self.misses += 1
+        image = font.render(string)
+        self.images[key] = image
+        if len(self.images) > self.max_size:
+            self.images.popitem(last=False)
+        return image
+
+    def clear(self):
+        self.images.clear()
+
+TEXT_CACHE = TextCache()
+
 class BmpFont():
     def __init__(self, png_path, idx_path):
         self.all_uppercase = False
@@ -12,6 +47,7 @@ class BmpFont():
         self._width = 8
         self.height = 16
         self.memory = {}
+        self.missing = set()  # Characters not in the chartable, already reported
 
         with open(self.idx_path, 'r', encoding='utf-8') as fp:
             for x in fp.readlines():
@@ -50,65 +86,56 @@ class BmpFont():
         # string = string.replace('_', ' ')
         return string
 
-    def blit(self, string, surf, pos=(0, 0)):
-        def normal_render(left, top, string):
-            for c in string:
-                if c not in self.memory:
-                    try:
-                        char_pos_x = self.chartable[c][0]
-                        char_pos_y = self.chartable[c][1]
-                        char_width = self.chartable[c][2]
-                    except KeyError as e:
-                        char_pos_x = 0
-                        char_pos_y = 0
-                        char_width = 8
-                        print(e)
-                        print("%s is not chartable" % c)
-                        print("string: ", string)
-                    subsurf = engine.subsurface(self.surface, (char_pos_x, char_pos_y, self._width, self.height))
-                    self.memory[c] = (subsurf, char_width)
-                else:
-                    subsurf, char_width = self.memory[c]
-                engine.blit(surf, subsurf, (left, top))
-                left += char_width + self.space_offset
-
-        def stacked_render(left, top, string):
-            orig_left = left
-            for c in string:
-                if c not in self.memory:
-                    try:
-                        char_pos_x = self.chartable[c][0]
-                        char_pos_y = self.chartable[c][1]
-                        char_width = self.chartable[c][2]
-                    except KeyError as e:
-                        char_pos_x = 0
-                        char_pos_y = 0
-                        char_width = 8
-                        print(e)
-                        print("%s is not chartable" % c)
-                        print("string: ", string)
-
-                    highsurf = engine.subsurface(self.surface, (char_pos_x, char_pos_y, self._width, self.height))
-                    lowsurf = engine.subsurface(self.surface, (char_pos_x, char_pos_y + self.height, self._width, self.height))
-                    self.memory[c] = (highsurf, lowsurf, char_width)
-            for c in string:
-                highsurf, lowsurf, char_width = self.memory[c]
-                engine.blit(surf, lowsurf, (left, top))
-                left += char_width + self.space_offset
-            for c in string:
-                highsurf, lowsurf, char_width = self.memory[c]
-                engine.blit(surf, highsurf, (orig_left, top))
-                orig_left += char_width + self.space_offset
-
-        x, y = pos
-        surfwidth, surfheight = surf.get_size()
+    def get_char(self, c):
+        """
+        Returns the position and width of a character in the font image
+        """
+        if c in self.chartable:
+            return self.chartable[c]
+        if c not in self.missing:
+            self.missing.add(c)
+            logging.warning("%s is not chartable in %s", c, self.png_path)
+        return (0, 0, 8)
 
-        string = self.modify_string(string)
+    def get_glyph(self, c):
+        if c not in self.memory:
+            char_pos_x, char_pos_y, char_width = self.get_char(c)
+            highsurf = engine.subsurface(self.surface, (char_pos_x, char_pos_y, self._width, self.height))
+            if self.stacked:
+                lowsurf = engine.subsurface(self.surface, (char_pos_x, char_pos_y + self.height, self._width, self.height))
+                self.memory[c] = (highsurf, lowsurf, char_width)
+            else:
+                self.memory[c] = (highsurf, char_width)
+        return self.memory[c]
+
+    def render(self, string):
+        """
+        Draws the whole (already modified) string onto a new transparent surface
+        """
+        lefts = []
+        left = 0
+        for c in string:
+            lefts.append(left)
+            left += self.get_glyph(c)[-1] + self.space_offset
+        width = max(lefts) + self._width if lefts else 0
+        image = engine.create_surface((width, self.height), transparent=True)
 
         if self.stacked:
-            stacked_render(x, y, string)
+            for c, left in zip(string, lefts):
+                highsurf, lowsurf, char_width = self.get_glyph(c)
+                engine.blit(image, lowsurf, (left, 0))
+            for c, left in zip(string, lefts):
+                highsurf, lowsurf, char_width = self.get_glyph(c)
+                engine.blit(image, highsurf, (left, 0))
         else:
-            normal_render(x, y, string)
+            for c, left in zip(string, lefts):
+                subsurf, char_width = self.get_glyph(c)
+                engine.blit(image, subsurf, (left, 0))
+        return image
+
+    def blit(self, string, surf, pos=(0, 0)):
+        string = self.modify_string(string)
+        engine.blit(surf, TEXT_CACHE.get(self, string), pos)
 
     def blit_right(self, string, surf, pos):
         width = self.width(string)
@@ -132,12 +159,5 @@ class BmpFont():
         string = self.modify_string(string)
 
         for c in string:
-            try:
-                char_width = self.chartable[c][2]
-            except KeyError as e:
-                print(e)
-                print("%s is not chartable" % c)
-                print("string: ", string)
-                char_width = 8
-            length += char_width
+            length += self.get_char(c)[2]
         return length
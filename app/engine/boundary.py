@@ -33,12 +33,22 @@ class BoundaryInterface():
         self.dictionaries = {'attack': {},
                              'spell': {},
                              'movement': {}}
+        # Key: Unit NID, Value: set of positions the unit could move to
+        # when its attack and spell sets were last computed
+        self.reachable = {}
 
         self.draw_flag = False
         self.all_on_flag = False
 
         self.displaying_units = set()
 
+        # While deferred, changes are only written down, and
+        # the grids are brought up to date once in undefer()
+        self.deferred = False
+        self.pending_units = set()
+        self.pending_moves = []  # (position, team, nid) of each leave and arrive
+        self.pending_reset = False
+
         self.surf = None
         self.fog_of_war_surf = None
 
@@ -74,25 +84,34 @@ class BoundaryInterface():
         self.fog_of_war_surf = None
 
     def _set(self, positions, mode, nid):
+        # Only touch the tiles whose membership actually changed
         grid = self.grids[mode]
-        self.dictionaries[mode][nid] = set()
-        for pos in positions:
-            grid[pos[0] * self.height + pos[1]].add(nid)
-            self.dictionaries[mode][nid].add(pos)
+        old_positions = self.dictionaries[mode].get(nid, set())
+        for (x, y) in old_positions - positions:
+            grid[x * self.height + y].discard(nid)
+        for (x, y) in positions - old_positions:
+            grid[x * self.height + y].add(nid)
+        self.dictionaries[mode][nid] = positions
 
     def clear(self, mode=None):
         if mode:
             modes = [mode]
         else:
             modes = list(self.grids.keys())
+            self.reachable.clear()
         for m in modes:
             for x in range(self.width):
                 for y in range(self.height):
                     self.grids[m][x * self.height + y].clear()
+            self.dictionaries[m].clear()
         self.surf = None
         self.fog_of_war_surf = None
 
     def _add_unit(self, unit):
+        """
+        Computes the unit's attack, spell and movement areas and
+        updates the grids with the difference from what it had before
+        """
         valid_moves = target_system.get_valid_moves(unit, force=True)
 
         if DB.constants.value('zero_move') and unit.ai and not unit.ai_group_active:
@@ -100,14 +119,14 @@ class BoundaryInterface():
             guard = ai_prefab.guard_ai()
             if guard:
                 valid_moves = {unit.position}
+        self.reachable[unit.nid] = valid_moves
 
         valid_attacks = target_system.get_possible_attacks(unit, valid_moves)
         valid_spells = target_system.get_possible_spell_attacks(unit, valid_moves)
         self._set(valid_attacks, 'attack', unit.nid)
         self._set(valid_spells, 'spell', unit.nid)
 
-        area_of_influence = target_system.find_manhattan_spheres(set(range(1, equations.parser.movement(unit) + 1)), *unit.position)
-        area_of_influence = {pos for pos in area_of_influence if self.check_bounds(pos)}
+        area_of_influence = target_system.get_shell({unit.position}, range(1, equations.parser.movement(unit) + 1), self.width, self.height)
         self._set(area_of_influence, 'movement', unit.nid)
 
         self.surf = None
@@ -117,55 +136,123 @@ class BoundaryInterface():
             if unit.nid in self.dictionaries[mode]:
                 for (x, y) in self.dictionaries[mode][unit.nid]:
                     grid[x * self.height + y].discard(unit.nid)
-                # del self.dictionaries[mode][unit.nid]
+                del self.dictionaries[mode][unit.nid]
+        self.reachable.pop(unit.nid, None)
         self.surf = None
 
+    def _get_affected_units(self, unit) -> set:
+        """
+        Returns the other units whose movement could have changed
+        because this unit left or arrived at its position
+        """
+        return self._get_units_near(unit.position, unit.team, unit.nid)
+
+    def _get_units_near(self, pos, team, nid) -> set:
+        x, y = pos
+        if DB.constants.value('ai_fog_of_war'):
+            # Vision changes can change movement anywhere, so fall back
+            # to every unit whose area of influence holds this tile
+            nids = self.grids['movement'][x * self.height + y]
+        else:
+            # A unit's movement can only change if this tile was one it
+            # could reach or one that borders a tile it could reach
+            neighborhood = {(x, y), (x, y - 1), (x - 1, y), (x + 1, y), (x, y + 1)}
+            nids = [other_nid for other_nid, valid_moves in self.reachable.items() if not neighborhood.isdisjoint(valid_moves)]
+        other_units = {game.get_unit(other_nid) for other_nid in nids if other_nid != nid}
+        return {other_unit for other_unit in other_units if not utils.compare_teams(team, other_unit.team)}
+
     def recalculate_unit(self, unit):
+        if self.deferred:
+            self.pending_units.add(unit)
+            return
         if unit.team in self.enemy_teams:
             self._remove_unit(unit)
             if unit.position:
                 self._add_unit(unit)
 
     def leave(self, unit):
+        """
+        Should be called after the unit has been removed from the game board
+        """
+        if self.deferred:
+            self.pending_units.add(unit)
+            if unit.position:
+                self.pending_moves.append((unit.position, unit.team, unit.nid))
+            return
+
         if unit.team in self.enemy_teams:
             self._remove_unit(unit)
 
         # Update ranges of other units that might be affected by my leaving
         if unit.position:
-            x, y = unit.position
-            other_units = {game.get_unit(nid) for nid in self.grids['movement'][x * self.height + y]}
-            other_units = {other_unit for other_unit in other_units if not utils.compare_teams(unit.team, other_unit.team)}
-
-            for other_unit in other_units:
-                self._remove_unit(other_unit)
-            for other_unit in other_units:
+            for other_unit in self._get_affected_units(unit):
                 if other_unit.position:
                     self._add_unit(other_unit)
 
     def arrive(self, unit):
+        """
+        Should be called after the unit has been placed on the game board
+        """
+        if self.deferred:
+            self.pending_units.add(unit)
+            if unit.position:
+                self.pending_moves.append((unit.position, unit.team, unit.nid))
+            return
+
         if unit.position:
             if unit.team in self.enemy_teams:
                 self._add_unit(unit)
 
             # Update ranges of other units that might be affected by my arrival
-            x, y = unit.position
-            # print(self.grids['movement'][x * self.height + y])
-            other_units = {game.get_unit(nid) for nid in self.grids['movement'][x * self.height + y]}
-            other_units = {other_unit for other_unit in other_units if not utils.compare_teams(unit.team, other_unit.team)}
-
-            for other_unit in other_units:
-                self._remove_unit(other_unit)
-            for other_unit in other_units:
+            for other_unit in self._get_affected_units(unit):
                 if other_unit.position:
                     self._add_unit(other_unit)
 
     # Called when map changes
     def reset(self):
+        if self.deferred:
+            self.pending_reset = True
+            return
         self.clear()
         for unit in game.units:
             if unit.position and unit.team in self.enemy_teams:
                 self._add_unit(unit)
 
+    def defer(self):
+        """
+        Stops updating the grids on every leave and arrive, for when
+        many actions are run at once. Call undefer() when done
+        """
+        self.deferred = True
+
+    def undefer(self):
+        """
+        Brings the grids up to date with every change since defer(),
+        working out each unit's ranges at most once
+        """
+        self.deferred = False
+        pending_units, self.pending_units = self.pending_units, set()
+        pending_moves, self.pending_moves = self.pending_moves, []
+        pending_reset, self.pending_reset = self.pending_reset, False
+        if pending_reset:
+            self.reset()
+            return
+        # Units that were not touched still have the movement they had
+        # before, so they are only affected if one of the changed tiles
+        # is near it, the same as for a single leave or arrive
+        affected_units = set()
+        for pos, team, nid in pending_moves:
+            affected_units |= self._get_units_near(pos, team, nid)
+        # A pending unit may have changed team since it was queued,
+        # so clear it out whatever its team is now
+        for unit in pending_units:
+            self._remove_unit(unit)
+            if unit.position and unit.team in self.enemy_teams:
+                self._add_unit(unit)
+        for unit in affected_units - pending_units:
+            if unit.position:
+                self._add_unit(unit)
+
     def toggle_all_enemy_attacks(self):
         if self.all_on_flag:
             self.clear_all_enemy_attacks()
@@ -9,6 +9,7 @@ def read_config_file():
                          ('random_seed', -1),
                          ('screen_size', 2),
                          ('sound_buffer_size', 4),
+                         ('music_budget', 128),  # Megabytes of decoded music to keep
                          ('animation', 'Always'),
                          ('unit_speed', 120),
                          ('text_speed', 10),
@@ -136,7 +136,7 @@ class Cursor():
             self.offset_y = min(self.offset_y, 12)
 
     def autocursor(self, immediate=False):
-        player_units = [unit for unit in game.units if unit.team == 'player' and unit.position]
+        player_units = game.unit_index.query(team='player', on_map=True)
         lord_units = [unit for unit in player_units if 'Lord' in unit.tags]
         if lord_units:
             self.set_pos(lord_units[0].position)
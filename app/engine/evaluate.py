@@ -1,4 +1,4 @@
-import random, re
+import random, re, functools, logging
 
 from app.utilities import utils
 from app.data.database import DB
@@ -12,7 +12,42 @@ Essentially just a repository that imports a lot of different things so that man
 will be accepted
 """
 
-def evaluate(string: str, unit1=None, unit2=None, item=None, position=None, region=None, mode=None, skill=None) -> bool:
+MAX_COMPILED = 1024
+
+@functools.lru_cache(maxsize=MAX_COMPILED)
+def _compile(string: str) -> tuple:
+    """
+    Returns the code object for string, or the SyntaxError
+    that compiling it raised, so bad strings are only compiled once
+    """
+    try:
+        # eval strips leading and trailing spaces and tabs, compile does not
+        return compile(string.strip(' \t'), '<evaluate>', 'eval'), None
+    except SyntaxError as e:
+        return None, e
+
+# (String, owner) pairs whose syntax errors have already been reported
+_reported = set()
+
+def get_code(string: str, owner=None):
+    """
+    Returns the compiled code object for string.
+    Raises SyntaxError if string is not a valid expression. The error is
+    only logged the first time for each owner of the string
+    (ie, the event or component it came from)
+    """
+    code, error = _compile(string)
+    if error:
+        if (string, owner) not in _reported:
+            if len(_reported) >= MAX_COMPILED:
+                _reported.clear()
+            _reported.add((string, owner))
+            logging.error("Could not compile {%s} from %s: %s", string, owner, error)
+        raise SyntaxError(*error.args)
+    return code
+
+def evaluate(string: str, unit1=None, unit2=None, item=None, position=None, region=None, mode=None, skill=None, owner=None) -> bool:
+    code = get_code(string, owner)
     unit = unit1
     target = unit2
     
@@ -38,7 +73,7 @@ def evaluate(string: str, unit1=None, unit2=None, item=None, position=None, regi
         else:
             return False
 
-    return eval(string)
+    return eval(code)
 
 def eval_string(text: str) -> str:
     to_evaluate = re.findall(r'\{eval:[^{}]*\}', text)
@@ -40,7 +40,15 @@ class GameBoard(object):
     def __init__(self, tilemap):
         self.width = tilemap.width
         self.height = tilemap.height
+        # Incremented whenever anything that can change a unit's
+        # movement changes (units, terrain, mcost, vision)
+        self.version = 0
+        # Key: (unit nid, position, movement group, ...), Value: valid moves
+        self.reachability_cache = {}
+
         self.mcost_grids = {}
+        # Flat movement costs for each movement type, same order as the mcost grids
+        self.cost_grids = {}
 
         self.reset_grid(tilemap)
 
@@ -50,15 +58,28 @@ class GameBoard(object):
         self.unit_grid = self.init_unit_grid()
 
         # Fog of War -- one for each team
+        # Each tile counts how many units of that team can see it
         self.fog_of_war_grids = {}
         for team in DB.teams:
-            self.fog_of_war_grids[team] = self.init_aura_grid()
+            self.fog_of_war_grids[team] = [0] * (self.width * self.height)
+        # Key: (team, unit nid), Value: indices of the tiles that unit sees
+        self.fow_vision = {}
         self.fow_vantage_point = {}  # Unit: Position where the unit is that's looking
 
         # For Auras
         self.aura_grid = self.init_aura_grid()
         # Key: Aura Skill Uid, Value: Set of positions
         self.known_auras = {}
+        # Auras kept through a move in progress, see aura_funcs.moving
+        self.aura_move_depth = 0
+        # Key: Unit Nid, Value: (Unit, Aura skills it kept on leaving)
+        self.held_auras = {}
+        # Key: Aura Skill Uid, Value: Units that kept it when its owner left
+        self.released_auras = {}
+
+        # For regions -- each tile holds the regions covering it,
+        # in the order they were added to the level
+        self.region_grid = self.init_unit_grid()
 
         # For opacity
         self.opacity_grid = self.init_opacity_grid(tilemap)
@@ -66,11 +87,19 @@ class GameBoard(object):
     def check_bounds(self, pos):
         return 0 <= pos[0] < self.width and 0 <= pos[1] < self.height
 
+    def increment_version(self):
+        self.version += 1
+        self.reachability_cache.clear()
+
     def reset_grid(self, tilemap):
+        self.increment_version()
         # For each movement type
         for idx, mode in enumerate(DB.mcost.unit_types):
             self.mcost_grids[mode] = self.init_grid(mode, tilemap)
+            self.cost_grids[mode] = [cell.cost for cell in self.mcost_grids[mode]]
         self.opacity_grid = self.init_opacity_grid(tilemap)
+        # Key: (position, range), Value: tiles seen from there
+        self.visibility_cache = {}
 
     # For movement
     def init_grid(self, movement_group, tilemap):
@@ -92,6 +121,9 @@ class GameBoard(object):
     def get_grid(self, movement_group):
         return self.mcost_grids[movement_group]
 
+    def get_cost_grid(self, movement_group) -> list:
+        return self.cost_grids[movement_group]
+
     def init_unit_grid(self):
         cells = []
         for x in range(self.width):
@@ -103,12 +135,14 @@ class GameBoard(object):
         idx = pos[0] * self.height + pos[1]
         self.unit_grid[idx].append(unit)
         self.team_grid[idx].append(unit.team)
+        self.increment_version()
 
     def remove_unit(self, pos, unit):
         idx = pos[0] * self.height + pos[1]
         if unit in self.unit_grid[idx]:
             self.unit_grid[idx].remove(unit)
             self.team_grid[idx].remove(unit.team)
+            self.increment_version()
 
     def get_unit(self, pos):
         if not pos:
@@ -129,18 +163,19 @@ class GameBoard(object):
     # Fog of war
     def update_fow(self, pos, unit, sight_range: int):
         grid = self.fog_of_war_grids[unit.team]
+        self.increment_version()
         # Remove the old vision
         self.fow_vantage_point[unit.nid] = None
-        for cell in grid:
-            cell.discard(unit.nid)
+        for idx in self.fow_vision.pop((unit.team, unit.nid), ()):
+            grid[idx] -= 1
         # Add new vision
         if pos:
             self.fow_vantage_point[unit.nid] = pos
-            positions = target_system.find_manhattan_spheres(range(sight_range + 1), pos[0], pos[1])
-            positions = {pos for pos in positions if 0 <= pos[0] < self.width and 0 <= pos[1] < self.height}
-            for position in positions:
-                idx = position[0] * self.height + position[1]
-                grid[idx].add(unit.nid)
+            positions = target_system.get_shell({pos}, range(sight_range + 1), self.width, self.height)
+            vision = [position[0] * self.height + position[1] for position in positions]
+            for idx in vision:
+                grid[idx] += 1
+            self.fow_vision[(unit.team, unit.nid)] = vision
 
     def in_vision(self, pos, team='player') -> bool:
         if not game.level_vars.get('_fog_of_war'):
@@ -221,3 +256,26 @@ class GameBoard(object):
 
     def get_aura_positions(self, child_skill) -> set:
         return self.known_auras.get(child_skill.uid, set())
+
+    # Regions
+    def add_region(self, region):
+        for pos in region.get_all_positions():
+            if self.check_bounds(pos):
+                idx = pos[0] * self.height + pos[1]
+                self.region_grid[idx].append(region)
+
+    def remove_region(self, region):
+        for pos in region.get_all_positions():
+            if self.check_bounds(pos):
+                idx = pos[0] * self.height + pos[1]
+                if region in self.region_grid[idx]:
+                    self.region_grid[idx].remove(region)
+
+    def get_regions(self, pos) -> tuple:
+        """
+        Returns the regions that contain pos
+        """
+        if not pos or not self.check_bounds(pos):
+            return ()
+        idx = pos[0] * self.height + pos[1]
+        return tuple(self.region_grid[idx])
@@ -8,6 +8,7 @@ from app.data.database import DB
 
 from app.engine import state_machine, static_random
 from app.engine import config as cf
+from app.engine.unit_index import UnitIndex
 
 import logging
 logger = logging.getLogger(__name__)
@@ -31,6 +32,7 @@ class GameState():
 
         self.current_save_slot = None
         self.current_level = None
+        self.unit_index = UnitIndex()
 
     def load_states(self, starting_states):
         self.state.load_states(starting_states)
@@ -43,6 +45,7 @@ class GameState():
         self.playtime = 0
 
         self.unit_registry = {}
+        self.unit_index.rebuild(self.unit_registry)
         self.item_registry = {}
         self.skill_registry = {}
         self.terrain_status_registry = {}
@@ -178,6 +181,9 @@ class GameState():
         from app.engine import game_board, boundary
         self.board = game_board.GameBoard(tilemap)
         self.boundary = boundary.BoundaryInterface(tilemap.width, tilemap.height)
+        if self.current_level:
+            for region in self.current_level.regions:
+                self.board.add_region(region)
 
     def save(self):
         self.action_log.record = False
@@ -260,6 +266,7 @@ class GameState():
         self.terrain_status_registry = s_dict.get('terrain_status_registry', {})
         self.region_registry = {region['nid']: Region.restore(region) for region in s_dict.get('regions', [])}
         self.unit_registry = {unit['nid']: UnitObject.restore(unit) for unit in s_dict['units']}
+        self.unit_index.rebuild(self.unit_registry)
         # Handle subitems
         for item in self.item_registry.values():
             for subitem_uid in item.subitem_uids:
@@ -352,6 +359,7 @@ class GameState():
 
         # Remove all generics
         self.unit_registry = {k: v for (k, v) in self.unit_registry.items() if not v.generic}
+        self.unit_index.rebuild(self.unit_registry)
 
         # Remove any skill that's not on a unit and does not have a parent_skill
         for k, v in list(self.skill_registry.items()):
@@ -425,12 +433,13 @@ class GameState():
         return self.parties[self.current_party]
 
     @property
-    def units(self):
-        return list(self.unit_registry.values())
+    def units(self) -> tuple:
+        return self.unit_index.all_units()
 
     def register_unit(self, unit):
         logger.debug("Registering unit %s as %s", unit, unit.nid)
         self.unit_registry[unit.nid] = unit
+        self.unit_index.add(unit)
 
     def register_item(self, item):
         logger.debug("Registering item %s as %s", item, item.uid)
@@ -486,20 +495,25 @@ class GameState():
         return [unit for unit in self.level.units if unit.position and not unit.dead and not unit.is_dying and 'Tile' not in unit.tags]
 
     def get_player_units(self):
-        return [unit for unit in self.get_all_units() if unit.team == 'player']
+        level_units = self.level.units
+        return [unit for unit in self.unit_index.query(team='player', on_map=True)
+                if level_units.get(unit.nid) is unit and not unit.dead and not unit.is_dying and 'Tile' not in unit.tags]
 
     def get_enemy_units(self):
         return [unit for unit in self.get_all_units() if unit.team.startswith('enemy')]
 
+    def get_units_at(self, position) -> list:
+        return self.unit_index.query(position=position)
+
     def get_all_units_in_party(self, party=None):
         if party is None:
             party = self.current_party
-        return [unit for unit in self.unit_registry.values() if unit.team == 'player' and not unit.generic and unit.party == party]
+        return [unit for unit in self.unit_index.query(team='player', party=party) if not unit.generic]
 
     def get_units_in_party(self, party=None):
         if party is None:
             party = self.current_party
-        return [unit for unit in self.get_all_units_in_party() if not unit.dead]
+        return [unit for unit in self.get_all_units_in_party(party) if not unit.dead]
 
     def check_dead(self, nid):
         unit = self.get_unit(nid)
@@ -532,18 +546,23 @@ class GameState():
         from app.engine import action, aura_funcs
         if unit.position:
             logger.debug("Leave %s %s", unit.nid, unit.position)
+            # Terrain, region and aura bonuses are about to change
+            unit.clear_stat_cache()
             # Auras
-            for aura_data in game.board.get_auras(unit.position):
-                child_aura_uid, target = aura_data
-                child_skill = self.get_skill(child_aura_uid)
-                aura_funcs.remove_aura(unit, child_skill, test)
-            if not test:
-                for skill in unit.skills:
-                    if skill.aura:
-                        aura_funcs.release_aura(unit, skill, self)
+            if self.board.aura_move_depth and not test:
+                aura_funcs.lift_auras(unit, self)
+            else:
+                for aura_data in game.board.get_auras(unit.position):
+                    child_aura_uid, target = aura_data
+                    child_skill = self.get_skill(child_aura_uid)
+                    aura_funcs.remove_aura(unit, child_skill, test)
+                if not test:
+                    for skill in unit.skills:
+                        if skill.aura:
+                            aura_funcs.release_aura(unit, skill, self)
             # Regions
-            for region in game.level.regions:
-                if region.region_type == 'status' and region.contains(unit.position):
+            for region in self.board.get_regions(unit.position):
+                if region.region_type == 'status':
                     skill_uid = self.get_terrain_status(region.nid)
                     skill_obj = self.get_skill(skill_uid)
                     if skill_obj and skill_obj in unit.skills:
@@ -563,12 +582,12 @@ class GameState():
                 else:
                     act = action.RemoveSkill(unit, skill_obj)
                     action.do(act)
-            # Boundary
-            if not test:
-                self.boundary.leave(unit)
             # Board
             if not test:
                 self.board.remove_unit(unit.position, unit)
+            # Boundary
+            if not test:
+                self.boundary.leave(unit)
 
     def arrive(self, unit, test=False):
         """
@@ -588,6 +607,8 @@ class GameState():
         from app.engine import skill_system, aura_funcs
         if unit.position:
             logger.debug("Arrive %s %s", unit.nid, unit.position)
+            # Terrain, region and aura bonuses are about to change
+            unit.clear_stat_cache()
             if not test:
                 self.board.set_unit(unit.position, unit)
             # Tiles
@@ -595,8 +616,8 @@ class GameState():
                 self.add_terrain_status(unit, test)
             # Regions
             if not skill_system.ignore_region_status(unit):
-                for region in game.level.regions:
-                    if region.region_type == 'status' and region.contains(unit.position):
+                for region in self.board.get_regions(unit.position):
+                    if region.region_type == 'status':
                         self.add_region_status(unit, region, test)
             # Auras
             aura_funcs.pull_auras(unit, self, test)
@@ -656,8 +677,8 @@ class GameState():
     def check_for_region(self, position, region_type, sub_nid=None):
         if not position:
             return None
-        for region in game.level.regions:
-            if region.region_type == region_type and region.contains(position):
+        for region in self.board.get_regions(position):
+            if region.region_type == region_type:
                 if not sub_nid or region.sub_nid == sub_nid:
                     return region
         return None
@@ -726,10 +747,8 @@ def load_level(level_nid, save_loc):
         game = GameState()
     else:
         game.clear()
-    import pickle
     from app.engine import save
-    with open(save_loc, 'rb') as fp:
-        s_dict = pickle.load(fp)
+    s_dict = save.read_save_file(save_loc)
     game.load_states(['turn_change'])
     game.build_new()
     game.load(s_dict)
@@ -610,10 +610,10 @@ class MenuState(MapState):
 
         # Handle region event options
         self.valid_regions = []
-        for region in game.level.regions:
-            if region.region_type == 'event' and region.contains(self.cur_unit.position):
+        for region in game.board.get_regions(self.cur_unit.position):
+            if region.region_type == 'event':
                 try:
-                    truth = evaluate.evaluate(region.condition, self.cur_unit, region=region)
+                    truth = evaluate.evaluate(region.condition, self.cur_unit, region=region, owner=region.nid)
                     logging.debug("Testing region: %s %s", region.condition, truth)
                     # No duplicates
                     if truth and region.sub_nid not in options:
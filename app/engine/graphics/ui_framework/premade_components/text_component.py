@@ -253,8 +253,8 @@ class TextComponent(UIComponent):
             pass
         return False
     
-    # @overrides UIComponent.to_surf
-    def to_surf(self) -> Surface:
+    # @overrides UIComponent._draw
+    def _draw(self) -> Surface:
         if not self.enabled:
             return engine.create_surface(self.tsize, True)
         # draw the background.
@@ -290,8 +290,8 @@ class DialogTextComponent(TextComponent):
         self.cursor_y_offset_index = (self.cursor_y_offset_index + 1) % len(self.cursor_y_offset)
         return self.cursor_y_offset[self.cursor_y_offset_index] + self.font_height / 3
         
-    # @overrides TextComponent.to_surf
-    def to_surf(self) -> Surface:
+    # @overrides TextComponent._draw
+    def _draw(self) -> Surface:
         if not self.enabled:
             return engine.create_surface(self.tsize, True)
         # draw the background.
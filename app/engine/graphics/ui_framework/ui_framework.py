@@ -1,6 +1,7 @@
 from __future__ import annotations
 from app.utilities.utils import clamp
 
+from collections import OrderedDict
 from enum import Enum
 import logging
 from typing import Callable, Dict, List, Optional, Tuple, Union
@@ -19,6 +20,27 @@ from .ui_framework_layout import (HAlignment, ListLayoutStyle, UILayoutHandler,
                                   UILayoutType, VAlignment)
 from .ui_framework_styling import UIMetric
 
+# How many rescaled backgrounds to keep around, across all components
+MAX_SCALED_BACKGROUNDS = 32
+_scaled_backgrounds: OrderedDict = OrderedDict()
+
+def scale_background(bg: Surface, size: Tuple[int, int]) -> Surface:
+    """Rescales bg to size with PIL. Results are cached, since this is slow,
+    so don't draw on the surface returned.
+    """
+    key = (bg, size)
+    if key in _scaled_backgrounds:
+        _scaled_backgrounds.move_to_end(key)
+        return _scaled_backgrounds[key]
+    bg_raw = engine.surf_to_raw(bg, 'RGBA')
+    pil_bg = Image.frombytes('RGBA', bg.get_size(), bg_raw, 'raw')
+    pil_bg = pil_bg.resize(size, resample=LANCZOS)
+    bg_scaled = engine.raw_to_surf(pil_bg.tobytes('raw', 'RGBA'), size, 'RGBA')
+    _scaled_backgrounds[key] = bg_scaled
+    if len(_scaled_backgrounds) > MAX_SCALED_BACKGROUNDS:
+        _scaled_backgrounds.popitem(last=False)
+    return bg_scaled
+
 class ResizeMode(Enum):
     MANUAL = 0
     AUTO = 1
@@ -54,6 +76,13 @@ class ComponentProperties():
                                                         # NOTE: changing this from 1 will disable per-pixel alphas
                                                         # for the entire component.
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # let the component that owns these props know it needs a redraw
+        owner = self.__dict__.get('_owner')
+        if owner and not name.startswith('_'):
+            owner._set_dirty()
+
 
 class RootComponent():
     """Dummy component to simulate the top-level window
@@ -63,6 +92,9 @@ class RootComponent():
         self.height: int = WINHEIGHT
 
 class UIComponent():
+    # attributes that don't change how the component looks
+    clean_attrs = ('cached_background',)
+
     def __init__(self, name: str = "", parent: UIComponent = None):
         """A generic UI component. Contains convenient functionality for
         organizing a UI, as well as UI animation support.
@@ -76,7 +108,13 @@ class UIComponent():
         self.children are UI component children.
         self.manual_surfaces are manually positioned surfaces, to support more primitive
             and direct control over the UI.
+        
+        Setting any attribute of the component or its props marks it and all its
+        ancestors dirty. Clean components reuse the surface they last rendered.
         """
+        self._dirty: bool = True
+        self._cached_surf: Surface = None
+        self._cached_parent_size: Tuple[int, int] = None
         if not parent:
             self.parent = RootComponent()
         else:
@@ -127,6 +165,22 @@ class UIComponent():
 
         self.enabled: bool = True
         
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name == 'props':
+            value._owner = self
+        if not name.startswith('_') and name not in self.clean_attrs:
+            self._set_dirty()
+
+    def _set_dirty(self):
+        """Marks this component and all its ancestors as needing a redraw.
+        Call this after changing anything in place, such as a list attribute.
+        """
+        component = self
+        while isinstance(component, UIComponent):
+            component._dirty = True
+            component = component.__dict__.get('parent')
+
     def set_chronometer(self, chronometer: Callable[[], int]):
         self._chronometer = chronometer
         self._last_update = self._chronometer()
@@ -431,6 +485,7 @@ class UIComponent():
         child.parent = self
         child.set_chronometer(self._chronometer)
         self.children.append(child)
+        self._set_dirty()
         if self.props.resize_mode == ResizeMode.AUTO:
             self._reset('add_child')
         
@@ -458,6 +513,7 @@ class UIComponent():
         for idx, child in enumerate(self.children):
             if child.name == child_name:
                 self.children.pop(idx)
+                self._set_dirty()
                 return True
         return False
         
@@ -469,6 +525,7 @@ class UIComponent():
             pos (Tuple[int, int]): the coordinate position of the top left of surface
         """
         self.manual_surfaces.append((pos, surf))
+        self._set_dirty()
         
     def speed_up_animation(self, multiplier: int):
         """scales the animation of the component and its children
@@ -680,11 +737,7 @@ class UIComponent():
         else:
             if not self.cached_background or not self.cached_background.get_size() == self.tsize:
                 if self.props.bg_resize_mode == ResizeMode.AUTO:
-                    bg_raw = engine.surf_to_raw(self.props.bg, 'RGBA')
-                    pil_bg = Image.frombytes('RGBA', self.props.bg.get_size(), bg_raw, 'raw')
-                    pil_bg = pil_bg.resize(self.tsize, resample=LANCZOS)
-                    bg_scaled = engine.raw_to_surf(pil_bg.tobytes('raw', 'RGBA'), self.tsize, 'RGBA')
-                    self.cached_background = bg_scaled
+                    self.cached_background = scale_background(self.props.bg, self.tsize)
                 else:
                     base = engine.create_surface(self.tsize, True)
                     base.blit(self.props.bg, (0, 0))
@@ -692,16 +745,44 @@ class UIComponent():
             return self.cached_background
 
     def to_surf(self) -> Surface:
+        """Renders the component and its children. Only the parts of the tree
+        that changed since the last call are drawn again. Don't draw on the surface returned.
+
+        Returns:
+            Surface: the rendered component
+        """
+        # advance animations first; they mark whatever they change dirty
+        self._update_children()
+        return self._to_surf()
+
+    def _update_children(self):
+        if not self.enabled:
+            return
+        for child in self.children:
+            child.update()
+        for child in self.children:
+            child._update_children()
+
+    def _to_surf(self) -> Surface:
+        # percentage sizes depend on the parent, so a resized parent also makes its cache stale
+        parent_size = (self.parent.width, self.parent.height)
+        if not self._dirty and self._cached_surf is not None and self._cached_parent_size == parent_size:
+            return self._cached_surf
+        # anything changed while drawing will dirty us again for next time
+        self._dirty = False
+        self._cached_surf = self._draw()
+        self._cached_parent_size = parent_size
+        return self._cached_surf
+
+    def _draw(self) -> Surface:
         if not self.enabled:
             return engine.create_surface(self.size, True)
         # draw the background.
         base_surf = self._create_bg_surf().copy()
         # position and then draw all children recursively according to our layout
-        for child in self.children:
-            child.update()
         for idx, child_pos in enumerate(self.layout_handler.generate_child_positions()):
             child = self.children[idx]
-            base_surf.blit(child.to_surf(), child_pos)
+            base_surf.blit(child._to_surf(), child_pos)
         # draw the hard coded surfaces as well.
         for hard_code_child in self.manual_surfaces:
             pos = hard_code_child[0]
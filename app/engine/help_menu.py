@@ -30,7 +30,7 @@ class HelpDialog():
             self.num_lines += 1
         self.height = self.font.height * self.num_lines + 16
 
-        self.help_surf = base_surf.create_base_surf(self.width, self.height, 'message_bg_base') 
+        self.help_surf = base_surf.get_base_surf(self.width, self.height, 'message_bg_base')
         self.h_surf = engine.create_surface((self.width, self.height + 3), transparent=True)
 
     def get_width(self):
@@ -166,7 +166,7 @@ class ItemHelpDialog(HelpDialog):
             size_y = 48 + self.font.height * len(self.lines)
         else:
             size_y = 32 + self.font.height * len(self.lines)
-        self.help_surf = base_surf.create_base_surf(160, size_y, 'message_bg_base')
+        self.help_surf = base_surf.get_base_surf(160, size_y, 'message_bg_base')
         self.h_surf = engine.create_surface((160, size_y + 3), transparent=True)
 
     def draw(self, surf, pos, right=False):
@@ -128,10 +128,16 @@ class HighlightController():
         escape_image = SPRITES.get('highlight_yellow')
         rect = (self.update_idx//4 * TILEWIDTH, 0, TILEWIDTH, TILEHEIGHT)
         escape_image = engine.subsurface(escape_image, rect)
-        for region in game.level.regions:
-            if region.region_type == 'event' and region.sub_nid in ('Escape', 'Arrive'):
-                for position in region.get_all_positions():
-                    surf.blit(escape_image, (position[0] * TILEWIDTH - cull_rect[0], position[1] * TILEHEIGHT - cull_rect[1]))
+        # Only the tiles on screen
+        board = game.board
+        left, top = max(0, cull_rect[0] // TILEWIDTH), max(0, cull_rect[1] // TILEHEIGHT)
+        right = min(board.width, (cull_rect[0] + cull_rect[2]) // TILEWIDTH + 1)
+        bottom = min(board.height, (cull_rect[1] + cull_rect[3]) // TILEHEIGHT + 1)
+        for x in range(left, right):
+            for y in range(top, bottom):
+                for region in board.region_grid[x * board.height + y]:
+                    if region.region_type == 'event' and region.sub_nid in ('Escape', 'Arrive'):
+                        surf.blit(escape_image, (x * TILEWIDTH - cull_rect[0], y * TILEHEIGHT - cull_rect[1]))
 
         # Regular highlights
         for name, highlight_set in self.highlights.items():
@@ -0,0 +1,117 @@
+"""
+Dispatch index for skill and item component hooks.
+
+The hooks in skill_system and item_system used to walk every component
+of every skill asking `component.defines(hook)` on each call. Instead,
+each skill or item object remembers which of its components define a
+hook the first time that hook is asked for, and each unit's skill list
+remembers the (skill, component) pairs that define a hook, in the same
+order the old loops visited them.
+
+A unit's skill index is thrown away whenever its skill list is changed.
+The components of a skill or item object do not change once it has been
+created, so their index is kept for the object's lifetime. If that ever
+changes, call `clear_components(obj)`.
+"""
+
+def get_components(obj, hook: str) -> tuple:
+    """
+    Returns the components of a skill or item object that define hook,
+    in component order
+    """
+    hooks = getattr(obj, '_hooks', None)
+    if hooks is None:
+        # Not an engine object (ie, a prefab in the editor), so do not remember
+        return tuple(component for component in obj.components if component.defines(hook))
+    components = hooks.get(hook)
+    if components is None:
+        components = hooks[hook] = tuple(component for component in obj.components if component.defines(hook))
+    return components
+
+def clear_components(obj):
+    obj._hooks = {}
+
+class SkillList(list):
+    """
+    A unit's list of skills that also keeps an index of
+    which (skill, component) pairs define each hook
+    """
+    def __init__(self, *args):
+        super().__init__(*args)
+        self._hooks = {}
+        # Goes up every time the list is changed
+        self.version = 0
+
+    def get_hooks(self, hook: str) -> tuple:
+        pairs = self._hooks.get(hook)
+        if pairs is None:
+            pairs = self._hooks[hook] = \
+                tuple((skill, component) for skill in self for component in get_components(skill, hook))
+        return pairs
+
+    def _changed(self):
+        self._hooks.clear()
+        self.version += 1
+
+    def append(self, skill):
+        super().append(skill)
+        self._changed()
+
+    def extend(self, skills):
+        super().extend(skills)
+        self._changed()
+
+    def insert(self, idx, skill):
+        super().insert(idx, skill)
+        self._changed()
+
+    def remove(self, skill):
+        super().remove(skill)
+        self._changed()
+
+    def pop(self, *args):
+        skill = super().pop(*args)
+        self._changed()
+        return skill
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        super().reverse()
+        self._changed()
+
+    def __setitem__(self, idx, value):
+        super().__setitem__(idx, value)
+        self._changed()
+
+    def __delitem__(self, idx):
+        super().__delitem__(idx)
+        self._changed()
+
+    def __iadd__(self, skills):
+        result = super().__iadd__(skills)
+        self._changed()
+        return result
+
+    def __imul__(self, n):
+        result = super().__imul__(n)
+        self._changed()
+        return result
+
+    def __reduce_ex__(self, protocol):
+        return (SkillList, (list(self),))
+
+def get_hooks(skills, hook: str) -> tuple:
+    """
+    Returns every (skill, component) pair in skills that defines hook,
+    in the order of the skills and then of their components
+    """
+    if isinstance(skills, SkillList):
+        return skills.get_hooks(hook)
+    return tuple((skill, component) for skill in skills for component in get_components(skill, hook))
@@ -1,3 +1,6 @@
+import array
+import sys
+
 from app.utilities import utils
 from app.engine import engine
 
@@ -17,13 +20,20 @@ def color_convert_alpha(image, conversion_dict):
     return image
 
 def make_gray(image):
-    for row in range(image.get_width()):
-        for col in range(image.get_height()):
-            color = image.get_at((row, col))
-            if color[3] != 0:
-                avg = int(color[0] * 0.298 + color[1] * 0.587 + color[2] * 0.114)
-                image.set_at((row, col), (avg, avg, avg, color[3]))
-    return image
+    """
+    Returns a grayscale copy of an image with per-pixel alpha
+    """
+    # Work on whole RGBA pixels at once, and only do the math
+    # once per distinct color instead of once per pixel
+    pixels = array.array('I', engine.surf_to_raw(image, 'RGBA'))
+    grays = {}
+    for pixel in set(pixels):
+        r, g, b, a = pixel.to_bytes(4, sys.byteorder)
+        if a != 0:
+            avg = int(r * 0.298 + g * 0.587 + b * 0.114)
+            grays[pixel] = int.from_bytes(bytes((avg, avg, avg, a)), sys.byteorder)
+    pixels = array.array('I', map(grays.get, pixels, pixels))
+    return engine.raw_to_surf(pixels.tobytes(), image.get_size(), 'RGBA').convert_alpha()
 
 def make_translucent(image, t):
     """
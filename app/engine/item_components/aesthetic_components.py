@@ -80,8 +80,10 @@ class EvalWarning(ItemComponent):
     def warning(self, unit, item, target) -> bool:
         from app.engine import evaluate
         try:
-            val = evaluate.evaluate(self.value, unit, target, item)
+            val = evaluate.evaluate(self.value, unit, target, item, owner=self.item)
             return bool(val)
+        except SyntaxError:  # Already reported
+            return False
         except Exception as e:
             print("Could not evaluate %s (%s)" % (self.value, e))
             return False
@@ -19,8 +19,7 @@ class BlastAOE(ItemComponent):
 
     def splash(self, unit, item, position) -> tuple:
         ranges = set(range(self._get_power(unit)))
-        splash = target_system.find_manhattan_spheres(ranges, position[0], position[1])
-        splash = {pos for pos in splash if game.tilemap.check_bounds(pos)}
+        splash = target_system.get_shell({position}, ranges, game.tilemap.width, game.tilemap.height)
         from app.engine import item_system
         if item_system.is_spell(unit, item):
             # spell blast
@@ -35,8 +34,7 @@ class BlastAOE(ItemComponent):
 
     def splash_positions(self, unit, item, position) -> set:
         ranges = set(range(self._get_power(unit)))
-        splash = target_system.find_manhattan_spheres(ranges, position[0], position[1])
-        splash = {pos for pos in splash if game.tilemap.check_bounds(pos)}
+        splash = target_system.get_shell({position}, ranges, game.tilemap.width, game.tilemap.height)
         return splash
 
 class EnemyBlastAOE(BlastAOE, ItemComponent):
@@ -46,8 +44,7 @@ class EnemyBlastAOE(BlastAOE, ItemComponent):
 
     def splash(self, unit, item, position) -> tuple:
         ranges = set(range(self._get_power(unit)))
-        splash = target_system.find_manhattan_spheres(ranges, position[0], position[1])
-        splash = {pos for pos in splash if 0 <= pos[0] < game.tilemap.width and 0 <= pos[1] < game.tilemap.height}
+        splash = target_system.get_shell({position}, ranges, game.tilemap.width, game.tilemap.height)
         from app.engine import item_system, skill_system
         if item_system.is_spell(unit, item):
             # spell blast
@@ -63,8 +60,7 @@ class EnemyBlastAOE(BlastAOE, ItemComponent):
     def splash_positions(self, unit, item, position) -> set:
         from app.engine import skill_system
         ranges = set(range(self._get_power(unit)))
-        splash = target_system.find_manhattan_spheres(ranges, position[0], position[1])
-        splash = {pos for pos in splash if game.tilemap.check_bounds(pos)}
+        splash = target_system.get_shell({position}, ranges, game.tilemap.width, game.tilemap.height)
         # Doesn't highlight allies positions
         splash = {pos for pos in splash if not game.board.get_unit(pos) or skill_system.check_enemy(unit, game.board.get_unit(pos))}
         return splash
@@ -76,8 +72,7 @@ class AllyBlastAOE(BlastAOE, ItemComponent):
 
     def splash(self, unit, item, position) -> tuple:
         ranges = set(range(self._get_power(unit)))
-        splash = target_system.find_manhattan_spheres(ranges, position[0], position[1])
-        splash = {pos for pos in splash if game.tilemap.check_bounds(pos)}
+        splash = target_system.get_shell({position}, ranges, game.tilemap.width, game.tilemap.height)
         from app.engine import skill_system
         splash = [game.board.get_unit(s) for s in splash]
         splash = [s.position for s in splash if s and skill_system.check_ally(unit, s)]
@@ -147,7 +142,7 @@ class AllAlliesAOE(ItemComponent):
 
     def splash(self, unit, item, position) -> tuple:
         from app.engine import skill_system
-        splash = [u.position for u in game.units if u.position and skill_system.check_ally(unit, u)]
+        splash = [u.position for u in game.unit_index.query(on_map=True) if skill_system.check_ally(unit, u)]
         return None, splash
 
     def splash_positions(self, unit, item, position) -> set:
@@ -162,7 +157,7 @@ class AllAlliesExceptSelfAOE(ItemComponent):
 
     def splash(self, unit, item, position) -> tuple:
         from app.engine import skill_system
-        splash = [u.position for u in game.units if u.position and skill_system.check_ally(unit, u) and u is not unit]
+        splash = [u.position for u in game.unit_index.query(on_map=True) if skill_system.check_ally(unit, u) and u is not unit]
         return None, splash
 
     def splash_positions(self, unit, item, position) -> set:
@@ -177,7 +172,7 @@ class AllEnemiesAOE(ItemComponent):
 
     def splash(self, unit, item, position) -> tuple:
         from app.engine import skill_system
-        splash = [u.position for u in game.units if u.position and skill_system.check_enemy(unit, u)]
+        splash = [u.position for u in game.unit_index.query(on_map=True) if skill_system.check_enemy(unit, u)]
         return None, splash
 
     def splash_positions(self, unit, item, position) -> set:
@@ -202,8 +202,10 @@ class GainManaAfterCombat(ItemComponent):
         from app.engine import evaluate
         try:
             if target:
-                mana_gain = int(evaluate.evaluate(self.value, unit, target, position=unit.position))
+                mana_gain = int(evaluate.evaluate(self.value, unit, target, position=unit.position, owner=self.item))
                 action.do(action.ChangeMana(unit, mana_gain))
+        except SyntaxError:  # Already reported
+            return True
         except Exception as e:
             print("Could not evaluate %s (%s)" % (self.value, e))
             return True
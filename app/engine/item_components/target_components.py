@@ -16,8 +16,7 @@ class TargetsAnything(ItemComponent):
 
     def valid_targets(self, unit, item) -> set:
         rng = item_funcs.get_range(unit, item)
-        positions = target_system.find_manhattan_spheres(rng, *unit.position)
-        return {pos for pos in positions if game.tilemap.check_bounds(pos)}
+        return target_system.get_shell({unit.position}, rng, game.tilemap.width, game.tilemap.height)
 
 class TargetsUnits(ItemComponent):
     nid = 'target_unit'
@@ -71,12 +70,14 @@ class EvalTargetRestrict(ItemComponent):
         from app.engine import evaluate
         try:
             target = game.board.get_unit(def_pos)
-            if target and evaluate.evaluate(self.value, target, position=def_pos):
+            if target and evaluate.evaluate(self.value, target, position=def_pos, owner=self.item):
                 return True
             for s_pos in splash:
                 target = game.board.get_unit(s_pos)
-                if evaluate.evaluate(self.value, target, position=s_pos):
+                if evaluate.evaluate(self.value, target, position=s_pos, owner=self.item):
                     return True
+        except SyntaxError:  # Already reported
+            return True
         except Exception as e:
             print("Could not evaluate %s (%s)" % (self.value, e))
             return True
@@ -146,8 +146,8 @@ class UnlockStaff(ItemComponent):
 
     def target_restrict(self, unit, item, def_pos, splash) -> bool:
         for pos in [def_pos] + splash:
-            for region in game.level.regions:
-                if self._valid_region(region) and region.contains(def_pos):
+            for region in game.board.get_regions(def_pos):
+                if self._valid_region(region):
                     return True
         return False
 
@@ -158,8 +158,8 @@ class UnlockStaff(ItemComponent):
         if self._did_hit:
             pos = game.cursor.position
             region = None
-            for reg in game.level.regions:
-                if self._valid_region(reg) and reg.contains(pos):
+            for reg in game.board.get_regions(pos):
+                if self._valid_region(reg):
                     region = reg
                     break
             if region:
@@ -179,7 +179,9 @@ class CanUnlock(ItemComponent):
     def can_unlock(self, unit, item, region) -> bool:
         from app.engine import evaluate
         try:
-            return bool(evaluate.evaluate(self.value, unit, item, region=region))
+            return bool(evaluate.evaluate(self.value, unit, item, region=region, owner=self.item))
+        except SyntaxError:  # Already reported
+            pass
         except:
             print("Could not evaluate %s" % self.value)
         return False
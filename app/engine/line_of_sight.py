@@ -1,13 +1,7 @@
 from app.utilities import utils
-from enum import IntEnum
 
 from app.engine.game_state import game
 
-class Visibility(IntEnum):
-    Unknown = 0
-    Dark = 1
-    Lit = 2
-
 def get_line(start: tuple, end: tuple) -> bool:
     if start == end:
         return True
@@ -78,35 +72,57 @@ def get_line(start: tuple, end: tuple) -> bool:
     assert x == x2 and y == y2
     return True
 
-def line_of_sight(source_pos: list, dest_pos: list, max_range: int) -> list:
-    all_tiles = {}
-    for pos in dest_pos:
-        if pos in source_pos:
-            all_tiles[pos] = Visibility.Lit
+def get_visible_tiles(source: tuple, max_range: int) -> frozenset:
+    """
+    Returns every tile on the map within max_range of source
+    that can be seen from source. Kept on the board until
+    its opacity changes
+    """
+    key = (source, max_range)
+    visible = game.board.visibility_cache.get(key)
+    if visible is None:
+        width, height = game.board.width, game.board.height
+        opacity_grid = game.board.opacity_grid
+        x, y = source
+        max_range = min(max_range, width + height)
+        tiles = []
+        for i in range(max(0, x - max_range), min(width, x + max_range + 1)):
+            y_range = max_range - abs(i - x)
+            for j in range(max(0, y - y_range), min(height, y + y_range + 1)):
+                tiles.append((i, j))
+        # Every line from source stays inside its range,
+        # so without an opaque tile in range, everything is seen
+        if any(opacity_grid[i * height + j] for (i, j) in tiles):
+            visible = frozenset(pos for pos in tiles if get_line(source, pos))
         else:
-            all_tiles[pos] = Visibility.Unknown
+            visible = frozenset(tiles)
+        game.board.visibility_cache[key] = visible
+    return visible
+
+def line_of_sight(source_pos: list, dest_pos: list, max_range: int) -> list:
+    lit = set(dest_pos)
+    unknown = lit - set(source_pos)
+    lit -= unknown
 
-    # Iterate over remaining tiles
-    for pos, vis in all_tiles.items():
-        if vis == Visibility.Unknown:
-            for s_pos in source_pos:
-                if utils.calculate_distance(pos, s_pos) <= max_range and get_line(s_pos, pos):
-                    all_tiles[pos] = Visibility.Lit
-                    break
-            else:
-                all_tiles[pos] = Visibility.Dark
+    for s_pos in source_pos:
+        if not unknown:
+            break
+        seen = unknown & get_visible_tiles(s_pos, max_range)
+        lit |= seen
+        unknown -= seen
 
-    lit_tiles = [pos for pos in dest_pos if all_tiles[pos] != Visibility.Dark]
+    lit_tiles = [pos for pos in dest_pos if pos in lit]
     return lit_tiles
 
 def simple_check(dest_pos: tuple, team: str, max_range: int) -> bool:
     """
     Returns true if can see position with line of sight
     """
-    player_pos = [unit.position for unit in game.units if unit.position and unit.team == team]
+    player_pos = [unit.position for unit in game.unit_index.query(team=team, on_map=True)]
     for s_pos in player_pos:
         if s_pos == dest_pos:
             return True
-        elif utils.calculate_distance(dest_pos, s_pos) <= max_range and get_line(s_pos, dest_pos):
+        elif utils.calculate_distance(dest_pos, s_pos) <= max_range and \
+                dest_pos in get_visible_tiles(s_pos, max_range):
             return True
     return False
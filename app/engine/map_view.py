@@ -72,7 +72,6 @@ class MapView():
         map_image = game.tilemap.get_full_image(cull_rect)
 
         surf = engine.copy_surface(map_image)
-        surf = surf.convert_alpha()
 
         surf = game.boundary.draw(surf, full_size, cull_rect)
         surf = game.boundary.draw_fog_of_war(surf, full_size, cull_rect)
@@ -11,7 +11,7 @@ from app.engine.input_manager import INPUT
 from app.engine import engine, image_mods, icons, help_menu, menu_options, \
     item_system, gui, item_funcs
 from app.engine.gui import ScrollBar
-from app.engine.base_surf import create_base_surf
+from app.engine.base_surf import create_base_surf, get_base_surf
 from app.engine.objects.item import ItemObject
 from app.engine.objects.unit import UnitObject
 from app.engine.game_state import game
@@ -461,11 +461,11 @@ class Choice(Simple):
             return engine.create_surface((self.get_menu_width(), self.get_menu_height()), transparent=True)
         if self.horizontal:
             width = sum(option.width() + 8 for option in self.options) + 16
-            surf = create_base_surf(width, 24, self.background)
+            surf = get_base_surf(width, 24, self.background)
             surf = image_mods.make_translucent(surf, .5)
             return surf
         else:
-            bg_surf = create_base_surf(self.get_menu_width(), self.get_menu_height(), self.background)
+            bg_surf = get_base_surf(self.get_menu_width(), self.get_menu_height(), self.background)
             surf = engine.create_surface((bg_surf.get_width() + 2, bg_surf.get_height() + 4), transparent=True)
             surf.blit(bg_surf, (2, 4))
             if self.gem:
@@ -1064,7 +1064,7 @@ class Table(Simple):
         return (max_height - max_height%8) * self.rows + 8
 
     def create_bg_surf(self):
-        bg_surf = create_base_surf(self.get_menu_width(), self.get_menu_height(), self.background)
+        bg_surf = get_base_surf(self.get_menu_width(), self.get_menu_height(), self.background)
         surf = engine.create_surface((bg_surf.get_width() + 2, bg_surf.get_height() + 4), transparent=True)
         surf.blit(bg_surf, (2, 4))
         if self.gem:
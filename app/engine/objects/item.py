@@ -26,6 +26,8 @@ class ItemObject():
             self.__dict__[component_key] = component_value
             # Assign parent to component
             component_value.item = self
+        # Key: hook name, Value: components that define it
+        self._hooks = {}
 
         self.data = {}
         
@@ -24,6 +24,8 @@ class SkillObject():
             self.__dict__[component_key] = component_value
             # Assign parent to component
             component_value.skill = self
+        # Key: hook name, Value: components that define it
+        self._hooks = {}
 
         self.data = {}
         self.initiator_nid = None
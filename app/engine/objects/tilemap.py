@@ -37,12 +37,18 @@ class LayerObject():
             cull_rect[1] + cull_rect[3] > self.pixel_bounds[1]
         return ans
 
+    def make_translucent(self, im):
+        # Can't just convert_alpha here -- once the layer image has been
+        # RLE encoded, converting a subsurface of it reads garbage pixels
+        surf = engine.create_surface(im.get_size(), transparent=True)
+        surf.blit(im, (0, 0))
+        return image_mods.make_translucent(surf, self.translucence)
+
     def get_image(self, cull_rect):
         # Cull to only the part I need
         im = engine.subsurface(self.image, cull_rect)
         if self.state in ('fade_in', 'fade_out'):
-            im = im.convert_alpha()
-            im = image_mods.make_translucent(im, self.translucence)
+            im = self.make_translucent(im)
         return im
 
     def get_autotile_image(self, cull_rect):
@@ -50,15 +56,16 @@ class LayerObject():
             return None
         im = engine.subsurface(self.autotile_images[self.autotile_frame], cull_rect)
         if self.state in ('fade_in', 'fade_out'):
-            im = im.convert_alpha()
-            return image_mods.make_translucent(im, self.translucence)
+            im = self.make_translucent(im)
         return im
 
     def quick_show(self):
         self.visible = True
+        self.parent.reset()
 
     def quick_hide(self):
         self.visible = False
+        self.parent.reset()
 
     def show(self):
         """
@@ -69,6 +76,7 @@ class LayerObject():
             self.state = 'fade_in'
             self.translucence = 1
             self.start_update = engine.get_time()
+            self.parent.reset()
 
     def hide(self):
         """
@@ -79,6 +87,7 @@ class LayerObject():
             self.state = 'fade_out'
             self.translucence = 0
             self.start_update = engine.get_time()
+            self.parent.reset()
 
     def update(self) -> bool:
         current_time = engine.get_time()
@@ -119,6 +128,10 @@ class TileMapObject(Prefab):
         self.height = prefab.height
         self.autotile_fps = prefab.autotile_fps
         self.layers = Data()
+        # All the visible layers baked together, rebuilt by reset()
+        self.full_image = None
+        # (cull rect, image) for the last cull rect that was larger than the map
+        self.padded_image = None
 
         # Stitch together image layers
         for layer in prefab.layers:
@@ -200,7 +213,7 @@ class TileMapObject(Prefab):
                 return layer.nid
         return None
 
-    def get_full_image(self, cull_rect):
+    def build_image(self, cull_rect):
         image = engine.create_surface((cull_rect[2], cull_rect[3]))
         engine.set_colorkey(image, COLORKEY)
         for layer in self.layers:
@@ -213,6 +226,28 @@ class TileMapObject(Prefab):
                     image.blit(autotile_image, (0, 0))
         return image
 
+    def get_full_image(self, cull_rect):
+        """
+        Returns the map within cull_rect, with per pixel alpha.
+        Only valid until the next reset, so copy it before drawing on it
+        """
+        if any(layer.state in ('fade_in', 'fade_out') for layer in self.layers):
+            # The map changes every frame while a layer fades,
+            # so only build the part that is on screen
+            return self.build_image(cull_rect).convert_alpha()
+        if self.full_image is None:
+            full_rect = (0, 0, self.width * TILEWIDTH, self.height * TILEHEIGHT)
+            self.full_image = self.build_image(full_rect).convert_alpha()
+        image = engine.subsurface(self.full_image, cull_rect)
+        if image.get_size() != (cull_rect[2], cull_rect[3]):
+            # Map is smaller than the cull rect, so pad it out like build_image would
+            if not self.padded_image or self.padded_image[0] != tuple(cull_rect):
+                pad = engine.create_surface((cull_rect[2], cull_rect[3]))
+                pad.blit(image, (0, 0))
+                self.padded_image = (tuple(cull_rect), pad.convert_alpha())
+            image = self.padded_image[1]
+        return image
+
     def update(self):
         for layer in self.layers:
             in_state = layer.update()
@@ -220,7 +255,8 @@ class TileMapObject(Prefab):
                 self.reset()
 
     def reset(self):
-        pass
+        self.full_image = None
+        self.padded_image = None
 
     def save(self):
         s_dict = {}
@@ -243,3 +279,4 @@ class TileMapObject(Prefab):
             nid = layer_dict['nid']
             visible = layer_dict['visible']
             self.layers.get(nid).visible = visible
+        self.reset()
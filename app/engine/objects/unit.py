@@ -3,10 +3,20 @@ from app.utilities.data import Prefab
 from app.data.database import DB
 
 from app.engine import equations, item_system, item_funcs, skill_system, unit_funcs, action
+from app.engine.hook_index import SkillList
 from app.engine.game_state import game
 
 # Main unit object used by engine
 class UnitObject(Prefab):
+    # Holds the skill list it was built from, its version, the summed stat
+    # changes of unconditional skills, and the conditional stat change hooks
+    _stat_cache = None
+    # The game's unit index, while this unit is registered in it
+    _index = None
+    _position = None
+    _team = None
+    _party = None
+
     @classmethod
     def from_prefab(cls, prefab):
         self = cls()
@@ -197,6 +207,9 @@ class UnitObject(Prefab):
     def stat_bonus(self, stat_nid):
         return skill_system.stat_change(self, stat_nid)
 
+    def clear_stat_cache(self):
+        self._stat_cache = None
+
     def growth_bonus(self, stat_nid):
         return skill_system.growth_change(self, stat_nid)
 
@@ -226,6 +239,57 @@ class UnitObject(Prefab):
             self._sound = unit_sound.UnitSound(self)
         return self._sound
 
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, position):
+        # Keeps the unit index in step with the unit
+        old_position, self._position = self._position, position
+        if self._index:
+            self._index.move(self, old_position, position)
+
+    @property
+    def team(self):
+        return self._team
+
+    @team.setter
+    def team(self, team):
+        old_team, self._team = self._team, team
+        if self._index:
+            self._index.change_team(self, old_team, team)
+
+    @property
+    def party(self):
+        return self._party
+
+    @party.setter
+    def party(self, party):
+        old_party, self._party = self._party, party
+        if self._index:
+            self._index.change_party(self, old_party, party)
+
+    @property
+    def stats(self):
+        return self._stats
+
+    @stats.setter
+    def stats(self, stats):
+        self._stats = stats
+        self.clear_stat_cache()
+
+    @property
+    def skills(self):
+        return self._skills
+
+    @skills.setter
+    def skills(self, skills):
+        # Keeps the hook index in step with the skill list
+        if not isinstance(skills, SkillList):
+            skills = SkillList(skills)
+        self._skills = skills
+
     @property
     def tags(self):
         unit_tags = self._tags
@@ -300,6 +364,7 @@ class UnitObject(Prefab):
                 self.equipped_weapon = item
             item_system.on_equip_item(self, item)
             skill_system.on_equip_item(self, item)
+            self.clear_stat_cache()
 
     def unequip(self, item):
         if item_system.is_accessory(self, item):
@@ -308,6 +373,7 @@ class UnitObject(Prefab):
             self.equipped_weapon = None
         skill_system.on_unequip_item(self, item)
         item_system.on_unequip_item(self, item)
+        self.clear_stat_cache()
 
     def add_item(self, item):
         index = len(self.items)
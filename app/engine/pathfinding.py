@@ -218,3 +218,219 @@ class AStar():
                     else:  # Is blocked
                         pass
         return []
+
+class _Handle(int):
+    """
+    Cell index carried on the heap. Compares equal to every other
+    handle, so heap entries that tie on their keys are ordered exactly
+    as the Node based solvers above order them (by heap position alone).
+    """
+    __slots__ = ()
+
+    def __eq__(self, other):
+        return True
+
+    def __ne__(self, other):
+        return False
+
+    __hash__ = int.__hash__
+
+_handles = []
+
+def _get_handles(size: int) -> list:
+    if len(_handles) < size:
+        _handles.extend(_Handle(idx) for idx in range(len(_handles), size))
+    return _handles
+
+class ArrayDjikstra():
+    """
+    Drop-in replacement for Djikstra that keeps its search state in flat
+    arrays indexed by x * height + y instead of on shared Node objects,
+    and uses a binary heap with lazy deletion instead of membership tests
+    on the heap. Takes a cost grid (see GameBoard.get_cost_grid) rather
+    than a Node grid.
+    """
+    __slots__ = ['costs', 'width', 'height', 'start_pos', 'start_idx',
+                 'unit_team', 'pass_through', 'ai_fog_of_war']
+
+    def __init__(self, start_pos: tuple, cost_grid: list, width: int, height: int, 
+                 unit_team: str, pass_through: bool, ai_fog_of_war: bool):
+        self.costs = cost_grid
+        self.width, self.height = width, height
+        self.start_pos = start_pos
+        self.start_idx = start_pos[0] * height + start_pos[1]
+        self.unit_team = unit_team
+        self.pass_through = pass_through
+        self.ai_fog_of_war = ai_fog_of_war
+
+    def _can_move_through(self, game_board, idx) -> bool:
+        if self.pass_through:
+            return True
+        unit_team = next(iter(game_board.team_grid[idx]), None)
+        if not unit_team or utils.compare_teams(self.unit_team, unit_team):
+            return True
+        if self.unit_team == 'player' or self.ai_fog_of_war:
+            pos = divmod(idx, self.height)
+            if not game_board.in_vision(pos, self.unit_team):
+                return True  # Can always move through what you can't see
+        return False
+
+    def process(self, game_board, movement_left: int) -> set:
+        costs = self.costs
+        width, height = self.width, self.height
+        size = width * height
+        handles = _get_handles(size)
+        g = [0] * size
+        seen = bytearray(size)
+        closed = bytearray(size)
+        closed_list = []
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        start = self.start_idx
+        seen[start] = 1
+        heap = [(0, costs[start], handles[start])]
+        while heap:
+            cur_g, _, handle = heappop(heap)
+            # If we've traveled too far -- always g ordered, so leaving at the 
+            # first sign of trouble will always work
+            if cur_g > movement_left:
+                break
+            idx = int(handle)
+            if closed[idx]:
+                continue  # Stale entry
+            closed[idx] = 1
+            closed_list.append(idx)
+            x, y = divmod(idx, height)
+            for adj, valid in ((idx + 1, y < height - 1), (idx + height, x < width - 1),
+                               (idx - height, x > 0), (idx - 1, y > 0)):
+                if not valid or closed[adj]:
+                    continue
+                cost = costs[adj]
+                if cost >= 99:  # Not reachable
+                    continue
+                if not self._can_move_through(game_board, adj):
+                    continue
+                new_g = cur_g + cost
+                if not seen[adj] or g[adj] > new_g:
+                    seen[adj] = 1
+                    g[adj] = new_g
+                    heappush(heap, (new_g, cost, handles[adj]))
+        return {divmod(idx, height) for idx in closed_list}
+
+class ArrayAStar():
+    """
+    Drop-in replacement for AStar with the same search state layout as
+    ArrayDjikstra. Produces the same paths as AStar. Takes a cost grid
+    (see GameBoard.get_cost_grid) rather than a Node grid.
+    """
+    def __init__(self, start_pos: tuple, goal_pos: tuple, cost_grid: list, 
+                 width: int, height: int, unit_team: str, 
+                 pass_through: bool = False, ai_fog_of_war: bool = False):
+        self.costs = cost_grid
+        self.width = width
+        self.height = height
+        self.start_pos = start_pos
+        self.goal_pos = None
+        self.adj_end = set()
+        if goal_pos:
+            self.set_goal_pos(goal_pos)
+
+        self.unit_team = unit_team
+        self.pass_through = pass_through
+        self.ai_fog_of_war = ai_fog_of_war
+
+    def reset(self):
+        # Search state only lives for the length of process
+        pass
+
+    def set_goal_pos(self, goal_pos):
+        self.goal_pos = goal_pos
+        x, y = goal_pos
+        adjs = ((x, y + 1), (x + 1, y), (x - 1, y), (x, y - 1))
+        self.adj_end = {a[0] * self.height + a[1] for a in adjs
+                        if 0 <= a[0] < self.width and 0 <= a[1] < self.height}
+
+    def return_path(self, parent: list, idx: int) -> list:
+        path = []
+        while idx >= 0:
+            path.append(divmod(idx, self.height))
+            idx = parent[idx]
+        return path
+
+    def _can_move_through(self, game_board, idx, ally_block) -> bool:
+        if self.pass_through:
+            return True
+        unit_team = next(iter(game_board.team_grid[idx]), None)
+        if not unit_team:
+            return True
+        if not ally_block and utils.compare_teams(self.unit_team, unit_team):
+            return True
+        if self.unit_team == 'player' or self.ai_fog_of_war:
+            pos = divmod(idx, self.height)
+            if not game_board.in_vision(pos, self.unit_team):
+                return True
+        return False
+
+    def process(self, game_board, adj_good_enough: bool = False, 
+                ally_block: bool = False, limit: int = None) -> list:
+        costs = self.costs
+        width, height = self.width, self.height
+        size = width * height
+        handles = _get_handles(size)
+        g = [0] * size
+        f = [0] * size
+        parent = [-1] * size
+        seen = bytearray(size)
+        closed = bytearray(size)
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        start_x, start_y = self.start_pos
+        end_x, end_y = self.goal_pos
+        end = end_x * height + end_y
+        adj_end = self.adj_end if adj_good_enough else ()
+        # Slight nudge in direction that lies along path from start to end
+        dx2 = start_x - end_x
+        dy2 = start_y - end_y
+
+        start = start_x * height + start_y
+        seen[start] = 1
+        heap = [(0, costs[start], handles[start])]
+        while heap:
+            _, _, handle = heappop(heap)
+            idx = int(handle)
+            if closed[idx]:
+                continue  # Stale entry
+            closed[idx] = 1
+            # If this cell is past the limit, just return None
+            # Uses f, not g, because g will cut off if first greedy path fails
+            # f only cuts off if all cells are bad
+            if limit is not None and f[idx] > limit + 1:
+                # limit + 1 to account for diagonal heuristic
+                return []
+            # if ending cell, display found path
+            if idx == end or idx in adj_end:
+                return self.return_path(parent, idx)
+            cur_g = g[idx]
+            x, y = divmod(idx, height)
+            for adj, valid in ((idx + 1, y < height - 1), (idx + height, x < width - 1),
+                               (idx - height, x > 0), (idx - 1, y > 0)):
+                if not valid or closed[adj]:
+                    continue
+                cost = costs[adj]
+                if cost >= 99:  # Not reachable
+                    continue
+                if not self._can_move_through(game_board, adj, ally_block):
+                    continue
+                new_g = cur_g + cost
+                if not seen[adj] or g[adj] > new_g:
+                    seen[adj] = 1
+                    g[adj] = new_g
+                    # h is approximate distance between this cell and the goal
+                    adj_x, adj_y = divmod(adj, height)
+                    dx1 = adj_x - end_x
+                    dy1 = adj_y - end_y
+                    h = abs(dx1) + abs(dy1) + abs(dx1 * dy2 - dx2 * dy1) * .001
+                    f[adj] = h + new_g
+                    parent[adj] = idx
+                    heappush(heap, (f[adj], cost, handles[adj]))
+        return []
@@ -187,9 +187,11 @@ class FreeRoamState(MapState):
         for region in game.level.regions:
             if region.region_type == 'event' and region.fuzzy_contains(self.roam_unit.position):
                 try:
-                    truth = evaluate.evaluate(region.condition, self.roam_unit, region=region, position=self.roam_unit.position)
+                    truth = evaluate.evaluate(region.condition, self.roam_unit, region=region, position=self.roam_unit.position, owner=region.nid)
                     if truth:
                         return region
+                except SyntaxError:  # Already reported
+                    pass
                 except Exception as e:
                     logging.error("%s: Could not evaluate {%s}" % (e, region.condition))
         return None
@@ -11,6 +11,7 @@ from app.utilities import str_utils
 from app.data.database import DB
 
 import app.engine.config as cf
+from app.engine import save_format
 from app.engine.objects.item import ItemObject
 from app.engine.objects.skill import SkillObject
 
@@ -20,6 +21,7 @@ logger = logging.getLogger(__name__)
 SAVE_THREAD = None
 GAME_NID = str(DB.constants.value('game_nid'))
 SUSPEND_LOC = 'saves/' + GAME_NID + '-suspend.pmeta'
+INDEX_LOC = 'saves/' + GAME_NID + '-index.pindex'
 
 class SaveSlot():
     no_name = '--NO DATA--'
@@ -38,9 +40,8 @@ class SaveSlot():
         self.read()
 
     def read(self):
-        if os.path.exists(self.meta_loc):
-            with open(self.meta_loc, 'rb') as fp:
-                save_metadata = pickle.load(fp)
+        save_metadata = SAVE_INDEX.get(self.meta_loc)
+        if save_metadata:
             self.name = save_metadata['level_title']
             self.playtime = save_metadata['playtime']
             self.realtime = save_metadata['realtime']
@@ -66,6 +67,101 @@ def dict_print(d):
         else:
             print("{0} : {1}".format(k, v))
 
+def write_file(loc, data):
+    """
+    Writes to a temporary file and then swaps it in, so a save
+    file is never changed in place. That way copies of it can be
+    hard links instead of full copies.
+    """
+    temp_loc = loc + '.tmp'
+    with open(temp_loc, 'wb') as fp:
+        fp.write(data)
+    os.replace(temp_loc, loc)
+
+def copy_file(src, dst):
+    if os.path.exists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
+
+class SaveIndex():
+    """
+    The metadata of every save file, kept together in one small file
+    so the save slots can be listed without unpickling each .pmeta file.
+    An entry is only trusted while its .pmeta file still has the
+    modification time and size that were recorded with it. Otherwise
+    that .pmeta file is read again.
+    """
+    version = 1
+
+    def __init__(self, loc):
+        self.loc = loc
+        self.entries = None  # meta_loc -> (mtime_ns, size, metadata)
+        self.dirty = False
+        self.lock = threading.RLock()
+
+    def load(self):
+        self.entries = {}
+        if os.path.exists(self.loc):
+            try:
+                with open(self.loc, 'rb') as fp:
+                    index = pickle.load(fp)
+                if index['version'] == self.version:
+                    self.entries = index['entries']
+            except Exception as e:
+                logger.warning("Rebuilding save index %s: %s", self.loc, e)
+
+    def get(self, meta_loc):
+        """
+        Returns the metadata saved in meta_loc, or None if there is no such file
+        """
+        with self.lock:
+            if self.entries is None:
+                self.load()
+            try:
+                stat = os.stat(meta_loc)
+            except OSError:
+                if self.entries.pop(meta_loc, None):
+                    self.dirty = True
+                return None
+            entry = self.entries.get(meta_loc)
+            if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                return entry[2]
+            with open(meta_loc, 'rb') as fp:
+                metadata = pickle.load(fp)
+            self.entries[meta_loc] = (stat.st_mtime_ns, stat.st_size, metadata)
+            self.dirty = True
+            return metadata
+
+    def record(self, meta_loc, metadata):
+        """
+        Call right after writing metadata to meta_loc
+        """
+        with self.lock:
+            if self.entries is None:
+                self.load()
+            stat = os.stat(meta_loc)
+            self.entries[meta_loc] = (stat.st_mtime_ns, stat.st_size, metadata)
+            self.dirty = True
+
+    def flush(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            try:
+                write_file(self.loc, pickle.dumps({'version': self.version, 'entries': self.entries}))
+                self.dirty = False
+            except OSError as e:
+                logger.warning("Could not write save index %s: %s", self.loc, e)
+
+SAVE_INDEX = SaveIndex(INDEX_LOC)
+
+def read_save_file(save_loc) -> dict:
+    with open(save_loc, 'rb') as fp:
+        return save_format.loads(fp.read())
+
 def save_io(s_dict, meta_dict, old_slot, slot, force_loc=None, name=None):
     if name:
         save_loc = 'saves/' + name + '.p'
@@ -77,16 +173,20 @@ def save_io(s_dict, meta_dict, old_slot, slot, force_loc=None, name=None):
 
     logger.info("Saving to %s", save_loc)
 
-    with open(save_loc, 'wb') as fp:
-        # pickle.dump(s_dict, fp, -1)
+    try:
+        data = save_format.dumps(s_dict)
+    except TypeError as e:
+        logger.warning("Falling back to pickle: %s", e)
         try:
-            pickle.dump(s_dict, fp)
+            data = pickle.dumps(s_dict)
         except TypeError as e:
             # There's a surface somewhere in the dictionary of things to save...
             dict_print(s_dict)
             print(e)
-    with open(meta_loc, 'wb') as fp:
-        pickle.dump(meta_dict, fp)
+            data = b''
+    write_file(save_loc, data)
+    write_file(meta_loc, pickle.dumps(meta_dict))
+    SAVE_INDEX.record(meta_loc, meta_dict)
 
     # For restart
     if not force_loc:
@@ -96,14 +196,16 @@ def save_io(s_dict, meta_dict, old_slot, slot, force_loc=None, name=None):
         # Then rename it to restart file
         if meta_dict['kind'] == 'start':
             if save_loc != r_save:
-                shutil.copy(save_loc, r_save)
-                shutil.copy(meta_loc, r_save_meta)
+                copy_file(save_loc, r_save)
+                copy_file(meta_loc, r_save_meta)
+                SAVE_INDEX.record(r_save_meta, meta_dict)
         elif old_slot is not None:
             old_name = 'saves/' + GAME_NID + '-restart' + str(old_slot) + '.p'
             old_name_meta = old_name + 'meta'
             if old_name != r_save:
-                shutil.copy(old_name, r_save)
-                shutil.copy(old_name_meta, r_save_meta)
+                copy_file(old_name, r_save)
+                copy_file(old_name_meta, r_save_meta)
+                SAVE_INDEX.record(r_save_meta, SAVE_INDEX.get(old_name_meta))
 
     # For preload
     if meta_dict['kind'] == 'start':
@@ -113,8 +215,11 @@ def save_io(s_dict, meta_dict, old_slot, slot, force_loc=None, name=None):
         preload_save = 'saves/' + GAME_NID + '-preload-' + str(meta_dict['level_nid']) + '-' + unique_nid + '.p'
         preload_save_meta = 'saves/' + GAME_NID + '-preload-' + str(meta_dict['level_nid']) + '-' + unique_nid + '.pmeta'
 
-        shutil.copy(save_loc, preload_save)
-        shutil.copy(meta_loc, preload_save_meta)
+        copy_file(save_loc, preload_save)
+        copy_file(meta_loc, preload_save_meta)
+        SAVE_INDEX.record(preload_save_meta, meta_dict)
+
+    SAVE_INDEX.flush()
 
 def suspend_game(game_state, kind, slot=None, name=None):
     """
@@ -146,8 +251,7 @@ def load_game(game_state, save_slot):
     """
     save_loc = save_slot.save_loc
     logging.info("Loading from %s", save_loc)
-    with open(save_loc, 'rb') as fp:
-        s_dict = pickle.load(fp)
+    s_dict = read_save_file(save_loc)
     game_state.build_new()
     game_state.load(s_dict)
     game_state.current_save_slot = save_slot
@@ -172,6 +276,7 @@ def load_saves():
         meta_fp = 'saves/' + GAME_NID + '-' + str(num) + '.pmeta'
         ss = SaveSlot(meta_fp, num)
         save_slots.append(ss)
+    SAVE_INDEX.flush()
     return save_slots
 
 def load_restarts():
@@ -180,6 +285,7 @@ def load_restarts():
         meta_fp = 'saves/' + GAME_NID + '-restart' + str(num) + '.pmeta'
         ss = SaveSlot(meta_fp, num)
         save_slots.append(ss)
+    SAVE_INDEX.flush()
     return save_slots
 
 def get_all_saves():
@@ -191,6 +297,7 @@ def get_all_saves():
     for meta_fn in glob.glob(name):
         ss = SaveSlot(meta_fn, 0)
         save_slots.append(ss)
+    SAVE_INDEX.flush()
     save_slots = sorted(save_slots, key=lambda x: x.realtime, reverse=True)
     return save_slots
 
@@ -0,0 +1,176 @@
+"""
+Versioned save file format.
+
+A save file is a short header, then zlib compressed json:
+
+    b'LTSAVE' + 2 byte big-endian format version + compressed body
+
+The body is a json object holding the format version, the schema each
+registry was written with, the registries themselves, and the rest of
+the save dict. Each registry entry (units, items, skills, regions,
+parties) is written as a list of values in schema order, so the keys
+are not repeated for every unit. An entry whose keys do not match the
+schema is written as a plain object instead. The file keeps the schema
+it was written with, so adding a field to a schema does not break
+older files.
+
+Json has no tuples, sets, Counters or non-string dict keys, so those
+are written as single key objects tagged with the type, eg
+{"__tuple__": [27, 26]}.
+
+Saves written before this format are plain pickles of the save dict.
+They count as version 0 and still load.
+
+If the save dict changes shape, bump SAVE_VERSION and register a
+migration that upgrades a save dict from the previous version:
+
+    @migration(1)
+    def rename_bexp(s_dict):
+        ...
+        return s_dict
+"""
+
+import json
+import pickle
+import struct
+import zlib
+from collections import Counter
+
+MAGIC = b'LTSAVE'
+HEADER = struct.Struct('>H')
+SAVE_VERSION = 1
+COMPRESSION_LEVEL = 6
+
+SCHEMAS = {
+    'units': ('nid', 'position', 'team', 'party', 'klass', 'variant', 'faction',
+              'level', 'exp', 'generic', 'ai', 'ai_group', 'items', 'name', 'desc',
+              'tags', 'stats', 'growths', 'growth_points', 'starting_position',
+              'wexp', 'portrait_nid', 'affinity', 'skills', 'notes', 'current_hp',
+              'current_mana', 'current_fatigue', 'traveler', 'dead', 'action_state',
+              'ai_group_active'),
+    'items': ('uid', 'nid', 'owner_nid', 'droppable', 'data', 'subitems'),
+    'skills': ('uid', 'nid', 'owner_nid', 'data', 'initiator_nid', 'subskill'),
+    'regions': ('nid', 'region_type', 'position', 'size', 'sub_nid', 'condition', 'only_once'),
+    'parties': ('nid', 'name', 'leader_nid', 'units', 'money', 'convoy', 'bexp'),
+}
+
+TAGS = ('__tuple__', '__set__', '__frozenset__', '__counter__', '__dict__')
+
+class SaveFormatError(Exception):
+    pass
+
+SCALARS = (str, int, bool, float, type(None))
+
+def encode(value):
+    """
+    Returns value as something json can write
+    """
+    kind = type(value)
+    if kind in SCALARS:
+        return value
+    elif kind is list:
+        return [v if type(v) in SCALARS else encode(v) for v in value]
+    elif kind is tuple:
+        return {'__tuple__': [v if type(v) in SCALARS else encode(v) for v in value]}
+    elif kind is dict:
+        if all(type(k) is str for k in value) and not (len(value) == 1 and next(iter(value)) in TAGS):
+            return {k: v if type(v) in SCALARS else encode(v) for k, v in value.items()}
+        return {'__dict__': [[encode(k), encode(v)] for k, v in value.items()]}
+    elif kind is set:
+        return {'__set__': [encode(v) for v in value]}
+    elif kind is frozenset:
+        return {'__frozenset__': [encode(v) for v in value]}
+    elif kind is Counter:
+        return {'__counter__': [[encode(k), encode(v)] for k, v in value.items()]}
+    raise TypeError("Can not save %r of type %s" % (value, kind.__name__))
+
+def decode_object(obj: dict):
+    """
+    Used as the json object_hook, so tagged objects are turned
+    back into their types as the json is parsed
+    """
+    if len(obj) == 1:
+        tag, contents = next(iter(obj.items()))
+        if tag == '__tuple__':
+            return tuple(contents)
+        elif tag == '__set__':
+            return set(contents)
+        elif tag == '__frozenset__':
+            return frozenset(contents)
+        elif tag == '__counter__':
+            return Counter(dict(contents))
+        elif tag == '__dict__':
+            return dict(contents)
+    return obj
+
+def encode_registry(entries: list, schema: tuple) -> list:
+    rows = []
+    for entry in entries:
+        if len(entry) == len(schema) and all(field in entry for field in schema):
+            rows.append([encode(entry[field]) for field in schema])
+        else:
+            rows.append(encode(entry))
+    return rows
+
+def decode_registry(rows: list, schema: list) -> list:
+    return [dict(zip(schema, row)) if type(row) is list else row for row in rows]
+
+def dumps(s_dict: dict) -> bytes:
+    """
+    Raises TypeError if something in s_dict can not be saved
+    """
+    registries = {}
+    schemas = {}
+    state = {}
+    for key, value in s_dict.items():
+        if key in SCHEMAS and type(value) is list:
+            schemas[key] = SCHEMAS[key]
+            registries[key] = encode_registry(value, SCHEMAS[key])
+        else:
+            state[key] = value
+    body = {'version': SAVE_VERSION,
+            'schemas': schemas,
+            'registries': registries,
+            'state': encode(state)}
+    data = json.dumps(body, separators=(',', ':')).encode('utf-8')
+    return MAGIC + HEADER.pack(SAVE_VERSION) + zlib.compress(data, COMPRESSION_LEVEL)
+
+def loads(data: bytes) -> dict:
+    """
+    Reads either format, and returns a save dict at the current version
+    """
+    if not data.startswith(MAGIC):
+        # Saved before versioning, so it must be an old pickle
+        return migrate(pickle.loads(data), 0)
+    version, = HEADER.unpack_from(data, len(MAGIC))
+    if version > SAVE_VERSION:
+        raise SaveFormatError("Save file is version %d, but this engine only reads up to version %d" % (version, SAVE_VERSION))
+    body = json.loads(zlib.decompress(data[len(MAGIC) + HEADER.size:]).decode('utf-8'), object_hook=decode_object)
+    s_dict = body['state']
+    for key, rows in body['registries'].items():
+        s_dict[key] = decode_registry(rows, body['schemas'][key])
+    return migrate(s_dict, version)
+
+def get_version(data: bytes) -> int:
+    if not data.startswith(MAGIC):
+        return 0
+    return HEADER.unpack_from(data, len(MAGIC))[0]
+
+MIGRATIONS = {}  # Version -> function that upgrades a save dict from that version to the next
+
+def migration(version: int):
+    def decorator(func):
+        MIGRATIONS[version] = func
+        return func
+    return decorator
+
+def migrate(s_dict: dict, version: int) -> dict:
+    while version < SAVE_VERSION:
+        s_dict = MIGRATIONS[version](s_dict)
+        version += 1
+    return s_dict
+
+@migration(0)
+def from_pickle(s_dict):
+    # Version 1 only changed how the save dict is written, not what is in it
+    return s_dict
@@ -279,7 +279,7 @@ class Controls(menus.Simple):
 
     def draw(self, surf, get_input=False):
         topleft = (8, 34)
-        bg_surf = base_surf.create_base_surf(self.get_menu_width(), self.get_menu_height(), self.background)
+        bg_surf = base_surf.get_base_surf(self.get_menu_width(), self.get_menu_height(), self.background)
         bg_surf = image_mods.make_translucent(bg_surf, .1)
         surf.blit(bg_surf, topleft)
 
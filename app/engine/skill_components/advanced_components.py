@@ -87,8 +87,10 @@ class CombatArtAllowedWeapons(SkillComponent):
         for item in item_funcs.get_all_items(unit):
             if item_funcs.available(unit, item):
                 try:
-                    if bool(evaluate.evaluate(self.value, unit, item=item)):
+                    if bool(evaluate.evaluate(self.value, unit, item=item, owner=self.skill)):
                         good_weapons.append(item)
+                except SyntaxError:  # Already reported
+                    pass
                 except:
                     print("Couldn't evaluate conditional: %s" % self.value)
         return good_weapons
@@ -188,7 +190,9 @@ class EmpowerHeal(SkillComponent):
     def empower_heal(self, unit, target):
         from app.engine import evaluate
         try:
-            return int(evaluate.evaluate(self.value, unit, target))
+            return int(evaluate.evaluate(self.value, unit, target, owner=self.skill))
+        except SyntaxError:  # Already reported
+            return 0
         except:
             print("Couldn't evaluate %s conditional" % self.value)
             return 0
@@ -62,7 +62,9 @@ class EvalDamage(SkillComponent):
     def modify_damage(self, unit, item):
         from app.engine import evaluate
         try:
-            return int(evaluate.evaluate(self.value, unit, item=item))
+            return int(evaluate.evaluate(self.value, unit, item=item, owner=self.skill))
+        except SyntaxError:  # Already reported
+            pass
         except:
             print("Couldn't evaluate %s conditional" % self.value)
         return 0 
@@ -15,9 +15,11 @@ class CombatCondition(SkillComponent):
     def pre_combat(self, playback, unit, item, target, mode):
         from app.engine import evaluate
         try:
-            x = bool(evaluate.evaluate(self.value, unit, target, item, mode=mode))
+            x = bool(evaluate.evaluate(self.value, unit, target, item, mode=mode, owner=self.skill))
             self._condition = x
             return x
+        except SyntaxError:  # Already reported
+            pass
         except Exception as e:
             print("%s: Could not evaluate combat condition %s" % (e, self.value))
 
@@ -46,6 +48,8 @@ class Condition(SkillComponent):
     def condition(self, unit):
         from app.engine import evaluate
         try:
-            return bool(evaluate.evaluate(self.value, unit))
+            return bool(evaluate.evaluate(self.value, unit, owner=self.skill))
+        except SyntaxError:  # Already reported
+            pass
         except Exception as e:
             print("%s: Could not evaluate condition %s" % (e, self.value))
@@ -11,7 +11,9 @@ class DynamicDamage(SkillComponent):
     def dynamic_damage(self, unit, item, target, mode) -> int:
         from app.engine import evaluate
         try:
-            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill))
+            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill, owner=self.skill))
+        except SyntaxError:  # Already reported
+            return 0
         except:
             print("Couldn't evaluate %s conditional" % self.value)
             return 0
@@ -26,7 +28,9 @@ class DynamicResist(SkillComponent):
     def dynamic_resist(self, unit, item, target, mode) -> int:
         from app.engine import evaluate
         try:
-            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill))
+            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill, owner=self.skill))
+        except SyntaxError:  # Already reported
+            return 0
         except:
             print("Couldn't evaluate %s conditional" % self.value)
             return 0
@@ -41,7 +45,9 @@ class DynamicAccuracy(SkillComponent):
     def dynamic_accuracy(self, unit, item, target, mode) -> int:
         from app.engine import evaluate
         try:
-            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill))
+            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill, owner=self.skill))
+        except SyntaxError:  # Already reported
+            return 0
         except:
             print("Couldn't evaluate %s conditional" % self.value)
             return 0
@@ -56,7 +62,9 @@ class DynamicAvoid(SkillComponent):
     def dynamic_avoid(self, unit, item, target, mode) -> int:
         from app.engine import evaluate
         try:
-            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill))
+            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill, owner=self.skill))
+        except SyntaxError:  # Already reported
+            return 0
         except:
             print("Couldn't evaluate %s conditional" % self.value)
             return 0
@@ -71,7 +79,9 @@ class DynamicCritAccuracy(SkillComponent):
     def dynamic_crit_accuracy(self, unit, item, target, mode) -> int:
         from app.engine import evaluate
         try:
-            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill))
+            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill, owner=self.skill))
+        except SyntaxError:  # Already reported
+            return 0
         except:
             print("Couldn't evaluate %s conditional" % self.value)
             return 0
@@ -86,7 +96,9 @@ class DynamicCritAvoid(SkillComponent):
     def dynamic_crit_avoid(self, unit, item, target, mode) -> int:
         from app.engine import evaluate
         try:
-            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill))
+            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill, owner=self.skill))
+        except SyntaxError:  # Already reported
+            return 0
         except:
             print("Couldn't evaluate %s conditional" % self.value)
             return 0
@@ -101,7 +113,9 @@ class DynamicAttackSpeed(SkillComponent):
     def dynamic_attack_speed(self, unit, item, target, mode) -> int:
         from app.engine import evaluate
         try:
-            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill))
+            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill, owner=self.skill))
+        except SyntaxError:  # Already reported
+            return 0
         except:
             print("Couldn't evaluate %s conditional" % self.value)
             return 0
@@ -116,7 +130,9 @@ class DynamicDefenseSpeed(SkillComponent):
     def dynamic_defense_speed(self, unit, item, target, mode) -> int:
         from app.engine import evaluate
         try:
-            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill))
+            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill, owner=self.skill))
+        except SyntaxError:  # Already reported
+            return 0
         except:
             print("Couldn't evaluate %s conditional" % self.value)
             return 0
@@ -131,7 +147,9 @@ class DynamicMultiattacks(SkillComponent):
     def dynamic_multiattacks(self, unit, item, target, mode) -> int:
         from app.engine import evaluate
         try:
-            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill))
+            return int(evaluate.evaluate(self.value, unit, target, item, mode=mode, skill=self.skill, owner=self.skill))
+        except SyntaxError:  # Already reported
+            return 0
         except:
             print("Couldn't evaluate %s conditional" % self.value)
             return 0
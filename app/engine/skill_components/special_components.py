@@ -40,7 +40,9 @@ class EmpowerHeal(SkillComponent):
     def empower_heal(self, unit, target):
         from app.engine import evaluate
         try:
-            return int(evaluate.evaluate(self.value, unit, target))
+            return int(evaluate.evaluate(self.value, unit, target, owner=self.skill))
+        except SyntaxError:  # Already reported
+            return 0
         except:
             print("Couldn't evaluate %s conditional" % self.value)
             return 0
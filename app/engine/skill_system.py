@@ -1,3 +1,7 @@
+import logging
+
+from app.engine.hook_index import get_hooks, get_components
+
 class Defaults():
     @staticmethod
     def can_select(unit) -> bool:
@@ -142,52 +146,43 @@ subcombat_event_hooks = ('after_hit', 'after_take_hit')
 item_event_hooks = ('on_add_item', 'on_remove_item', 'on_equip_item', 'on_unequip_item')
 
 def condition(skill, unit) -> bool:
-    for component in skill.components:
-        if component.defines('condition'):
-            if not component.condition(unit):
-                return False
+    for component in get_components(skill, 'condition'):
+        if not component.condition(unit):
+            return False
     return True
 
 for behaviour in default_behaviours:
     func = """def %s(unit):
-                  for skill in unit.skills:
-                      for component in skill.components:
-                          if component.defines('%s'):
-                              if component.ignore_conditional or condition(skill, unit):
-                                  return component.%s(unit)
+                  for skill, component in get_hooks(unit.skills, '%s'):
+                      if component.ignore_conditional or condition(skill, unit):
+                          return component.%s(unit)
                   return False""" \
         % (behaviour, behaviour, behaviour)
     exec(func)
 
 for behaviour in exclusive_behaviours:
     func = """def %s(unit):
-                  for skill in unit.skills:
-                      for component in skill.components:
-                          if component.defines('%s'):
-                              if component.ignore_conditional or condition(skill, unit):
-                                  return component.%s(unit)
+                  for skill, component in get_hooks(unit.skills, '%s'):
+                      if component.ignore_conditional or condition(skill, unit):
+                          return component.%s(unit)
                   return Defaults.%s(unit)""" \
         % (behaviour, behaviour, behaviour, behaviour)
     exec(func)
 
 for behaviour in targeted_behaviours:
     func = """def %s(unit1, unit2):
-                  for skill in unit1.skills:
-                      for component in skill.components:
-                          if component.defines('%s'):
-                              if component.ignore_conditional or condition(skill, unit1):
-                                  return component.%s(unit1, unit2)
+                  for skill, component in get_hooks(unit1.skills, '%s'):
+                      if component.ignore_conditional or condition(skill, unit1):
+                          return component.%s(unit1, unit2)
                   return Defaults.%s(unit1, unit2)""" \
         % (behaviour, behaviour, behaviour, behaviour)
     exec(func)
 
 for behaviour in item_behaviours:
     func = """def %s(unit, item):
-                  for skill in unit.skills:
-                      for component in skill.components:
-                          if component.defines('%s'):
-                              if component.ignore_conditional or condition(skill, unit):
-                                  return component.%s(unit, item)
+                  for skill, component in get_hooks(unit.skills, '%s'):
+                      if component.ignore_conditional or condition(skill, unit):
+                          return component.%s(unit, item)
                   return Defaults.%s(unit, item)""" \
         % (behaviour, behaviour, behaviour, behaviour)
     exec(func)
@@ -195,11 +190,9 @@ for behaviour in item_behaviours:
 for hook in modify_hooks:
     func = """def %s(unit, item):
                   val = 0
-                  for skill in unit.skills:
-                      for component in skill.components:
-                          if component.defines('%s'):
-                              if component.ignore_conditional or condition(skill, unit):
-                                  val += component.%s(unit, item)
+                  for skill, component in get_hooks(unit.skills, '%s'):
+                      if component.ignore_conditional or condition(skill, unit):
+                          val += component.%s(unit, item)
                   return val""" \
         % (hook, hook, hook)
     exec(func)
@@ -207,11 +200,9 @@ for hook in modify_hooks:
 for hook in dynamic_hooks:
     func = """def %s(unit, item, target, mode):
                   val = 0
-                  for skill in unit.skills:
-                      for component in skill.components:
-                          if component.defines('%s'):
-                              if component.ignore_conditional or condition(skill, unit):
-                                  val += component.%s(unit, item, target, mode)
+                  for skill, component in get_hooks(unit.skills, '%s'):
+                      if component.ignore_conditional or condition(skill, unit):
+                          val += component.%s(unit, item, target, mode)
                   return val""" \
         % (hook, hook, hook)
     exec(func)
@@ -219,50 +210,40 @@ for hook in dynamic_hooks:
 for hook in multiply_hooks:
     func = """def %s(unit, item, target, mode):
                   val = 1
-                  for skill in unit.skills:
-                      for component in skill.components:
-                          if component.defines('%s'):
-                              if component.ignore_conditional or condition(skill, unit):
-                                  val *= component.%s(unit, item, target, mode)
+                  for skill, component in get_hooks(unit.skills, '%s'):
+                      if component.ignore_conditional or condition(skill, unit):
+                          val *= component.%s(unit, item, target, mode)
                   return val""" \
         % (hook, hook, hook)
     exec(func)
 
 for hook in simple_event_hooks:
     func = """def %s(unit):
-                  for skill in unit.skills: 
-                      for component in skill.components:
-                          if component.defines('%s'):
-                              if component.ignore_conditional or condition(skill, unit):
-                                  component.%s(unit)""" \
+                  for skill, component in get_hooks(unit.skills, '%s'):
+                      if component.ignore_conditional or condition(skill, unit):
+                          component.%s(unit)""" \
         % (hook, hook, hook)
     exec(func)
 
 for hook in combat_event_hooks:
     func = """def %s(playback, unit, item, target, mode):
-                  for skill in unit.skills:
-                      for component in skill.components:
-                          if component.defines('%s'):
-                              if component.ignore_conditional or condition(skill, unit):
-                                  component.%s(playback, unit, item, target, mode)""" \
+                  for skill, component in get_hooks(unit.skills, '%s'):
+                      if component.ignore_conditional or condition(skill, unit):
+                          component.%s(playback, unit, item, target, mode)""" \
         % (hook, hook, hook)
     exec(func)
 
 for hook in subcombat_event_hooks:
     func = """def %s(actions, playback, unit, item, target, mode):
-                  for skill in unit.skills:
-                      for component in skill.components:
-                          if component.defines('%s'):
-                              component.%s(actions, playback, unit, item, target, mode)""" \
+                  for skill, component in get_hooks(unit.skills, '%s'):
+                      component.%s(actions, playback, unit, item, target, mode)""" \
         % (hook, hook, hook)
     exec(func)
 
 for hook in item_event_hooks:
     func = """def %s(unit, item):
-                  for skill in unit.skills:
-                      for component in skill.components:
-                          if component.defines('%s'):
-                              component.%s(unit, item)""" \
+                  for skill, component in get_hooks(unit.skills, '%s'):
+                      component.%s(unit, item)""" \
         % (hook, hook, hook)
     exec(func)
 
@@ -270,129 +251,140 @@ def available(unit, item) -> bool:
     """
     If any hook reports false, then it is false
     """
-    for skill in unit.skills:
-        for component in skill.components:
-            if component.defines('available'):
-                if component.ignore_conditional or condition(skill, unit):
-                    if not component.available(unit, item):
-                        return False
+    for skill, component in get_hooks(unit.skills, 'available'):
+        if component.ignore_conditional or condition(skill, unit):
+            if not component.available(unit, item):
+                return False
     return True
 
-def stat_change(unit, stat) -> int:
+# Set to True to check every cached stat bonus against one computed from scratch
+CHECK_STAT_CACHE = False
+
+def _uncached_stat_change(unit, stat) -> int:
     bonus = 0
-    for skill in unit.skills:
-        for component in skill.components:
-            if component.defines('stat_change'):
-                if component.ignore_conditional or condition(skill, unit):
-                    d = component.stat_change(unit)
-                    bonus += d.get(stat, 0)
+    for skill, component in get_hooks(unit.skills, 'stat_change'):
+        if component.ignore_conditional or condition(skill, unit):
+            d = component.stat_change(unit)
+            bonus += d.get(stat, 0)
+    return bonus
+
+def _build_stat_cache(unit, skills) -> tuple:
+    """
+    Sums the stat changes of every skill that applies unconditionally.
+    Skills with a condition are kept aside, since their condition
+    can depend on anything, and are checked every time
+    """
+    static_bonus = {}
+    conditional = []
+    for skill, component in get_hooks(skills, 'stat_change'):
+        if component.ignore_conditional or not get_components(skill, 'condition'):
+            for stat_nid, value in component.stat_change(unit).items():
+                static_bonus[stat_nid] = static_bonus.get(stat_nid, 0) + value
+        else:
+            conditional.append((skill, component))
+    return (skills, skills.version, static_bonus, tuple(conditional))
+
+def stat_change(unit, stat) -> int:
+    skills = unit.skills
+    cache = unit._stat_cache
+    if not cache or cache[0] is not skills or cache[1] != skills.version:
+        cache = unit._stat_cache = _build_stat_cache(unit, skills)
+    bonus = cache[2].get(stat, 0)
+    for skill, component in cache[3]:
+        if condition(skill, unit):
+            bonus += component.stat_change(unit).get(stat, 0)
+    if CHECK_STAT_CACHE:
+        true_bonus = _uncached_stat_change(unit, stat)
+        if bonus != true_bonus:
+            logging.error("Stat cache for %s is stale: %s is %s but should be %s", unit.nid, stat, bonus, true_bonus)
+            unit._stat_cache = None
+            return true_bonus
     return bonus
 
 def growth_change(unit, stat) -> int:
     bonus = 0
-    for skill in unit.skills:
-        for component in skill.components:
-            if component.defines('growth_change'):
-                if component.ignore_conditional or condition(skill, unit):
-                    d = component.growth_change(unit)
-                    bonus += d.get(stat, 0)
+    for skill, component in get_hooks(unit.skills, 'growth_change'):
+        if component.ignore_conditional or condition(skill, unit):
+            d = component.growth_change(unit)
+            bonus += d.get(stat, 0)
     return bonus
 
 def mana(playback, unit, item, target) -> int:
     mana = 0
-    for skill in unit.skills:
-        for component in skill.components:
-            if component.defines('mana'):
-                if component.ignore_conditional or condition(skill, unit):
-                    d = component.mana(playback, unit, item, target)
-                    mana += d
+    for skill, component in get_hooks(unit.skills, 'mana'):
+        if component.ignore_conditional or condition(skill, unit):
+            d = component.mana(playback, unit, item, target)
+            mana += d
     return mana
 
 def can_unlock(unit, region) -> bool:
-    for skill in unit.skills:
-        for component in skill.components:
-            if component.defines('can_unlock'):
-                if component.ignore_conditional or condition(skill, unit):
-                    if component.can_unlock(unit, region):
-                        return True
+    for skill, component in get_hooks(unit.skills, 'can_unlock'):
+        if component.ignore_conditional or condition(skill, unit):
+            if component.can_unlock(unit, region):
+                return True
     return False
 
 def on_upkeep(actions, playback, unit) -> tuple:  # actions, playback
-    for skill in unit.skills:
-        for component in skill.components:
-            if component.defines('on_upkeep'):
-                if component.ignore_conditional or condition(skill, unit):
-                    component.on_upkeep(actions, playback, unit)
+    for skill, component in get_hooks(unit.skills, 'on_upkeep'):
+        if component.ignore_conditional or condition(skill, unit):
+            component.on_upkeep(actions, playback, unit)
     return actions, playback
 
 def on_endstep(actions, playback, unit) -> tuple:  # actions, playback
-    for skill in unit.skills:
-        for component in skill.components:
-            if component.defines('on_endstep'):
-                if component.ignore_conditional or condition(skill, unit):
-                    component.on_endstep(actions, playback, unit)
+    for skill, component in get_hooks(unit.skills, 'on_endstep'):
+        if component.ignore_conditional or condition(skill, unit):
+            component.on_endstep(actions, playback, unit)
     return actions, playback
 
 def on_end_chapter(unit, skill):
-    for component in skill.components:
-        if component.defines('on_end_chapter'):
-            if component.ignore_conditional or condition(skill, unit):
-                component.on_end_chapter(unit, skill)
+    for component in get_components(skill, 'on_end_chapter'):
+        if component.ignore_conditional or condition(skill, unit):
+            component.on_end_chapter(unit, skill)
 
 def init(skill):
     """
     Initializes any data on the parent skill if necessary
     """
-    for component in skill.components:
-        if component.defines('init'):
-            component.init(skill)
+    for component in get_components(skill, 'init'):
+        component.init(skill)
 
 def on_add(unit, skill):
-    for component in skill.components:
-        if component.defines('on_add'):
-            component.on_add(unit, skill)
+    for component in get_components(skill, 'on_add'):
+        component.on_add(unit, skill)
     for other_skill in unit.skills:
-        for component in other_skill.components:
-            if component.defines('on_gain_skill'):
-                component.on_gain_skill(unit, skill)
+        for component in get_components(other_skill, 'on_gain_skill'):
+            component.on_gain_skill(unit, skill)
 
 def on_remove(unit, skill):
-    for component in skill.components:
-        if component.defines('on_remove'):
-            component.on_remove(unit, skill)
+    for component in get_components(skill, 'on_remove'):
+        component.on_remove(unit, skill)
 
 def re_add(unit, skill):
-    for component in skill.components:
-        if component.defines('re_add'):
-            component.re_add(unit, skill)
+    for component in get_components(skill, 're_add'):
+        component.re_add(unit, skill)
 
 def get_text(skill) -> str:
-    for component in skill.components:
-        if component.defines('text'):
-            return component.text()
+    for component in get_components(skill, 'text'):
+        return component.text()
     return None
 
 def get_cooldown(skill) -> float:
-    for component in skill.components:
-        if component.defines('cooldown'):
-            return component.cooldown()
+    for component in get_components(skill, 'cooldown'):
+        return component.cooldown()
     return None
 
 def trigger_charge(unit, skill):
-    for component in skill.components:
-        if component.defines('trigger_charge'):
-            component.trigger_charge(unit, skill)
+    for component in get_components(skill, 'trigger_charge'):
+        component.trigger_charge(unit, skill)
     return None
 
 def get_extra_abilities(unit):
     abilities = {}
-    for skill in unit.skills:
-        for component in skill.components:
-            if component.defines('extra_ability'):
-                if component.ignore_conditional or condition(skill, unit):
-                    new_item = component.extra_ability(unit)
-                    ability_name = new_item.name
-                    abilities[ability_name] = new_item
+    for skill, component in get_hooks(unit.skills, 'extra_ability'):
+        if component.ignore_conditional or condition(skill, unit):
+            new_item = component.extra_ability(unit)
+            ability_name = new_item.name
+            abilities[ability_name] = new_item
     return abilities
 
 def get_combat_arts(unit):
@@ -436,12 +428,9 @@ def get_combat_arts(unit):
     return combat_arts
 
 def activate_combat_art(unit, skill):
-    for component in skill.components:
-        if component.defines('on_activation'):
-            component.on_activation(unit)
+    for component in get_components(skill, 'on_activation'):
+        component.on_activation(unit)
 
 def deactivate_all_combat_arts(unit):
-    for skill in unit.skills:
-        for component in skill.components:
-            if component.defines('on_deactivation'):
-                component.on_deactivation(unit)
+    for skill, component in get_hooks(unit.skills, 'on_deactivation'):
+        component.on_deactivation(unit)
@@ -1,34 +1,127 @@
 import os
+from collections import OrderedDict
+
 import pygame
 
 from app.utilities import utils
 from app.resources.resources import RESOURCES
 from app.engine import engine
+from app.engine import config as cf
 
 import logging
 
+def sound_size(sound) -> int:
+    """
+    Bytes of decoded PCM held by a pygame Sound
+    """
+    freq, fmt, channels = pygame.mixer.get_init()
+    return int(sound.get_length() * freq) * channels * (abs(fmt) // 8)
+
 class Song():
+    """
+    A music track along with its optional battle and intro tracks.
+    The tracks are only decoded the first time they are needed, and
+    can be unloaded again by the MusicDict to stay within its budget
+    """
     def __init__(self, prefab):
         self.nid = prefab.nid
-        self.song = pygame.mixer.Sound(prefab.full_path)
-        self.battle = pygame.mixer.Sound(prefab.battle_full_path) if prefab.battle_full_path else None
-        self.intro = pygame.mixer.Sound(prefab.intro_full_path) if prefab.intro_full_path else None
+        self.full_path = prefab.full_path
+        self.battle_full_path = prefab.battle_full_path
+        self.intro_full_path = prefab.intro_full_path
+
+        self.loaded = False
+        self.size = 0  # Bytes of decoded audio, once loaded
+        self._song = None
+        self._battle = None
+        self._intro = None
 
         self.channel = None
 
+    def load(self):
+        if not self.loaded:
+            self._song = pygame.mixer.Sound(self.full_path)
+            self._battle = pygame.mixer.Sound(self.battle_full_path) if self.battle_full_path else None
+            self._intro = pygame.mixer.Sound(self.intro_full_path) if self.intro_full_path else None
+            self.size = sum(sound_size(sound) for sound in (self._song, self._battle, self._intro) if sound)
+            self.loaded = True
+
+    def unload(self):
+        self._song = None
+        self._battle = None
+        self._intro = None
+        self.loaded = False
+
+    def in_use(self) -> bool:
+        return bool(self.channel and self.channel.current_song is self)
+
+    @property
+    def song(self):
+        self.load()
+        return self._song
+
+    @property
     def battle(self):
-        return self.battle
+        self.load()
+        return self._battle
+
+    @property
+    def intro(self):
+        self.load()
+        return self._intro
+
+class MusicDict(OrderedDict):
+    """
+    Keeps a Song for every music prefab that has been asked for,
+    ordered from least to most recently used.
+    Decoded audio is kept within budget bytes by unloading the least
+    recently used songs that are not currently on a channel.
+    Without a budget of its own, it follows the music_budget setting
+    """
+    def __init__(self, budget=None):
+        super().__init__()
+        self._budget = budget
+
+    @property
+    def budget(self) -> int:
+        if self._budget is None:
+            # Decoded music is roughly ten times the size of the ogg it came from
+            return cf.SETTINGS['music_budget'] * 1024 * 1024
+        return self._budget
+
+    def set_budget(self, budget):
+        self._budget = budget
+        self.trim()
+
+    def memory_used(self) -> int:
+        return sum(song.size for song in list(self.values()) if song.loaded)
+
+    def trim(self):
+        used = self.memory_used()
+        # Never unload the most recently used song
+        for song in list(self.values())[:-1]:
+            if used <= self.budget:
+                break
+            if song.loaded and not song.in_use():
+                logging.debug("Unloading %s from MusicDict", song.nid)
+                used -= song.size
+                song.unload()
 
-class MusicDict(dict):
     def preload(self, nids):
         for nid in nids:
             self.get(nid)
 
     def full_preload(self):
+        """
+        Decodes songs ahead of time until the budget is filled
+        """
         try:
             for prefab in RESOURCES.music:
                 if prefab.nid not in self and os.path.exists(prefab.full_path):
                     self[prefab.nid] = Song(prefab)
+            for song in list(self.values()):
+                if self.memory_used() >= self.budget:
+                    break
+                song.load()
         except pygame.error as e:
             logging.warning(e)
 
@@ -43,7 +136,11 @@ class MusicDict(dict):
                 self[val] = Song(prefab)
             else:
                 return None
-        return self[val]
+        self.move_to_end(val)
+        song = self[val]
+        song.load()
+        self.trim()
+        return song
 
 class SoundDict(dict):
     def get(self, val):
@@ -523,6 +620,7 @@ class SoundController():
         # for >20 seconds. If you do it on the fly, you get 500 ms hiccups everytime
         # you load a new sound.
         # Threading solves these issues
+        # The preload stops once the music budget is filled
         # WARNING: I have no thread locks at all on the music dictionary
         # It *might* be possible for both threads to try to touch the music dictionary
         # at the same time and break everything
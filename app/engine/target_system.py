@@ -1,28 +1,51 @@
+from functools import lru_cache
+
 from app.utilities import utils
 from app.data.database import DB
 from app.engine import pathfinding, skill_system, equations, \
     item_funcs, item_system, line_of_sight
 from app.engine.game_state import game
 
-# Consider making these sections faster
+@lru_cache(maxsize=256)
+def get_manhattan_offsets(min_range: int, max_range: int) -> tuple:
+    """
+    Returns the (dx, dy) offsets of every tile whose manhattan distance
+    from the origin is between min_range and max_range inclusive
+    """
+    offsets = []
+    for r in range(max(min_range, 0), max_range + 1):
+        if r == 0:
+            offsets.append((0, 0))
+            continue
+        # Finds manhattan ring of radius r
+        for i in range(-r, r + 1):
+            magn = abs(i)
+            offsets.append((i, r - magn))
+            if r != magn:
+                offsets.append((i, -r + magn))
+    return tuple(offsets)
+
+def _get_offsets(rng) -> tuple:
+    if not rng:
+        return ()
+    min_range, max_range = min(rng), max(rng)
+    if len(rng) == max_range - min_range + 1:  # Contiguous, like nearly every item range
+        return get_manhattan_offsets(min_range, max_range)
+    offsets = []
+    for r in rng:
+        offsets += get_manhattan_offsets(r, r)
+    return offsets
+
 def get_shell(valid_moves: set, potential_range: set, width: int, height: int) -> set:
-    valid_attacks = set()
-    for valid_move in valid_moves:
-        valid_attacks |= find_manhattan_spheres(potential_range, valid_move[0], valid_move[1])
-    return {pos for pos in valid_attacks if 0 <= pos[0] < width and 0 <= pos[1] < height}
+    """
+    Dilates the valid moves by the potential range, clipped to the map
+    """
+    offsets = _get_offsets(potential_range)
+    return {(x + dx, y + dy) for (x, y) in valid_moves for (dx, dy) in offsets
+            if 0 <= x + dx < width and 0 <= y + dy < height}
 
-# Consider making these sections faster -- use memory?
 def find_manhattan_spheres(rng: set, x: int, y: int) -> set:
-    _range = range
-    _abs = abs
-    main_set = set()
-    for r in rng:
-        # Finds manhattan spheres of radius r
-        for i in _range(-r, r + 1):
-            magn = _abs(i)
-            main_set.add((x + i, y + r - magn))
-            main_set.add((x + i, y - r + magn))
-    return main_set
+    return {(x + dx, y + dy) for (dx, dy) in _get_offsets(rng)}
 
 def get_nearest_open_tile(unit, position):
     r = 0
@@ -42,7 +65,7 @@ def get_nearest_open_tile(unit, position):
 def distance_to_closest_enemy(unit, pos=None):
     if pos is None:
         pos = unit.position
-    enemy_list = [u for u in game.units if u.position and skill_system.check_enemy(u, unit)]
+    enemy_list = [u for u in game.unit_index.query(on_map=True) if skill_system.check_enemy(u, unit)]
     if not enemy_list:
         return 100  # No enemies
     dist_list = [utils.calculate_distance(enemy.position, pos) for enemy in enemy_list]
@@ -127,26 +150,38 @@ def get_valid_moves(unit, force=False) -> set:
         return set()
 
     mtype = game.movement.get_movement_group(unit)
-    grid = game.board.get_grid(mtype)
-    width, height = game.tilemap.width, game.tilemap.height
     pass_through = skill_system.pass_through(unit)
     ai_fog_of_war = DB.constants.value('ai_fog_of_war')
-    pathfinder = pathfinding.Djikstra(unit.position, grid, width, height, unit.team, pass_through, ai_fog_of_war)
-
     movement_left = equations.parser.movement(unit) if force else unit.movement_left
 
-    valid_moves = pathfinder.process(game.board, movement_left)
-    valid_moves.add(unit.position)
-    return valid_moves
+    # Movement only changes when the board does, so reuse the last answer
+    # until the board's version is incremented
+    if unit.team == 'player' or ai_fog_of_war:
+        fog_key = (game.level_vars.get('_fog_of_war'), game.level_vars.get('_fog_of_war_radius'),
+                   game.level_vars.get('_ai_fog_of_war_radius'))
+    else:
+        fog_key = None
+    key = (unit.nid, unit.position, mtype, unit.team, movement_left, 
+           pass_through, ai_fog_of_war, fog_key, game.board.version)
+    valid_moves = game.board.reachability_cache.get(key)
+    if valid_moves is None:
+        grid = game.board.get_cost_grid(mtype)
+        width, height = game.tilemap.width, game.tilemap.height
+        pathfinder = pathfinding.ArrayDjikstra(unit.position, grid, width, height, unit.team, pass_through, ai_fog_of_war)
+
+        valid_moves = pathfinder.process(game.board, movement_left)
+        valid_moves.add(unit.position)
+        game.board.reachability_cache[key] = valid_moves
+    return set(valid_moves)
 
 def get_path(unit, position, ally_block=False) -> list:
     mtype = game.movement.get_movement_group(unit)
-    grid = game.board.get_grid(mtype)
+    grid = game.board.get_cost_grid(mtype)
 
     width, height = game.tilemap.width, game.tilemap.height
     pass_through = skill_system.pass_through(unit)
     ai_fog_of_war = DB.constants.value('ai_fog_of_war')
-    pathfinder = pathfinding.AStar(unit.position, position, grid, width, height, unit.team, pass_through, ai_fog_of_war)
+    pathfinder = pathfinding.ArrayAStar(unit.position, position, grid, width, height, unit.team, pass_through, ai_fog_of_war)
 
     path = pathfinder.process(game.board, ally_block=ally_block)
     if path is None:
@@ -183,7 +218,7 @@ def travel_algorithm(path, moves, unit, grid):
             break
     # Don't move where a unit already is, and don't make through path < 0
     # Lower the through path by one, cause we can't move that far
-    while through_path > 0 and any(other_unit.position == path[-(through_path + 1)] for other_unit in game.units if unit is not other_unit):
+    while through_path > 0 and any(other_unit is not unit for other_unit in game.get_units_at(path[-(through_path + 1)])):
         through_path -= 1
     return path[-(through_path + 1)]  # Travel as far as we can
 
@@ -63,6 +63,33 @@ class ActionLog():
         action.execute()
         return action
 
+    def seek(self, index):
+        """
+        Runs actions backward or forward until action_index is index.
+        Enemy attack ranges are only worked out once at the end, rather
+        than after every action, since that is most of the cost of
+        running a move.
+        Returns the last action run
+        """
+        action = None
+        if index == self.action_index:
+            return action
+        game.boundary.defer()
+        try:
+            while self.action_index > index:
+                action = self.run_action_backward()
+            while self.action_index < index:
+                action = self.run_action_forward()
+        finally:
+            game.boundary.undefer()
+        return action
+
+    def run_backward_to(self, index):
+        return self.seek(min(index, self.action_index))
+
+    def run_forward_to(self, index):
+        return self.seek(max(index, self.action_index))
+
     def at_far_past(self):
         return not self.actions or self.action_index <= self.first_free_action
 
@@ -151,8 +178,7 @@ class ActionLog():
 
         if isinstance(self.current_move, self.Move):
             if self.current_unit:
-                while self.action_index >= self.current_move.begin:
-                    action = self.run_action_backward()
+                action = self.run_backward_to(self.current_move.begin - 1)
                 game.cursor.set_pos(self.current_unit.position)
                 self.current_unit = None
                 return []
@@ -161,8 +187,7 @@ class ActionLog():
                     self.hover_off()
                 self.current_unit = self.current_move.unit
                 if self.current_move.end:
-                    while self.action_index > self.current_move.end:
-                        action = self.run_action_backward()
+                    action = self.run_backward_to(self.current_move.end)
                     prev_action = None
                     if self.action_index >= 1:
                         prev_action = self.actions[self.action_index]
@@ -179,15 +204,13 @@ class ActionLog():
                     logging.debug("In Backward %s %s %s %s", text_list, self.current_unit.nid, self.current_unit.position, prev_action)
                     return text_list
                 else:
-                    while self.action_index >= self.current_move.begin:
-                        action = self.run_action_backward()
+                    action = self.run_backward_to(self.current_move.begin - 1)
                     game.cursor.set_pos(self.current_unit.position)
                     self.hover_on(self.current_unit)
                     return []
 
         elif self.current_move[0] == 'Phase':
-            while self.action_index > self.current_move[1]:
-                action = self.run_action_backward()
+            action = self.run_backward_to(self.current_move[1])
             if self.hovered_unit:
                 self.hover_off()
             if self.current_move[2] == 'player':
@@ -195,14 +218,12 @@ class ActionLog():
             return ["Start of %s phase" % self.current_move[2].capitalize()]
 
         elif self.current_move[0] == 'Lock':
-            while self.action_index >= self.current_move[1]:
-                action = self.run_action_backward()
+            action = self.run_backward_to(self.current_move[1] - 1)
             self.locked = self.get_last_lock()
             return self.backward()  # Go again
 
         elif self.current_move[0] == 'Extra':
-            while self.action_index >= self.current_move[1]:
-                action = self.run_action_backward()
+            action = self.run_backward_to(self.current_move[1] - 1)
             return self.backward()  # Go again
 
     def forward(self):
@@ -216,8 +237,7 @@ class ActionLog():
 
         if isinstance(self.current_move, self.Move):
             if self.current_unit:
-                while self.action_index < self.current_move.end:
-                    action = self.run_action_forward()
+                action = self.run_forward_to(self.current_move.end)
                 if self.current_unit.position:
                     game.cursor.set_pos(self.current_unit.position)
                 elif isinstance(action, Action.Die):
@@ -235,17 +255,15 @@ class ActionLog():
                 if self.hovered_unit:
                     self.hover_off()
                 self.current_unit = self.current_move.unit
-                while self.action_index < self.current_move.begin - 1:
-                    # Does next action, so -1 is necessary
-                    action = self.run_action_forward()
+                # Does next action, so -1 is necessary
+                action = self.run_forward_to(self.current_move.begin - 1)
                 game.cursor.set_pos(self.current_unit.position)
                 self.hover_on(self.current_unit)
                 self.current_move_index -= 1  # Make sure we don't skip second half of this
                 return []
 
         elif self.current_move[0] == 'Phase':
-            while self.action_index < self.current_move[1]:
-                action = self.run_action_forward()
+            action = self.run_forward_to(self.current_move[1])
             if self.hovered_unit:
                 self.hover_off()
             if self.current_move[2] == 'player':
@@ -253,14 +271,12 @@ class ActionLog():
             return ["Start of %s phase" % self.current_move[2].capitalize()]
 
         elif self.current_move[0] == 'Lock':
-            while self.action_index < self.current_move[1]:
-                action = self.run_action_forward()
+            action = self.run_forward_to(self.current_move[1])
             self.locked = self.current_move[2]
             return self.forward()  # Go again
 
         elif self.current_move[0] == 'Extra':
-            while self.action_index < self.current_move[1]:
-                action = self.run_action_forward()
+            action = self.run_forward_to(self.current_move[1])
             return []
 
     def finalize(self):
@@ -279,8 +295,7 @@ class ActionLog():
         self.current_unit = None
         if self.hovered_unit:
             self.hover_off()
-        while not self.at_far_future():
-            self.run_action_forward()
+        self.run_forward_to(len(self.actions) - 1)
 
     def get_last_lock(self):
         cur_index = self.action_index
@@ -328,6 +343,27 @@ class ActionLog():
         if self.first_free_action == -1:
             logging.debug("*** First Free Action ***")
             self.first_free_action = self.action_index
+            self.compact()
+
+    def compact(self) -> int:
+        """
+        The turnwheel can never go back past the first free action,
+        so the actions before it will never be reversed or executed
+        again. Drops them, except the last phase marker, which
+        get_current_phase still looks for.
+        Returns the number of actions removed
+        """
+        if self.first_free_action <= 0:
+            return 0
+        old_actions = self.actions[:self.first_free_action]
+        kept = [action for action in old_actions if isinstance(action, Action.MarkPhase)][-1:]
+        removed = len(old_actions) - len(kept)
+        if removed:
+            logging.debug("Compacting %d actions before the first free action", removed)
+            self.actions = kept + self.actions[self.first_free_action:]
+            self.first_free_action -= removed
+            self.action_index -= removed
+        return removed
 
     def hover_on(self, unit):
         game.cursor.set_turnwheel_sprite()
@@ -347,6 +383,7 @@ class ActionLog():
         for name, action in actions:
             self.append(getattr(Action, name).restore(action))
         self.first_free_action = first_free_action
+        self.compact()
         return self
 
 class TurnwheelDisplay():
@@ -405,7 +442,7 @@ class TurnwheelDisplay():
         # Unit Count
         count_bg = base_surf.create_base_surf(48, 24)
         count_bg = image_mods.make_translucent(count_bg, .1)
-        player_units = [unit for unit in game.units if unit.team == 'player' and unit.position]
+        player_units = game.unit_index.query(team='player', on_map=True)
         unused_units = [unit for unit in player_units if not unit.finished]
         count_str = str(len(unused_units)) + "/" + str(len(player_units))
         count_width = FONT['text-blue'].width(count_str)
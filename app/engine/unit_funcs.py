@@ -177,6 +177,7 @@ def apply_stat_changes(unit, stat_changes: dict):
     # Actually apply changes
     for nid, value in stat_changes.items():
         unit.stats[nid] += value
+    unit.clear_stat_cache()
 
     current_max_hp = unit.get_max_hp()
     current_max_mana = unit.get_max_mana()
@@ -0,0 +1,162 @@
+"""
+Query index over the units in the game's unit registry.
+
+`game.units` and the get_*_units functions used to build a list of
+every registered unit and filter it on each call. Instead, the index
+keeps the registered units in buckets by team, by party, on the map
+or off it, and by position. A query only looks at the smallest bucket
+that can answer it.
+
+UnitObject's position, team and party setters tell the index whenever
+they change, so every action that moves a unit, or changes its team
+or party, keeps the buckets up to date. When the registry itself is
+replaced, as when loading a save or cleaning up after a level, call
+`rebuild`. `check` compares the buckets against the units' current
+attributes, for use in tests.
+
+Query results are always in registry order, the order of game.units,
+so a query gives the same order as the scan over game.units it
+replaces. get_player_units used to follow the order of the level's
+units and now follows registry order too.
+"""
+
+class UnitIndex():
+    def __init__(self):
+        # Key: Unit Nid, Value: Unit, in registry order
+        self.units = {}
+        # Key: Unit Nid, Value: place in the registry
+        self.order = {}
+        self.next_order = 0
+        self._all = ()
+
+        # Key: Team, Value: {Unit Nid: Unit}
+        self.teams = {}
+        # Key: Party, Value: {Unit Nid: Unit}
+        self.parties = {}
+        self.on_map = {}
+        self.off_map = {}
+        # Key: Position, Value: {Unit Nid: Unit}
+        self.positions = {}
+
+    def rebuild(self, unit_registry: dict):
+        for unit in self.units.values():
+            unit._index = None
+        self.__init__()
+        for unit in unit_registry.values():
+            self.add(unit)
+
+    def add(self, unit):
+        old_unit = self.units.get(unit.nid)
+        if old_unit is unit:
+            return
+        elif old_unit:
+            self.remove(old_unit)
+        self._insert(unit)
+        unit._index = self
+
+    def _insert(self, unit):
+        self.units[unit.nid] = unit
+        if unit.nid not in self.order:
+            self.order[unit.nid] = self.next_order
+            self.next_order += 1
+            self._all = self._all + (unit,)
+        else:
+            self._all = tuple(sorted(self.units.values(), key=lambda unit: self.order[unit.nid]))
+        self._add_to(self.teams, unit.team, unit)
+        self._add_to(self.parties, unit.party, unit)
+        self._place(unit, unit.position)
+
+    def remove(self, unit):
+        if self.units.get(unit.nid) is not unit:
+            return
+        del self.units[unit.nid]
+        unit._index = None
+        self._all = tuple(other for other in self._all if other is not unit)
+        self._remove_from(self.teams, unit.team, unit)
+        self._remove_from(self.parties, unit.party, unit)
+        self._unplace(unit, unit.position)
+
+    def _add_to(self, buckets, key, unit):
+        if key not in buckets:
+            buckets[key] = {}
+        buckets[key][unit.nid] = unit
+
+    def _remove_from(self, buckets, key, unit):
+        bucket = buckets.get(key)
+        if bucket is not None:
+            bucket.pop(unit.nid, None)
+            if not bucket:
+                del buckets[key]
+
+    def _place(self, unit, position):
+        if position:
+            self.on_map[unit.nid] = unit
+            self._add_to(self.positions, tuple(position), unit)
+        else:
+            self.off_map[unit.nid] = unit
+
+    def _unplace(self, unit, position):
+        if position:
+            self.on_map.pop(unit.nid, None)
+            self._remove_from(self.positions, tuple(position), unit)
+        else:
+            self.off_map.pop(unit.nid, None)
+
+    # Called by UnitObject's setters
+    def move(self, unit, old_position, new_position):
+        self._unplace(unit, old_position)
+        self._place(unit, new_position)
+
+    def change_team(self, unit, old_team, new_team):
+        self._remove_from(self.teams, old_team, unit)
+        self._add_to(self.teams, new_team, unit)
+
+    def change_party(self, unit, old_party, new_party):
+        self._remove_from(self.parties, old_party, unit)
+        self._add_to(self.parties, new_party, unit)
+
+    # Queries
+    def all_units(self) -> tuple:
+        return self._all
+
+    def query(self, team=None, party=None, on_map=None, position=None) -> list:
+        """
+        Returns the units that match every criterion given, in registry order.
+        on_map is True for units with a position, False for units without one
+        """
+        buckets = []
+        if team is not None:
+            buckets.append(self.teams.get(team, {}))
+        if party is not None:
+            buckets.append(self.parties.get(party, {}))
+        if on_map is not None:
+            buckets.append(self.on_map if on_map else self.off_map)
+        if position is not None:
+            buckets.append(self.positions.get(tuple(position), {}))
+        if not buckets:
+            return list(self._all)
+        buckets.sort(key=len)
+        smallest, others = buckets[0], buckets[1:]
+        if len(smallest) * 4 > len(self._all):
+            # Sorting would cost more than walking every unit in order
+            units = [unit for unit in self._all if unit.nid in smallest]
+        else:
+            order = self.order
+            units = sorted(smallest.values(), key=lambda unit: order[unit.nid])
+        for bucket in others:
+            units = [unit for unit in units if unit.nid in bucket]
+        return units
+
+    def check(self, unit_registry: dict):
+        """
+        Raises AssertionError if the index does not match unit_registry
+        and the units' current attributes
+        """
+        assert all(unit._index is self for unit in self.units.values()), "Units do not point to this index"
+        expected = UnitIndex()
+        for unit in unit_registry.values():
+            expected._insert(unit)
+        assert self.units == expected.units, "Registered units do not match"
+        assert self._all == expected._all, "Unit order does not match"
+        for name in ('teams', 'parties', 'on_map', 'off_map', 'positions'):
+            assert getattr(self, name) == getattr(expected, name), "%s do not match" % name
@@ -1,4 +1,5 @@
 import math
+from collections import OrderedDict
 
 from app.constants import TILEWIDTH, TILEHEIGHT, COLORKEY
 from app.data.palettes import gray_colors, enemy_colors, other_colors, enemy2_colors, black_colors
@@ -58,6 +59,63 @@ class MapSprite():
             engine.set_colorkey(img, COLORKEY, rleaccel=True)
         return imgs
 
+# Animated effects are snapped to this many levels, so they can be cached
+EFFECT_STEPS = 16
+# How much memory the effect cache can hold before it starts throwing away frames
+EFFECT_BUDGET = 8 * 1024 * 1024
+
+def quantize(t):
+    return round(utils.clamp(t, 0, 1) * EFFECT_STEPS) / EFFECT_STEPS
+
+def apply_effects(image, effects):
+    for effect, value in effects:
+        if effect == 'scale':
+            image = engine.transform_scale(image, value)
+        elif effect == 'translucent':
+            image = image_mods.make_translucent(image.convert_alpha(), value)
+        elif effect == 'add':
+            image = image_mods.add_tint(image.convert_alpha(), value)
+        elif effect == 'sub':
+            image = image_mods.sub_tint(image.convert_alpha(), value)
+        elif effect == 'color':
+            image = image_mods.change_color(image.convert_alpha(), value)
+    return image
+
+class EffectCache():
+    """
+    Holds map sprite frames with their tints and translucency already applied.
+    Least recently used frames are thrown away once over budget
+    """
+    def __init__(self, budget=EFFECT_BUDGET):
+        self.budget = budget
+        self.images = OrderedDict()  # Key: (map sprite, state, frame, effects), Value: (image, bytes)
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, image, effects):
+        if key in self.images:
+            self.hits += 1
+            self.images.move_to_end(key)
+            return self.images[key][0]
+        self.misses += 1
+        image = apply_effects(image, effects)
+        num_bytes = image.get_width() * image.get_height() * image.get_bytesize()
+        self.images[key] = (image, num_bytes)
+        self.size += num_bytes
+        while self.size > self.budget and len(self.images) > 1:
+            _, (_, old_bytes) = self.images.popitem(last=False)
+            self.size -= old_bytes
+            self.evictions += 1
+        return image
+
+    def clear(self):
+        self.images.clear()
+        self.size = 0
+
+EFFECT_CACHE = EffectCache()
+
 def load_map_sprite(unit, team='player'):
     klass = DB.classes.get(unit.klass)
     nid = klass.map_sprite_nid
@@ -341,24 +399,31 @@ class UnitSprite():
             elif self.transition_state == 'swoosh_move':
                 self.set_transition('swoosh_in')
 
-    def select_frame(self, image, state):
+    def get_frame_index(self, state):
         if self.unit.is_dying:
-            return image[0].copy()
+            return 0
         elif state == 'passive' or state == 'gray':
-            return image[game.map_view.passive_sprite_counter.count].copy()
+            return game.map_view.passive_sprite_counter.count
         elif state == 'active':
-            return image[game.map_view.active_sprite_counter.count].copy()
+            return game.map_view.active_sprite_counter.count
         elif state == 'combat_anim':
-            return image[game.map_view.fast_move_sprite_counter.count].copy()
+            return game.map_view.fast_move_sprite_counter.count
         else:
-            return image[game.map_view.move_sprite_counter.count].copy()
+            return game.map_view.move_sprite_counter.count
 
-    def create_image(self, state):
+    def select_frame(self, image, state):
+        return image[self.get_frame_index(state)].copy()
+
+    def get_state(self, state):
         if not self.map_sprite:  # This shouldn't happen, but if it does...
             res = RESOURCES.map_sprites[0]
             self.map_sprite = MapSprite(res, self.unit.team)
         if self.transition_state == 'swoosh_in':
             state = 'down'
+        return state
+
+    def create_image(self, state):
+        state = self.get_state(state)
         image = getattr(self.map_sprite, state)
         image = self.select_frame(image, state)
         return image
@@ -374,7 +439,11 @@ class UnitSprite():
 
     def draw(self, surf, cull_rect):
         current_time = engine.get_time()
-        image = self.create_image(self.image_state)
+        state = self.get_state(self.image_state)
+        frame_index = self.get_frame_index(state)
+        image = getattr(self.map_sprite, state)[frame_index]
+        # Effects are applied in order to the frame, and the result is cached
+        effects = []
         left, top = self.get_topleft(cull_rect)
 
         anim_top = top
@@ -390,27 +459,27 @@ class UnitSprite():
 
         # Handle transitions
         if self.transition_state in ('fade_out', 'warp_out', 'swoosh_out', 'fade_move', 'warp_move', 'swoosh_move'):
-            progress = utils.clamp((self.transition_time - self.transition_counter) / self.transition_time, 0, 1)
+            progress = quantize((self.transition_time - self.transition_counter) / self.transition_time)
             # Distort Vertically
             if self.transition_state in ('swoosh_out', 'swoosh_move'):
                 cur_width, cur_height = image.get_width(), image.get_height()
                 new_width, new_height = cur_width, int(cur_height * (max(0, progress - 0.4) * 3 + 1))
                 extra_height = new_height - cur_height
-                image = engine.transform_scale(image, (new_width, new_height))
+                effects.append(('scale', (new_width, new_height)))
                 top -= extra_height
-            image = image_mods.make_translucent(image.convert_alpha(), progress)
+            effects.append(('translucent', progress))
 
         elif self.transition_state in ('fade_in', 'warp_in', 'swoosh_in'):
-            progress = utils.clamp((self.transition_time - self.transition_counter) / self.transition_time, 0, 1)
+            progress = quantize((self.transition_time - self.transition_counter) / self.transition_time)
             progress = 1 - progress
             if self.transition_state == 'swoosh_in':
                 # Distort Vertically
                 cur_width, cur_height = image.get_width(), image.get_height()
                 new_width, new_height = cur_width, int(cur_height * (max(0, progress - 0.4) * 3 + 1))
                 extra_height = new_height - cur_height
-                image = engine.transform_scale(image, (new_width, new_height))
+                effects.append(('scale', (new_width, new_height)))
                 top -= extra_height
-            image = image_mods.make_translucent(image.convert_alpha(), progress)
+            effects.append(('translucent', progress))
 
         for flicker in self.flicker[:]:
             starting_time, total_time, color, direction, fade_out = flicker
@@ -420,14 +489,13 @@ class UnitSprite():
                     continue
                 if fade_out:
                     time_passed = engine.get_time() - starting_time
-                    color = tuple((total_time - time_passed) * float(c) // total_time for c in color)
-                if direction == 'add':
-                    image = image_mods.add_tint(image.convert_alpha(), color)
-                elif direction == 'sub':
-                    image = image_mods.sub_tint(image.convert_alpha(), color)
+                    fade = quantize((total_time - time_passed) / total_time)
+                    color = tuple(int(fade * c) for c in color)
+                if direction in ('add', 'sub'):
+                    effects.append((direction, tuple(color)))
 
         if not self.flicker and game.boundary.draw_flag and self.unit.nid in game.boundary.displaying_units:
-            image = image_mods.change_color(image.convert_alpha(), (60, 0, 0))
+            effects.append(('color', (60, 0, 0)))
 
         if game.action_log.hovered_unit is self.unit:
             length = 200
@@ -435,16 +503,20 @@ class UnitSprite():
                 diff = current_time % length
                 if diff > length // 2:
                     diff = length - diff
-                diff = utils.clamp(255. * diff / length * 2, 0, 255)
+                diff = 255 * quantize(diff / length * 2)
                 color = (0, int(diff * .5), 0)  # Tint image green at magnitude depending on diff
-                image = image_mods.change_color(image.convert_alpha(), color)
+                effects.append(('color', color))
 
         for flicker_tint in self.flicker_tint:
             color, period, width = flicker_tint
             diff = utils.model_wave(current_time, period, width)
-            diff = utils.clamp(diff, 0, 1)
+            diff = quantize(diff)
             color = tuple([int(c * diff) for c in color])
-            image = image_mods.add_tint(image.convert_alpha(), color)
+            effects.append(('add', color))
+
+        if effects:
+            key = (self.map_sprite, state, frame_index, tuple(effects))
+            image = EFFECT_CACHE.get(key, image, effects)
 
         # Each image has (self.image.get_width() - 32)//2 buggers on the
         # left and right of it, to handle any off tile spriting
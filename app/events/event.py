@@ -228,7 +228,7 @@ class Event():
             logging.info('%s: %s', command.nid, command.values)
             if not self.if_stack or self.if_stack[-1]:
                 try:
-                    truth = bool(evaluate.evaluate(command.values[0], self.unit, self.unit2, self.item, self.position, self.region))
+                    truth = bool(evaluate.evaluate(command.values[0], self.unit, self.unit2, self.item, self.position, self.region, owner=self.nid))
                 except Exception as e:
                     logging.error("%s: Could not evaluate {%s}" % (e, command.values[0]))
                     truth = False
@@ -247,7 +247,7 @@ class Event():
             # If we haven't encountered a truth yet
             if not self.parse_stack[-1]:
                 try:
-                    truth = bool(evaluate.evaluate(command.values[0], self.unit, self.unit2, self.item, self.position, self.region))
+                    truth = bool(evaluate.evaluate(command.values[0], self.unit, self.unit2, self.item, self.position, self.region, owner=self.nid))
                 except Exception as e:
                     logging.error("Could not evaluate {%s}" % command.values[0])
                     truth = False
@@ -494,7 +494,7 @@ class Event():
             nid = values[0]
             to_eval = values[1]
             try:
-                val = evaluate.evaluate(to_eval, self.unit, self.unit2, self.item, self.position, self.region)
+                val = evaluate.evaluate(to_eval, self.unit, self.unit2, self.item, self.position, self.region, owner=self.nid)
                 action.do(action.SetGameVar(nid, val))
             except:
                 logging.error("Could not evaluate {%s}" % to_eval)
@@ -505,7 +505,7 @@ class Event():
             if len(values) > 1 and values[1]:
                 to_eval = values[1]
                 try:
-                    val = evaluate.evaluate(to_eval, self.unit, self.unit2, self.item, self.position, self.region)
+                    val = evaluate.evaluate(to_eval, self.unit, self.unit2, self.item, self.position, self.region, owner=self.nid)
                     action.do(action.SetGameVar(nid, game.game_vars.get(nid, 0) + val))
                 except:
                     logging.error("Could not evaluate {%s}" % to_eval)
@@ -517,7 +517,7 @@ class Event():
             nid = values[0]
             to_eval = values[1]
             try:
-                val = evaluate.evaluate(to_eval, self.unit, self.unit2, self.item, self.position, self.region)
+                val = evaluate.evaluate(to_eval, self.unit, self.unit2, self.item, self.position, self.region, owner=self.nid)
                 action.do(action.SetLevelVar(nid, val))
             except:
                 logging.error("Could not evaluate {%s}" % to_eval)
@@ -534,7 +534,7 @@ class Event():
             if len(values) > 1 and values[1]:
                 to_eval = values[1]
                 try:
-                    val = evaluate.evaluate(to_eval, self.unit, self.unit2, self.item, self.position, self.region)
+                    val = evaluate.evaluate(to_eval, self.unit, self.unit2, self.item, self.position, self.region, owner=self.nid)
                     action.do(action.SetLevelVar(nid, game.level_vars.get(nid, 0) + val))
                 except:
                     logging.error("Could not evaluate {%s}" % to_eval)
@@ -1184,7 +1184,7 @@ class Event():
         evaluated = []
         for to_eval in to_evaluate:
             try:
-                val = evaluate.evaluate(to_eval[6:-1], self.unit, self.unit2, self.item, self.position, self.region)
+                val = evaluate.evaluate(to_eval[6:-1], self.unit, self.unit2, self.item, self.position, self.region, owner=self.nid)
                 evaluated.append(str(val))
             except Exception as e:
                 logging.error("Could not evaluate %s (%s)" % (to_eval[6:-1], e))
@@ -1769,7 +1769,7 @@ class Event():
             logging.error("Class %s doesn't exist in database " % klass)
             return
         # Level
-        level = int(evaluate.evaluate(values[2], self.unit, self.unit2, self.item, self.position, self.region))
+        level = int(evaluate.evaluate(values[2], self.unit, self.unit2, self.item, self.position, self.region, owner=self.nid))
 
         team = values[3]
         if len(values) > 4 and values[4]:
@@ -1813,7 +1813,7 @@ class Event():
             return
 
         if len(values) > 2 and values[2]:
-            level = int(evaluate.evaluate(values[2], self.unit, self.unit2, self.item, self.position, self.region))
+            level = int(evaluate.evaluate(values[2], self.unit, self.unit2, self.item, self.position, self.region, owner=self.nid))
         else:
             level = unit.level
         if len(values) > 3 and values[3]:
@@ -1950,7 +1950,7 @@ class Event():
             party_nid = game.current_party
         to_eval = values[0]
         try:
-            val = evaluate.evaluate(to_eval, self.unit, self.unit2, self.item, self.position, self.region)
+            val = evaluate.evaluate(to_eval, self.unit, self.unit2, self.item, self.position, self.region, owner=self.nid)
             action.do(action.GiveBexp(party_nid, val))
         except:
             logging.error("Could not evaluate {%s}" % to_eval)
@@ -2093,7 +2093,7 @@ class Event():
             logging.error("Couldn't find unit %s" % values[0])
             return
 
-        final_level = int(evaluate.evaluate(values[1], self.unit, self.unit2, self.item, self.position, self.region))
+        final_level = int(evaluate.evaluate(values[1], self.unit, self.unit2, self.item, self.position, self.region, owner=self.nid))
         current_level = unit.level
         diff = max(0, final_level - current_level)
         if diff <= 0:
@@ -2115,7 +2115,7 @@ class Event():
 
     def set_mode_autolevels(self, command):
         values, flags = event_commands.parse(command)
-        autolevel = int(evaluate.evaluate(values[1], self.unit, self.unit2, self.item, self.position, self.region))
+        autolevel = int(evaluate.evaluate(values[1], self.unit, self.unit2, self.item, self.position, self.region, owner=self.nid))
         if 'hidden' in flags:
             game.current_mode.enemy_autolevels = autolevel
         else:
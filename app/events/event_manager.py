@@ -15,10 +15,12 @@ class EventManager():
         triggered_events = []
         for event_prefab in DB.events.get(trigger, game.level.nid):
             try:
-                result = evaluate.evaluate(event_prefab.condition, unit, unit2, item, position, region)
+                result = evaluate.evaluate(event_prefab.condition, unit, unit2, item, position, region, owner=event_prefab.nid)
                 logging.debug("%s %s: %s", event_prefab.trigger, event_prefab.condition, result)
                 if event_prefab.nid not in game.already_triggered_events and result:
                     triggered_events.append(event_prefab)
+            except SyntaxError:  # Already reported
+                pass
             except:
                 logging.error("Condition {%s} could not be evaluated" % event_prefab.condition)
 
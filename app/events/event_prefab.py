@@ -31,6 +31,10 @@ all_triggers = Data([
 ])
 
 class EventPrefab(Prefab):
+    # Goes up whenever any event's trigger, level or name changes,
+    # so catalogs know their trigger index is out of date
+    edit_count = 0
+
     def __init__(self, name):
         self.name = name
         self.trigger = None
@@ -40,6 +44,11 @@ class EventPrefab(Prefab):
         self.only_once = False
         self.priority: int = 20
 
+    def __setattr__(self, name, value):
+        if name in ('trigger', 'level_nid', 'name'):
+            EventPrefab.edit_count += 1
+        super().__setattr__(name, value)
+
     @property
     def nid(self):
         if not self.name:
@@ -76,9 +85,78 @@ class EventPrefab(Prefab):
 class EventCatalog(Data[EventPrefab]):
     datatype = EventPrefab
 
-    def get(self, trigger, level_nid):
-        return [event for event in self._list if event.trigger == trigger and
-                (not event.level_nid or event.level_nid == level_nid)]
+    def __init__(self, vals=None):
+        super().__init__(vals)
+        self._clear_index()
+
+    def _clear_index(self):
+        # Key: (trigger, level nid), Value: list of (index, event) in list order
+        # Global events are stored under a level nid of None
+        self._index = None
+        # Key: (trigger, level nid), Value: list of events, global and level, in list order
+        self._lookups = {}
+        self._edit_count = EventPrefab.edit_count
+
+    def _build_index(self):
+        self._index = {}
+        for idx, event in enumerate(self._list):
+            key = (event.trigger, event.level_nid or None)
+            if key not in self._index:
+                self._index[key] = []
+            self._index[key].append((idx, event))
+
+    def get(self, trigger, level_nid) -> list:
+        """
+        Returns the events with this trigger that are either global or in
+        the level, in the same order as they are in the catalog
+        """
+        if self._edit_count != EventPrefab.edit_count:
+            self._clear_index()
+        key = (trigger, level_nid)
+        if key not in self._lookups:
+            if self._index is None:
+                self._build_index()
+            global_events = self._index.get((trigger, None), [])
+            level_events = self._index.get((trigger, level_nid), []) if level_nid else []
+            self._lookups[key] = [event for idx, event in sorted(global_events + level_events, key=lambda x: x[0])]
+        return list(self._lookups[key])
 
     def get_from_nid(self, key, fallback=None):
         return self._dict.get(key, fallback)
+
+    # Anything that changes the list has to throw away the trigger index
+    def update_nid(self, val, nid, set_nid=True):
+        super().update_nid(val, nid, set_nid)
+        self._clear_index()
+
+    def change_key(self, old_key, new_key):
+        super().change_key(old_key, new_key)
+        self._clear_index()
+
+    def append(self, val):
+        super().append(val)
+        self._clear_index()
+
+    def delete(self, val):
+        super().delete(val)
+        self._clear_index()
+
+    def remove_key(self, key):
+        super().remove_key(key)
+        self._clear_index()
+
+    def pop(self, idx=None):
+        super().pop(idx)
+        self._clear_index()
+
+    def insert(self, idx, val):
+        super().insert(idx, val)
+        self._clear_index()
+
+    def clear(self):
+        super().clear()
+        self._clear_index()
+
+    def move_index(self, old_index, new_index):
+        super().move_index(old_index, new_index)
+        self._clear_index()
@@ -0,0 +1,164 @@
+"""
+Headless benchmark of one AI phase.
+
+Loads a project and level, optionally rearranges units from a fixture,
+then runs AIController.think for every AI unit of the phase's team in
+the same order the AI state would, moving each unit to the position
+it chose before the next one thinks. Combat is not resolved.
+
+Reports the wall time, the number of candidates evaluated, and the
+number of pathfinding calls for each unit.
+
+Usage:
+    python run_ai_benchmark.py lion_throne 3
+    python run_ai_benchmark.py lion_throne 3 --fixture units.json --team enemy --repeat 5
+
+A fixture is a json file that moves or removes the level's units, and
+places units from the database that are not in the level:
+    {"positions": {"Eirika": [3, 4], "109": null},
+     "units": [{"nid": "Seth", "team": "player", "ai": "None", "position": [4, 4]}]}
+A nid that is neither in the level nor in the database is an error.
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import json
+import logging
+import time
+from collections import Counter
+
+from app.resources.resources import RESOURCES
+from app.data.database import DB
+from app.engine import driver, game_state
+
+class Counters():
+    """
+    Counts calls to pathfinders and candidate evaluations
+    by wrapping the methods that do the work
+    """
+    def __init__(self):
+        self.counts = Counter()
+
+    def wrap(self, cls, method_name, key):
+        func = getattr(cls, method_name)
+        counts = self.counts
+
+        def counted(*args, **kwargs):
+            counts[key] += 1
+            return func(*args, **kwargs)
+        setattr(cls, method_name, counted)
+
+    def install(self):
+        from app.engine import pathfinding, ai_controller
+        for cls in (pathfinding.Djikstra, pathfinding.AStar,
+                    pathfinding.ArrayDjikstra, pathfinding.ArrayAStar):
+            self.wrap(cls, 'process', 'pathfinding')
+        self.wrap(ai_controller.PrimaryAI, 'determine_utility', 'candidates')
+        self.wrap(ai_controller.SecondaryAI, 'get_path', 'candidates')
+
+    def take(self) -> Counter:
+        counts = Counter(self.counts)
+        self.counts.clear()
+        return counts
+
+def load_fixture(game, fixture_path):
+    from app.data.level_units import UniqueUnit
+    from app.engine.objects.unit import UnitObject
+
+    with open(fixture_path) as fp:
+        fixture = json.load(fp)
+    for unit_data in fixture.get('units', []):
+        nid = unit_data['nid']
+        if game.get_unit(nid):
+            raise ValueError("Fixture unit %s is already in the level" % nid)
+        if not DB.units.get(nid):
+            raise ValueError("Fixture unit %s is not in the database" % nid)
+        position = unit_data.get('position')
+        prefab = UniqueUnit(nid, unit_data.get('team', 'player'), unit_data.get('ai', 'None'),
+                            tuple(position) if position else None)
+        unit = UnitObject.from_prefab(prefab)
+        unit.party = game.current_party
+        game.full_register(unit)
+        if unit.position:
+            game.arrive(unit)
+    for nid, position in fixture.get('positions', {}).items():
+        unit = game.get_unit(nid)
+        if not unit:
+            raise ValueError("Fixture unit %s is not in the level" % nid)
+        if unit.position:
+            game.leave(unit)
+        unit.position = tuple(position) if position else None
+        if unit.position:
+            game.arrive(unit)
+
+def run_phase(game, team, counters) -> list:
+    from app.engine import action, ai_controller, target_system
+
+    results = []
+    controller = ai_controller.AIController()
+    processed = set()
+    while True:
+        valid_units = [unit for unit in game.units if unit.position and unit.ai and
+                       unit.team == team and unit.nid not in processed]
+        if not valid_units:
+            break
+        # Same order as the AI state
+        valid_units = sorted(valid_units, key=lambda unit: target_system.distance_to_closest_enemy(unit))
+        unit = sorted(valid_units, key=lambda unit: DB.ai.get(unit.ai).priority, reverse=True)[0]
+        processed.add(unit.nid)
+
+        controller.load_unit(unit)
+        counters.take()
+        start = time.perf_counter()
+        while not controller.think():
+            pass
+        elapsed = time.perf_counter() - start
+        counts = counters.take()
+
+        goal = controller.goal_position
+        if goal and goal != unit.position:
+            action.execute(action.Move(unit, goal, []))
+        results.append((unit.nid, elapsed, counts['candidates'], counts['pathfinding']))
+    return results
+
+def report(results):
+    print('%-16s %10s %12s %12s' % ('Unit', 'Time (ms)', 'Candidates', 'Pathfinding'))
+    for nid, elapsed, candidates, pathfinding in results:
+        print('%-16s %10.2f %12d %12d' % (nid, elapsed * 1000, candidates, pathfinding))
+    total_time = sum(r[1] for r in results)
+    total_candidates = sum(r[2] for r in results)
+    total_pathfinding = sum(r[3] for r in results)
+    print('%-16s %10.2f %12d %12d' % ('Total', total_time * 1000, total_candidates, total_pathfinding))
+    return total_time
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark one AI phase without a display")
+    parser.add_argument('project', help="Project name, without .ltproj")
+    parser.add_argument('level', help="Level nid")
+    parser.add_argument('--fixture', help="Json file that places, moves or removes units before the phase")
+    parser.add_argument('--team', default='enemy', help="Team whose phase is run")
+    parser.add_argument('--repeat', type=int, default=1, help="Number of times to run the phase")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    RESOURCES.load(args.project + '.ltproj')
+    DB.load(args.project + '.ltproj')
+    driver.start(DB.constants.value('title'))
+
+    counters = Counters()
+    counters.install()
+
+    times = []
+    for idx in range(args.repeat):
+        game = game_state.start_level(args.level)
+        if args.fixture:
+            load_fixture(game, args.fixture)
+        print("--- Run %d: %s level %s, %s phase ---" % (idx + 1, args.project, args.level, args.team))
+        times.append(report(run_phase(game, args.team, counters)))
+    if args.repeat > 1:
+        print("Best: %.2f ms, Mean: %.2f ms" % (min(times) * 1000, sum(times) / len(times) * 1000))
+
+if __name__ == '__main__':
+    main()
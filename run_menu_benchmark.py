@@ -0,0 +1,85 @@
+"""
+Headless benchmark of opening and closing menus.
+
+Loads a project, then repeatedly builds a set of choice menus and help
+boxes of different sizes, draws each one for a few frames, and throws
+it away, the way a menu state does when it is opened and closed.
+
+Runs once with the window background cache turned off and once with it
+on, and reports the time for each.
+
+Usage:
+    python run_menu_benchmark.py lion_throne
+    python run_menu_benchmark.py lion_throne --repeat 200 --frames 5
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import logging
+import time
+
+from app.constants import WINWIDTH, WINHEIGHT
+from app.resources.resources import RESOURCES
+from app.data.database import DB
+from app.engine import driver, engine
+
+OPTIONS = [
+    ['Attack', 'Item', 'Trade', 'Wait'],
+    ['Unit', 'Objective', 'Options', 'Suspend', 'End'],
+    ['Yes', 'No'],
+    ['Seize', 'Attack', 'Staff', 'Rescue', 'Item', 'Convoy', 'Trade', 'Wait'],
+]
+
+DESCRIPTIONS = [
+    'A short description.',
+    'A somewhat longer description that wraps onto a second line of the help box.',
+]
+
+def open_close(options, frames):
+    from app.engine import menus, help_menu
+    surf = engine.create_surface((WINWIDTH, WINHEIGHT))
+    for option_list in options:
+        menu = menus.Choice(None, option_list, topleft='center')
+        for _ in range(frames):
+            menu.draw(surf)
+    for desc in DESCRIPTIONS:
+        dialog = help_menu.HelpDialog(desc)
+        for _ in range(frames):
+            dialog.draw(surf, (8, 8))
+
+def run(repeat, frames) -> float:
+    from app.engine import base_surf
+    base_surf.cache.clear()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        open_close(OPTIONS, frames)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark opening and closing menus without a display")
+    parser.add_argument('project', help="Project name, without .ltproj")
+    parser.add_argument('--repeat', type=int, default=100, help="Number of times to open and close every menu")
+    parser.add_argument('--frames', type=int, default=3, help="Frames each menu is drawn for while open")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    RESOURCES.load(args.project + '.ltproj')
+    DB.load(args.project + '.ltproj')
+    driver.start(DB.constants.value('title'))
+
+    from app.engine import base_surf
+    max_cached = base_surf.MAX_CACHED_SURFS
+    base_surf.MAX_CACHED_SURFS = 0
+    uncached = run(args.repeat, args.frames)
+    base_surf.MAX_CACHED_SURFS = max_cached
+    cached = run(args.repeat, args.frames)
+
+    num_opens = args.repeat * (len(OPTIONS) + len(DESCRIPTIONS))
+    print('%-12s %12s %16s' % ('Cache', 'Total (ms)', 'Per open (ms)'))
+    print('%-12s %12.2f %16.3f' % ('Off', uncached * 1000, uncached * 1000 / num_opens))
+    print('%-12s %12.2f %16.3f' % ('On', cached * 1000, cached * 1000 / num_opens))
+
+if __name__ == '__main__':
+    main()
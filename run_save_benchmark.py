@@ -0,0 +1,83 @@
+"""
+Headless benchmark of the save file format.
+
+Loads a project and level, then plays a number of turns in which every
+unit on the map moves to a random valid tile and waits, so the action
+log grows the way it would in a long chapter. Then saves the game,
+and reports the size, write time and load time of the versioned save
+format against a plain pickle of the same save dict.
+
+Usage:
+    python run_save_benchmark.py lion_throne 9
+    python run_save_benchmark.py lion_throne 9 --turns 20 --repeat 20
+"""
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import logging
+import pickle
+import random
+import time
+
+from app.resources.resources import RESOURCES
+from app.data.database import DB
+from app.engine import driver, game_state
+
+def play_turns(game, turns, seed=0):
+    from app.engine import action, target_system
+
+    rng = random.Random(seed)
+    for _ in range(turns):
+        for unit in sorted(game.units, key=lambda unit: unit.nid):
+            if not unit.position or unit.dead:
+                continue
+            valid_moves = sorted(target_system.get_valid_moves(unit, force=True))
+            if valid_moves:
+                action.execute(action.Move(unit, rng.choice(valid_moves), []))
+            action.do(action.Wait(unit))
+        action.do(action.ResetAll([unit for unit in game.units]))
+        action.do(action.IncrementTurn())
+
+def time_it(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark save file size and speed without a display")
+    parser.add_argument('project', help="Project name, without .ltproj")
+    parser.add_argument('level', help="Level nid")
+    parser.add_argument('--turns', type=int, default=10, help="Number of turns to play before saving")
+    parser.add_argument('--repeat', type=int, default=10, help="Number of times to time each write and load")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    RESOURCES.load(args.project + '.ltproj')
+    DB.load(args.project + '.ltproj')
+    driver.start(DB.constants.value('title'))
+
+    from app.engine import save_format
+
+    game = game_state.start_level(args.level)
+    play_turns(game, args.turns)
+    s_dict, meta_dict = game.save()
+    print("%s level %s after %d turns: %d units, %d items, %d skills, %d actions" %
+          (args.project, args.level, args.turns, len(s_dict['units']), len(s_dict['items']),
+           len(s_dict['skills']), len(s_dict['action_log'][0])))
+
+    print('%-10s %12s %12s %12s' % ('Format', 'Size (KB)', 'Write (ms)', 'Load (ms)'))
+    formats = [('pickle', pickle.dumps, pickle.loads),
+               ('versioned', save_format.dumps, save_format.loads)]
+    for name, dumps, loads in formats:
+        write_time, data = time_it(lambda: dumps(s_dict), args.repeat)
+        load_time, loaded = time_it(lambda: loads(data), args.repeat)
+        assert loaded == s_dict
+        print('%-10s %12.1f %12.2f %12.2f' % (name, len(data) / 1024, write_time * 1000, load_time * 1000))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,17 @@
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from app.resources.resources import RESOURCES
+from app.data.database import DB
+from app.engine import driver
+
+"""
+Shared set up for the tests. The engine runs without a display or
+an audio device, and load_project loads one of the bundled projects.
+"""
+
+def load_project(name):
+    RESOURCES.load(name + '.ltproj')
+    DB.load(name + '.ltproj')
+    driver.start(name)
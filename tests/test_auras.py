@@ -0,0 +1,75 @@
+import random
+
+from app.engine import game_state
+from conftest import load_project
+
+"""
+Checks that moving units hands out exactly the auras that a full
+recomputation of every aura on the map would, and that rewinding
+the moves gives back the same auras.
+"""
+
+AURAS = ['Skill_Aura', 'Defense_Aura', 'Inspiration', 'Charisma', 'Hex']
+
+def expected_auras(game):
+    from app.engine import aura_funcs
+    from app.utilities import utils
+    expected = {unit.nid: set() for unit in game.units if unit.position}
+    for owner in game.units:
+        if not owner.position:
+            continue
+        for skill in owner.skills:
+            if skill.aura:
+                for unit in game.units:
+                    if unit.position and unit is not owner and \
+                            0 < utils.calculate_distance(owner.position, unit.position) <= skill.aura_range.value and \
+                            aura_funcs.aura_applies(owner, unit, skill.aura_target.value):
+                        expected[unit.nid].add(skill.subskill.uid)
+    return expected
+
+def current_auras(game):
+    return {unit.nid: {skill.uid for skill in unit.skills if skill.parent_skill}
+            for unit in game.units if unit.position}
+
+def test_auras():
+    load_project('lion_throne')
+    rng = random.Random(0)
+    game = game_state.start_level('1')
+    from app.engine import action, item_funcs, target_system
+    units = sorted([unit for unit in game.units if unit.position], key=lambda unit: unit.nid)
+    for unit, nid in zip(rng.sample(units, len(AURAS)), AURAS):
+        skill = item_funcs.create_skill(unit, nid)
+        game.register_skill(skill)
+        action.do(action.AddSkill(unit, skill))
+    assert current_auras(game) == expected_auras(game)
+    assert any(current_auras(game).values())
+
+    start = current_auras(game)
+    acts = []
+    for step in range(150):
+        unit = rng.choice(units)
+        roll = rng.random()
+        if roll < 0.1:
+            other = rng.choice(units)
+            if other is unit:
+                continue
+            act = action.Swap(unit, other)
+        else:
+            # Only one unit to a tile
+            valid_moves = sorted(pos for pos in target_system.get_valid_moves(unit, force=True)
+                                 if not game.board.get_unit(pos))
+            if not valid_moves:
+                continue
+            new_pos = rng.choice(valid_moves)
+            act = action.Teleport(unit, new_pos) if roll < 0.3 else action.Move(unit, new_pos, [])
+        if isinstance(act, action.Move) and not isinstance(act, action.SimpleMove):
+            action.execute(act)
+        else:
+            action.do(act)
+        acts.append(act)
+        assert current_auras(game) == expected_auras(game), step
+        assert not game.board.held_auras and not game.board.released_auras
+
+    for act in reversed(acts):
+        action.reverse(act)
+    assert current_auras(game) == start
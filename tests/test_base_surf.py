@@ -0,0 +1,29 @@
+import pygame
+
+from conftest import load_project
+
+"""
+Checks that cached window backgrounds match freshly built ones,
+and that surfaces handed out for drawing on are not shared.
+"""
+
+BASES = ['menu_bg_base', 'menu_bg_white', 'message_bg_base', 'name_tag']
+
+def test_cached_base_surf():
+    load_project('lion_throne')
+    from app.engine import base_surf
+    from app.engine.sprites import SPRITES
+    base_surf.cache.clear()
+    for base in BASES:
+        for width, height in [(48, 24), (104, 72), (161, 35)]:
+            fresh = base_surf.build_base_surf(width, height, SPRITES.get(base))
+            for _ in range(2):
+                surf = base_surf.create_base_surf(width, height, base)
+                assert pygame.image.tostring(surf, 'RGBA') == pygame.image.tostring(fresh, 'RGBA')
+                surf.fill((255, 0, 0))
+            assert base_surf.get_base_surf(width, height, base) is base_surf.get_base_surf(width, height, base)
+            assert pygame.image.tostring(base_surf.get_base_surf(width, height, base), 'RGBA') == pygame.image.tostring(fresh, 'RGBA')
+
+    for width in range(8, 8 * (base_surf.MAX_CACHED_SURFS + 10), 8):
+        base_surf.get_base_surf(width, 24)
+    assert len(base_surf.cache) == base_surf.MAX_CACHED_SURFS
@@ -0,0 +1,59 @@
+import logging
+
+import pygame
+
+from app.engine import engine
+from conftest import load_project
+
+"""
+Checks that strings drawn from the text cache look the same
+as drawing them glyph by glyph.
+"""
+
+STRINGS = ['', 'A', 'Hello, World!', 'HP 25/30', 'lowercase and UPPERCASE', "Eirika's Lance +1", '0123456789']
+
+def old_blit(font, string, surf, pos):
+    left, top = pos
+    string = font.modify_string(string)
+    glyphs = [font.get_glyph(c) for c in string]
+    if font.stacked:
+        orig_left = left
+        for highsurf, lowsurf, char_width in glyphs:
+            engine.blit(surf, lowsurf, (left, top))
+            left += char_width + font.space_offset
+        for highsurf, lowsurf, char_width in glyphs:
+            engine.blit(surf, highsurf, (orig_left, top))
+            orig_left += char_width + font.space_offset
+    else:
+        for subsurf, char_width in glyphs:
+            engine.blit(surf, subsurf, (left, top))
+            left += char_width + font.space_offset
+
+def test_cached_text_matches():
+    load_project('lion_throne')
+    from app.engine.fonts import FONT
+    for font in FONT.values():
+        for string in STRINGS:
+            for transparent in (False, True):
+                new = engine.create_surface((200, 40), transparent)
+                old = engine.create_surface((200, 40), transparent)
+                if not transparent:
+                    engine.fill(new, (40, 80, 120))
+                    engine.fill(old, (40, 80, 120))
+                for _ in range(2):
+                    font.blit_center(string, new, (100, 4))
+                    old_blit(font, string, old, (100 - font.width(string)//2, 4))
+                assert pygame.image.tostring(new, 'RGBA') == pygame.image.tostring(old, 'RGBA'), (font.png_path, string)
+
+def test_missing_glyph_reported_once(caplog):
+    load_project('lion_throne')
+    from app.engine.fonts import FONT
+    from app.engine.bmpfont import TEXT_CACHE
+    font = FONT['text-white']
+    hits = TEXT_CACHE.hits
+    with caplog.at_level(logging.WARNING):
+        for _ in range(5):
+            font.width('☃☃')
+            font.blit('☃☃', engine.create_surface((40, 20)))
+    assert len([r for r in caplog.records if '☃' in r.getMessage()]) == 1
+    assert TEXT_CACHE.hits - hits == 4
@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from app.data.database import DB
+from app.engine import game_state
+from conftest import load_project
+
+"""
+Moves units around a level and checks that the incrementally
+updated boundary grids always match grids built from scratch.
+"""
+
+PROJECTS = ['lion_throne', 'sacred_stones']
+
+def fresh_grids(game):
+    from app.engine import boundary
+    fresh = boundary.BoundaryInterface(game.tilemap.width, game.tilemap.height)
+    fresh.reset()
+    return fresh.grids
+
+def move(game, unit, new_pos):
+    game.leave(unit)
+    unit.position = new_pos
+    game.arrive(unit)
+
+@pytest.mark.parametrize('project', PROJECTS)
+def test_incremental_boundary(project):
+    load_project(project)
+    rng = random.Random(0)
+    for level in list(DB.levels)[:6]:
+        game = game_state.start_level(level.nid)
+        game.boundary.reset()
+        units = [unit for unit in game.units if unit.position]
+        if not units:
+            continue
+        width, height = game.tilemap.width, game.tilemap.height
+        for _ in range(40):
+            unit = rng.choice(units)
+            new_pos = (rng.randrange(width), rng.randrange(height))
+            if game.board.get_unit(new_pos) or not game.movement.check_traversable(unit, new_pos):
+                continue
+            move(game, unit, new_pos)
+            assert game.boundary.grids == fresh_grids(game), (level.nid, unit.nid, new_pos)
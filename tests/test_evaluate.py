@@ -0,0 +1,44 @@
+import logging
+
+import pytest
+
+from app.data.database import DB
+from app.engine import game_state
+from conftest import load_project
+
+"""
+Checks that compiled evaluation gives the same answers as eval,
+and that a bad expression is only reported once.
+"""
+
+def load_level():
+    load_project('lion_throne')
+    return game_state.start_level(list(DB.levels)[0].nid)
+
+def test_evaluate_matches_eval():
+    game = load_level()
+    from app.engine import evaluate
+    unit = [unit for unit in game.units if unit.position][0]
+    expressions = ['unit.nid', ' unit.level + 1', '\tunit.team == "player"', 'check_pair("a", "b")',
+                   'game.turncount', 'len(unit.skills)', 'utils.calculate_distance(unit.position, (0, 0))']
+    for expression in expressions:
+        for _ in range(2):
+            assert evaluate.evaluate(expression, unit) == eval(expression.strip(), vars(evaluate), {'unit': unit, 'check_pair': lambda a, b: False})
+
+def test_syntax_error_reported_once(caplog):
+    load_level()
+    from app.engine import evaluate
+    with caplog.at_level(logging.ERROR):
+        for _ in range(5):
+            with pytest.raises(SyntaxError):
+                evaluate.evaluate('unit.nid ==', owner='TestEvent')
+    messages = [record.getMessage() for record in caplog.records if 'unit.nid ==' in record.getMessage()]
+    assert len(messages) == 1
+    assert 'TestEvent' in messages[0]
+    # The same string in another event is reported again
+    with caplog.at_level(logging.ERROR):
+        with pytest.raises(SyntaxError):
+            evaluate.evaluate('unit.nid ==', owner='OtherEvent')
+    messages = [record.getMessage() for record in caplog.records if 'unit.nid ==' in record.getMessage()]
+    assert len(messages) == 2
+    assert 'OtherEvent' in messages[1]
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from app.data.database import DB
+from app.events.event_prefab import EventPrefab, all_triggers
+
+"""
+Checks the trigger index of the event catalog against
+a linear scan of every event, before and after edits.
+"""
+
+PROJECTS = ['default', 'lion_throne', 'sacred_stones']
+
+def linear_get(catalog, trigger, level_nid):
+    return [event for event in catalog if event.trigger == trigger and
+            (not event.level_nid or event.level_nid == level_nid)]
+
+def check_catalog(catalog, level_nids):
+    triggers = [trigger.nid for trigger in all_triggers] + [None, 'not_a_trigger']
+    for trigger in triggers:
+        for level_nid in level_nids:
+            assert catalog.get(trigger, level_nid) == linear_get(catalog, trigger, level_nid), (trigger, level_nid)
+
+@pytest.mark.parametrize('project', PROJECTS)
+def test_trigger_index(project):
+    DB.load(project + '.ltproj')
+    catalog = DB.events
+    level_nids = [level.nid for level in DB.levels] + [None, 'not_a_level']
+    check_catalog(catalog, level_nids)
+
+    rng = random.Random(0)
+    triggers = [trigger.nid for trigger in all_triggers]
+    for _ in range(20):
+        event = rng.choice(catalog.values())
+        event.trigger = rng.choice(triggers)
+        check_catalog(catalog, level_nids)
+        event.level_nid = rng.choice(level_nids[:-1])
+        check_catalog(catalog, level_nids)
+        catalog.move_index(rng.randrange(len(catalog)), rng.randrange(len(catalog)))
+        check_catalog(catalog, level_nids)
+
+    new_event = EventPrefab('Index Test')
+    new_event.trigger = 'unit_wait'
+    catalog.append(new_event)
+    check_catalog(catalog, level_nids)
+    catalog.delete(new_event)
+    check_catalog(catalog, level_nids)
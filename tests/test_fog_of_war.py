@@ -0,0 +1,54 @@
+import random
+
+from app.data.database import DB
+from app.engine import game_state
+from conftest import load_project
+
+"""
+Checks that the counted fog of war grids see exactly the same tiles
+as a grid holding the set of units that can see each tile.
+"""
+
+class SetGrids():
+    def __init__(self, board):
+        self.board = board
+        self.grids = {team: [set() for _ in range(board.width * board.height)] for team in DB.teams}
+
+    def update_fow(self, pos, unit, sight_range):
+        from app.engine import target_system
+        grid = self.grids[unit.team]
+        for cell in grid:
+            cell.discard(unit.nid)
+        if pos:
+            for x, y in target_system.get_shell({pos}, range(sight_range + 1), self.board.width, self.board.height):
+                grid[x * self.board.height + y].add(unit.nid)
+
+    def in_vision(self, pos, team):
+        idx = pos[0] * self.board.height + pos[1]
+        if team == 'player':
+            return bool(self.grids['player'][idx] or self.grids['other'][idx])
+        return bool(self.grids[team][idx])
+
+def test_fog_of_war():
+    load_project('lion_throne')
+    rng = random.Random(0)
+    game = game_state.start_level('1')
+    game.level_vars['_fog_of_war'] = 1
+    board = game.board
+    reference = SetGrids(board)
+    units = [unit for unit in game.units if unit.position]
+    positions = [(x, y) for x in range(board.width) for y in range(board.height)]
+
+    for step in range(300):
+        unit = rng.choice(units)
+        if step % 50 == 49:
+            # The old vision stays with the team that had it
+            unit.team = rng.choice(DB.teams)
+        pos = rng.choice(positions) if rng.random() < 0.9 else None
+        sight_range = rng.randint(0, 6)
+        board.update_fow(pos, unit, sight_range)
+        reference.update_fow(pos, unit, sight_range)
+        if step % 10 == 0:
+            for team in DB.teams:
+                for pos in positions:
+                    assert board.in_vision(pos, team) == reference.in_vision(pos, team), (step, team, pos)
@@ -0,0 +1,56 @@
+import pytest
+
+from app.data.database import DB
+from app.engine import game_state, skill_system, item_system
+from app.engine.hook_index import get_hooks, get_components
+from conftest import load_project
+
+"""
+Checks that the hook dispatch index returns the same components,
+in the same order, as walking every skill and component, and that
+it stays correct as skills are added to and removed from a unit.
+"""
+
+PROJECTS = ['lion_throne', 'sacred_stones']
+
+SKILL_HOOKS = skill_system.default_behaviours + skill_system.exclusive_behaviours + \
+    skill_system.targeted_behaviours + skill_system.item_behaviours + \
+    skill_system.modify_hooks + skill_system.dynamic_hooks + skill_system.multiply_hooks + \
+    skill_system.simple_event_hooks + skill_system.combat_event_hooks + \
+    skill_system.subcombat_event_hooks + skill_system.item_event_hooks + \
+    ('condition', 'available', 'stat_change', 'growth_change', 'mana', 'on_upkeep', 'on_endstep')
+
+ITEM_HOOKS = item_system.exclusive_hooks + item_system.target_hooks + item_system.simple_target_hooks + \
+    item_system.dynamic_hooks + item_system.modify_hooks + item_system.event_hooks + \
+    ('available', 'is_broken', 'valid_targets', 'ai_targets', 'splash', 'splash_positions')
+
+def walk_skills(unit, hook):
+    return tuple((skill, component) for skill in unit.skills for component in skill.components if component.defines(hook))
+
+def check_unit(unit):
+    for hook in SKILL_HOOKS:
+        assert get_hooks(unit.skills, hook) == walk_skills(unit, hook), (unit.nid, hook)
+    for item in unit.items:
+        for hook in ITEM_HOOKS:
+            assert get_components(item, hook) == tuple(c for c in item.components if c.defines(hook)), (item.nid, hook)
+
+@pytest.mark.parametrize('project', PROJECTS)
+def test_hook_index(project):
+    load_project(project)
+    from app.engine import item_funcs
+    for level in list(DB.levels)[:4]:
+        game = game_state.start_level(level.nid)
+        units = [unit for unit in game.units if unit.skills]
+        for unit in units:
+            check_unit(unit)
+        # Moving skills between units must be picked up by the index
+        for unit, other in zip(units, units[1:]):
+            skill = item_funcs.create_skill(unit, other.skills[-1].nid)
+            unit.skills.append(skill)
+            check_unit(unit)
+            unit.skills.insert(0, unit.skills.pop())
+            check_unit(unit)
+            unit.skills.remove(skill)
+            check_unit(unit)
+            unit.skills = list(reversed(unit.skills))
+            check_unit(unit)
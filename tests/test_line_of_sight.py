@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from app.resources.resources import RESOURCES
+from app.data.database import DB
+from app.engine import game_state
+from conftest import load_project
+
+"""
+Checks that the cached visible tiles agree with walking a line
+to each tile, on every bundled map.
+"""
+
+PROJECTS = ['default', 'lion_throne', 'sacred_stones']
+
+def walk_lines(source_pos, dest_pos, max_range):
+    from app.engine import line_of_sight
+    from app.utilities import utils
+    return [pos for pos in dest_pos if pos in source_pos or
+            any(utils.calculate_distance(pos, s_pos) <= max_range and line_of_sight.get_line(s_pos, pos)
+                for s_pos in source_pos)]
+
+@pytest.mark.parametrize('project', PROJECTS)
+def test_visible_tiles(project):
+    load_project(project)
+    game = game_state.start_level(DB.levels[0].nid)
+    from app.engine import line_of_sight
+    from app.engine.game_board import GameBoard
+    from app.engine.objects.tilemap import TileMapObject
+
+    rng = random.Random(0)
+    for prefab in RESOURCES.tilemaps:
+        tilemap = TileMapObject.from_prefab(prefab)
+        game.board = board = GameBoard(tilemap)
+        positions = [(x, y) for x in range(board.width) for y in range(board.height)]
+        for max_range in (0, 1, 3, 6):
+            for source in rng.sample(positions, 40):
+                assert line_of_sight.get_visible_tiles(source, max_range) == \
+                    set(walk_lines([source], positions, max_range)), (prefab.nid, source, max_range)
+        for source in rng.sample(positions, 4):
+            assert line_of_sight.get_visible_tiles(source, 99) == \
+                set(walk_lines([source], positions, 99)), (prefab.nid, source)
+
+        for _ in range(20):
+            sources = rng.sample(positions, rng.randint(1, 5))
+            dests = rng.sample(positions, 30) + sources[:1]
+            max_range = rng.randint(0, 8)
+            assert line_of_sight.line_of_sight(sources, dests, max_range) == walk_lines(sources, dests, max_range)
+
+        # Terrain changes throw away what was seen
+        board.reset_grid(tilemap)
+        assert not board.visibility_cache
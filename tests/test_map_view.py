@@ -0,0 +1,62 @@
+import pygame
+import pytest
+
+from app.constants import TILEWIDTH, TILEHEIGHT, WINWIDTH, WINHEIGHT
+from app.resources.resources import RESOURCES
+from app.engine import engine
+from app.engine.objects.tilemap import TileMapObject
+from conftest import load_project
+
+"""
+Checks that the map drawn from the retained full map image is
+pixel for pixel the same as building the map from its layers each frame.
+"""
+
+PROJECTS = ['default', 'lion_throne', 'sacred_stones']
+
+def old_image(tilemap, cull_rect):
+    # What MapView used to draw every frame
+    image = tilemap.build_image(cull_rect)
+    return engine.copy_surface(image).convert_alpha()
+
+def check_same(tilemap):
+    width, height = tilemap.width * TILEWIDTH, tilemap.height * TILEHEIGHT
+    cull_rects = [(0, 0, WINWIDTH, WINHEIGHT),
+                  (max(0, width - WINWIDTH), max(0, height - WINHEIGHT), WINWIDTH, WINHEIGHT),
+                  (TILEWIDTH, TILEHEIGHT // 2, WINWIDTH, WINHEIGHT)]
+    for cull_rect in cull_rects:
+        new = engine.copy_surface(tilemap.get_full_image(cull_rect))
+        old = old_image(tilemap, cull_rect)
+        assert new.get_size() == old.get_size(), cull_rect
+        assert pygame.image.tostring(new, 'RGBA') == pygame.image.tostring(old, 'RGBA'), (tilemap.nid, cull_rect)
+        fading = any(layer.state for layer in tilemap.layers)
+        if not fading and (width < cull_rect[0] + cull_rect[2] or height < cull_rect[1] + cull_rect[3]):
+            # The padded image is kept for the next frame
+            assert tilemap.get_full_image(cull_rect) is tilemap.get_full_image(cull_rect)
+
+@pytest.mark.parametrize('project', PROJECTS)
+def test_retained_map_image(project):
+    load_project(project)
+    for prefab in RESOURCES.tilemaps:
+        tilemap = TileMapObject.from_prefab(prefab)
+        check_same(tilemap)
+        for layer in tilemap.layers:
+            if layer.nid == 'base':
+                continue
+            layer.quick_show()
+            check_same(tilemap)
+            # Halfway through fading out
+            layer.hide()
+            layer.translucence = 0.5
+            tilemap.reset()
+            check_same(tilemap)
+            # Fading frames are not baked into the full map
+            assert tilemap.full_image is None
+            layer.state = None
+            tilemap.reset()
+            check_same(tilemap)
+        for layer in tilemap.layers:
+            if layer.autotile_images:
+                layer.autotile_frame = (layer.autotile_frame + 1) % len(layer.autotile_images)
+                tilemap.reset()
+                check_same(tilemap)
@@ -0,0 +1,96 @@
+import os
+
+from app.resources.resources import RESOURCES
+from conftest import load_project
+
+"""
+Checks that the music dictionary stays within its memory budget
+by unloading least recently used songs, without disturbing
+songs that are on a channel.
+"""
+
+SONGS = ['Chapter Sound', 'Game Over', 'Brave Story 61', 'Helms Deep']
+
+def test_music_budget():
+    load_project('lion_throne')
+    from app.engine import sound
+
+    music = sound.MusicDict(budget=0)
+    songs = [music.get(nid) for nid in SONGS]
+    assert all(song.size > 0 for song in songs)
+    # Only the most recent song stays decoded
+    assert [song.loaded for song in songs] == [False, False, False, True]
+    assert music.memory_used() == songs[-1].size
+    # Same song object comes back, decoded again
+    assert music.get(SONGS[0]) is songs[0]
+    assert songs[0].loaded and not songs[-1].loaded
+
+    music.set_budget(sum(song.size for song in songs[:3]) - 1)
+    for song in songs[:2]:
+        music.get(song.nid)
+    assert songs[0].loaded and songs[1].loaded
+    music.get(SONGS[2])
+    # Least recently used song goes first
+    assert not songs[0].loaded
+    assert songs[1].loaded and songs[2].loaded
+    assert music.memory_used() <= music.budget
+
+def test_music_in_use():
+    load_project('lion_throne')
+    from app.engine import sound
+
+    music = sound.MusicDict(budget=0)
+    channel = sound.ChannelPair(6)
+    song = music.get(SONGS[0])
+    channel.set_current_song(song)
+    channel.fade_in()
+    assert channel.is_playing()
+    for nid in SONGS[1:]:
+        music.get(nid)
+    assert song.loaded
+    assert music.memory_used() == song.size + music[SONGS[-1]].size
+
+    # Crossfade to the battle channel and back again
+    channel.crossfade()
+    assert channel.battle_mode and channel.battle.state == 'crossfade_in'
+    channel.crossfade()
+    assert not channel.battle_mode and channel.channel.state == 'crossfade_in'
+
+    channel.clear()
+    music.get(SONGS[1])
+    assert not song.loaded
+    # Unloaded songs decode again when played
+    channel.set_current_song(song)
+    channel.fade_in()
+    assert song.loaded and channel.is_playing()
+    channel.clear()
+
+def test_full_preload_budget():
+    load_project('lion_throne')
+    from app.engine import sound
+
+    budget = 32 * 1024 * 1024
+    music = sound.MusicDict(budget=budget)
+    music.full_preload()
+    assert len(music) == len([prefab for prefab in RESOURCES.music if os.path.exists(prefab.full_path)])
+    loaded = [song for song in music.values() if song.loaded]
+    assert loaded
+    # Stops decoding as soon as the budget is reached
+    assert music.memory_used() - loaded[-1].size < budget
+
+def test_budget_follows_setting():
+    load_project('lion_throne')
+    from app.engine import sound
+    from app.engine import config as cf
+
+    music = sound.MusicDict()
+    old_budget = cf.SETTINGS['music_budget']
+    try:
+        cf.SETTINGS['music_budget'] = 1
+        assert music.budget == 1024 * 1024
+        cf.SETTINGS['music_budget'] = 2
+        assert music.budget == 2 * 1024 * 1024
+    finally:
+        cf.SETTINGS['music_budget'] = old_budget
+    music.set_budget(0)
+    assert music.budget == 0
@@ -0,0 +1,45 @@
+import pytest
+
+from app.data.database import DB
+from app.engine import game_state, pathfinding
+from conftest import load_project
+
+"""
+Parity test between the Node based pathfinders and the array based
+pathfinders that replaced them. Every level in every bundled project
+is loaded, and the movement and path of every unit on the map is
+computed with both implementations.
+"""
+
+PROJECTS = ['default', 'lion_throne', 'sacred_stones']
+
+def compare_level(game):
+    board = game.board
+    width, height = game.tilemap.width, game.tilemap.height
+    units = [unit for unit in game.units if unit.position]
+    for unit in units:
+        mtype = game.movement.get_movement_group(unit)
+        grid = board.get_grid(mtype)
+        cost_grid = board.get_cost_grid(mtype)
+        for team in ('enemy', 'other'):
+            for pass_through in (False, True):
+                for movement_left in (0, 3, 7, 15):
+                    old = pathfinding.Djikstra(unit.position, grid, width, height, team, pass_through, False)
+                    new = pathfinding.ArrayDjikstra(unit.position, cost_grid, width, height, team, pass_through, False)
+                    assert old.process(board, movement_left) == new.process(board, movement_left), \
+                        (game.level.nid, unit.nid, team, pass_through, movement_left)
+
+        for other in units:
+            for adj_good_enough, ally_block, limit in ((True, False, None), (False, True, None), (True, False, 8)):
+                old = pathfinding.AStar(unit.position, other.position, grid, width, height, 'enemy')
+                new = pathfinding.ArrayAStar(unit.position, other.position, cost_grid, width, height, 'enemy')
+                old_path = old.process(board, adj_good_enough=adj_good_enough, ally_block=ally_block, limit=limit)
+                new_path = new.process(board, adj_good_enough=adj_good_enough, ally_block=ally_block, limit=limit)
+                assert old_path == new_path, (game.level.nid, unit.nid, other.nid)
+
+@pytest.mark.parametrize('project', PROJECTS)
+def test_pathfinding_parity(project):
+    load_project(project)
+    for level in DB.levels:
+        game = game_state.start_level(level.nid)
+        compare_level(game)
@@ -0,0 +1,56 @@
+import pytest
+
+from app.data.database import DB
+from app.engine import game_state
+from conftest import load_project
+
+"""
+Checks that the board's tile to region index finds the same regions,
+in the same order, as testing every region in the level.
+"""
+
+PROJECTS = ['default', 'lion_throne', 'sacred_stones']
+
+def check_index(game):
+    for x in range(game.board.width):
+        for y in range(game.board.height):
+            expected = [region for region in game.level.regions if region.contains((x, y))]
+            assert game.board.get_regions((x, y)) == tuple(expected), (x, y)
+
+@pytest.mark.parametrize('project', PROJECTS)
+def test_region_index(project):
+    load_project(project)
+    from app.engine import action
+    from app.events.regions import Region
+    for level in DB.levels:
+        game = game_state.start_level(level.nid)
+        check_index(game)
+
+    new_regions = []
+    for idx, (position, size) in enumerate([((0, 0), (3, 2)), ((1, 1), (1, 1)), ((2, 0), (40, 40))]):
+        region = Region('test_region%d' % idx)
+        region.region_type = 'event'
+        region.position, region.size = position, size
+        new_regions.append(region)
+    acts = [action.AddRegion(region) for region in new_regions]
+    for act in acts:
+        action.do(act)
+        check_index(game)
+    assert new_regions[1] in game.board.get_regions((1, 1))
+    assert game.check_for_region((2, 1), 'event') is new_regions[0]
+
+    remove = action.RemoveRegion(new_regions[0])
+    action.do(remove)
+    check_index(game)
+    action.reverse(remove)
+    check_index(game)
+    for act in reversed(acts):
+        action.reverse(act)
+        check_index(game)
+
+    # A new board for the same level
+    action.do(acts[2])
+    game.set_up_game_board(game.level.tilemap)
+    check_index(game)
+    assert game.board.get_regions(None) == ()
+    assert game.board.get_regions((-1, 0)) == ()
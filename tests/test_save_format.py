@@ -0,0 +1,88 @@
+import pickle
+from collections import Counter
+
+import pytest
+
+from app.data.database import DB
+from app.engine import game_state, save_format
+from conftest import load_project
+
+"""
+Checks that save dicts come back unchanged from the versioned save
+format, that old pickled saves still load, and that migrations run.
+"""
+
+PROJECTS = ['default', 'lion_throne', 'sacred_stones']
+
+@pytest.mark.parametrize('project', PROJECTS)
+def test_round_trip(project):
+    load_project(project)
+    for level in DB.levels:
+        game = game_state.start_level(level.nid)
+        s_dict, meta_dict = game.save()
+        data = save_format.dumps(s_dict)
+        assert save_format.get_version(data) == save_format.SAVE_VERSION
+        loaded = save_format.loads(data)
+        assert loaded == s_dict, level.nid
+        assert len(data) < len(pickle.dumps(s_dict))
+
+        # Old saves are pickles
+        assert save_format.get_version(pickle.dumps(s_dict)) == 0
+        assert save_format.loads(pickle.dumps(s_dict)) == s_dict
+
+        game.build_new()
+        game.load(loaded)
+        assert set(game.unit_registry) == {unit['nid'] for unit in s_dict['units']}
+        assert set(game.item_registry) == {item['uid'] for item in s_dict['items']}
+
+def test_tagged_values():
+    values = {'tuple': (1, (2, 3), [4, (5,)]),
+              'set': {1, 'a', (2, 3)},
+              'frozenset': frozenset([1, 2]),
+              'counter': Counter({'a': 2, (1, 2): 3}),
+              'keys': {(0, 1): 'a', 2: 'b', None: 'c', True: 'd'},
+              'tag': {'__tuple__': [1, 2]},
+              'nested': [{'__dict__': {}}, {'__set__': 1, 'other': 2}],
+              'float': 1.0,
+              'empty': ((), [], {}, set())}
+    loaded = save_format.loads(save_format.dumps(values))
+    assert loaded == values
+    assert type(loaded['float']) is float
+    assert type(loaded['counter']) is Counter
+    assert type(loaded['tuple'][2][1]) is tuple
+
+    with pytest.raises(TypeError):
+        save_format.dumps({'bad': object()})
+
+def test_registry_schema():
+    units = [{field: idx for idx, field in enumerate(save_format.SCHEMAS['units'])},
+             {'nid': 'Extra', 'not_in_schema': True}]
+    s_dict = {'units': units, 'turncount': 3}
+    assert save_format.loads(save_format.dumps(s_dict)) == s_dict
+
+def test_migration(monkeypatch):
+    data = save_format.dumps({'turncount': 3, 'money': 100})
+
+    def add_bonus(s_dict):
+        s_dict['bonus'] = s_dict.pop('money') * 2
+        return s_dict
+    monkeypatch.setattr(save_format, 'SAVE_VERSION', save_format.SAVE_VERSION + 1)
+    monkeypatch.setitem(save_format.MIGRATIONS, save_format.SAVE_VERSION - 1, add_bonus)
+    assert save_format.loads(data) == {'turncount': 3, 'bonus': 200}
+
+    newer = save_format.dumps({'turncount': 3})
+    monkeypatch.setattr(save_format, 'SAVE_VERSION', save_format.SAVE_VERSION - 1)
+    with pytest.raises(save_format.SaveFormatError):
+        save_format.loads(newer)
+
+def test_linked_copies(tmp_path):
+    load_project('default')
+    from app.engine import save
+    loc = str(tmp_path / 'slot.p')
+    copy_loc = str(tmp_path / 'restart.p')
+    save.write_file(loc, save_format.dumps({'turncount': 1}))
+    save.copy_file(loc, copy_loc)
+    # Writing the slot again leaves the copy alone
+    save.write_file(loc, save_format.dumps({'turncount': 2}))
+    assert save.read_save_file(loc) == {'turncount': 2}
+    assert save.read_save_file(copy_loc) == {'turncount': 1}
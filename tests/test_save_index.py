@@ -0,0 +1,80 @@
+import os
+import pickle
+
+from conftest import load_project
+
+"""
+Checks that the save index hands back slot metadata without reading
+the .pmeta files, and notices when they change or go missing.
+"""
+
+def write_meta(loc, title, realtime):
+    metadata = {'level_title': title, 'playtime': 10, 'realtime': realtime, 'kind': 'battle', 'mode': None}
+    with open(loc, 'wb') as fp:
+        pickle.dump(metadata, fp)
+    return metadata
+
+def rewrite_in_place(loc, title, realtime):
+    # Different contents, but the same size and modification time
+    stat = os.stat(loc)
+    write_meta(loc, title, realtime)
+    assert os.stat(loc).st_size == stat.st_size
+    os.utime(loc, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+def test_save_index(tmp_path, monkeypatch):
+    load_project('default')
+    from app.engine import save
+
+    index_loc = str(tmp_path / 'index.pindex')
+    locs = [str(tmp_path / ('slot%d.pmeta' % idx)) for idx in range(3)]
+    for idx, loc in enumerate(locs[:2]):
+        write_meta(loc, 'Chapter %d' % idx, 1000 + idx)
+
+    index = save.SaveIndex(index_loc)
+    monkeypatch.setattr(save, 'SAVE_INDEX', index)
+    slots = [save.SaveSlot(loc, idx) for idx, loc in enumerate(locs)]
+    assert [slot.name for slot in slots] == ['Chapter 0', 'Chapter 1', save.SaveSlot.no_name]
+    assert index.dirty
+    index.flush()
+    assert os.path.exists(index_loc) and not index.dirty
+
+    # A fresh index comes from the index file, not from the .pmeta files
+    rewrite_in_place(locs[0], 'Chapter 7', 1007)
+    index = save.SaveIndex(index_loc)
+    monkeypatch.setattr(save, 'SAVE_INDEX', index)
+    assert save.SaveSlot(locs[0], 0).name == 'Chapter 0'
+    assert not index.dirty
+
+    # Changed files are read again
+    stat = os.stat(locs[0])
+    os.utime(locs[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert save.SaveSlot(locs[0], 0).name == 'Chapter 7'
+    write_meta(locs[2], 'Chapter 2', 1002)
+    assert save.SaveSlot(locs[2], 2).realtime == 1002
+    assert index.dirty
+
+    # Removed files are dropped
+    os.remove(locs[1])
+    assert save.SaveSlot(locs[1], 1).kind is None
+    index.flush()
+    index = save.SaveIndex(index_loc)
+    index.load()
+    assert set(index.entries) == {locs[0], locs[2]}
+
+    # A corrupted index is rebuilt
+    with open(index_loc, 'wb') as fp:
+        fp.write(b'not an index')
+    index = save.SaveIndex(index_loc)
+    monkeypatch.setattr(save, 'SAVE_INDEX', index)
+    assert save.SaveSlot(locs[0], 0).name == 'Chapter 7'
+
+def test_record(tmp_path):
+    load_project('default')
+    from app.engine import save
+
+    index = save.SaveIndex(str(tmp_path / 'index.pindex'))
+    loc = str(tmp_path / 'slot.pmeta')
+    metadata = write_meta(loc, 'Chapter 3', 1003)
+    index.record(loc, metadata)
+    rewrite_in_place(loc, 'Chapter 4', 1004)
+    assert index.get(loc) == metadata
@@ -0,0 +1,54 @@
+import pygame
+
+from app.resources.resources import RESOURCES
+from app.engine import engine, image_mods
+from conftest import load_project
+
+"""
+Checks the vectorized make_gray against the old per pixel version,
+and that the map sprite effect cache keeps to its budget.
+"""
+
+def slow_make_gray(image):
+    for row in range(image.get_width()):
+        for col in range(image.get_height()):
+            color = image.get_at((row, col))
+            if color[3] != 0:
+                avg = int(color[0] * 0.298 + color[1] * 0.587 + color[2] * 0.114)
+                image.set_at((row, col), (avg, avg, avg, color[3]))
+    return image
+
+def to_string(image):
+    return pygame.image.tostring(image, 'RGBA')
+
+def test_make_gray():
+    load_project('lion_throne')
+    for icon in list(RESOURCES.icons16)[:5]:
+        image = engine.image_load(icon.full_path).convert_alpha()
+        image = engine.subsurface(image, (0, 0, min(64, image.get_width()), min(64, image.get_height())))
+        new = image_mods.make_gray(image.copy())
+        old = slow_make_gray(image.copy())
+        assert to_string(new) == to_string(old), icon.nid
+
+def test_effect_cache():
+    load_project('lion_throne')
+    from app.engine.unit_sprite import MapSprite, EffectCache, apply_effects
+    map_sprite = MapSprite(list(RESOURCES.map_sprites)[0], 'enemy')
+    frame = map_sprite.passive[0]
+    frame_bytes = frame.get_width() * frame.get_height() * 4
+    cache = EffectCache(budget=frame_bytes * 3)
+
+    effects = [('add', (80, 80, 80)), ('translucent', 0.5)]
+    image = cache.get((map_sprite, 'passive', 0, tuple(effects)), frame, effects)
+    assert to_string(image) == to_string(apply_effects(frame, effects))
+    assert cache.get((map_sprite, 'passive', 0, tuple(effects)), frame, effects) is image
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    for idx in range(1, 6):
+        effects = [('color', (idx, 0, 0))]
+        cache.get((map_sprite, 'passive', 0, tuple(effects)), frame, effects)
+        assert cache.size <= cache.budget
+    assert len(cache.images) == 3
+    assert cache.evictions == 3
+    # Oldest went first
+    assert [key[3][0][1][0] for key in cache.images] == [3, 4, 5]
@@ -0,0 +1,59 @@
+import pytest
+
+from app.data.database import DB
+from app.engine import game_state, skill_system
+from conftest import load_project
+
+"""
+Changes units in all the ways that can change their stat bonuses
+and checks that the cached bonuses always match bonuses computed
+from scratch.
+"""
+
+PROJECTS = ['lion_throne', 'sacred_stones']
+
+def check_unit(unit):
+    for stat_nid in DB.stats.keys():
+        assert skill_system.stat_change(unit, stat_nid) == skill_system._uncached_stat_change(unit, stat_nid), \
+            (unit.nid, stat_nid, [skill.nid for skill in unit.skills])
+
+def stat_skills() -> list:
+    return [skill.nid for skill in DB.skills if any(component.nid in ('stat_change', 'stat_multiplier') for component in skill.components)]
+
+@pytest.mark.parametrize('project', PROJECTS)
+def test_stat_cache(project):
+    load_project(project)
+    from app.engine import action
+    skill_nids = stat_skills()
+    for level in list(DB.levels)[:4]:
+        game = game_state.start_level(level.nid)
+        units = [unit for unit in game.units if unit.position]
+        for unit in units:
+            check_unit(unit)
+
+        for unit in units[:8]:
+            for skill_nid in skill_nids:
+                act = action.AddSkill(unit, skill_nid)
+                action.do(act)
+                check_unit(unit)
+                action.ApplyStatChanges(unit, {stat_nid: 1 for stat_nid in DB.stats.keys()}).do()
+                check_unit(unit)
+                action.reverse(act)
+                check_unit(unit)
+            for item in unit.items:
+                unit.equip(item)
+                check_unit(unit)
+            action.do(action.IncLevel(unit))
+            check_unit(unit)
+
+        # Moving around picks up and drops terrain, region and aura skills
+        width, height = game.tilemap.width, game.tilemap.height
+        for unit in units:
+            new_pos = (unit.position[0] + 1) % width, (unit.position[1] + 1) % height
+            if game.board.get_unit(new_pos) or not game.movement.check_traversable(unit, new_pos):
+                continue
+            game.leave(unit)
+            unit.position = new_pos
+            game.arrive(unit)
+            for other in units:
+                check_unit(other)
@@ -0,0 +1,115 @@
+import random
+
+from app.engine import game_state
+from conftest import load_project
+
+"""
+Checks that seeking the turnwheel straight to an action gives the
+same game state as rewinding or replaying one action at a time.
+"""
+
+def play_turns(game, turns, rng):
+    from app.engine import action, target_system
+    for _ in range(turns):
+        for unit in sorted(game.units, key=lambda unit: unit.nid):
+            if not unit.position or unit.dead:
+                continue
+            valid_moves = sorted(target_system.get_valid_moves(unit, force=True))
+            if valid_moves:
+                action.execute(action.Move(unit, rng.choice(valid_moves), []))
+            action.do(action.Wait(unit))
+        action.do(action.ResetAll([unit for unit in game.units]))
+        action.do(action.IncrementTurn())
+
+def snapshot(game):
+    boundary = game.boundary
+    return ([unit.save() for unit in game.unit_registry.values()],
+            [unit.has_moved for unit in game.unit_registry.values()],
+            list(game.board.unit_grid),
+            list(game.board.team_grid),
+            {mode: dict(positions) for mode, positions in boundary.dictionaries.items()},
+            {mode: [set(cell) for cell in grid] for mode, grid in boundary.grids.items()},
+            dict(boundary.reachable))
+
+def test_seek():
+    load_project('lion_throne')
+    rng = random.Random(0)
+    game = game_state.start_level('1')
+    log = game.action_log
+    log.set_first_free_action()
+    play_turns(game, 2, rng)
+    # An enemy joins the player, so seeking past it has to drop its threat ranges
+    from app.engine import action
+    enemy = next(unit for unit in sorted(game.units, key=lambda unit: unit.nid)
+                 if unit.position and unit.team == 'enemy')
+    action.do(action.ChangeTeam(enemy, 'player'))
+    play_turns(game, 2, rng)
+    log.record = False
+    log.set_up()
+
+    # One action at a time, the way the turnwheel used to
+    snapshots = {log.action_index: snapshot(game)}
+    while not log.at_far_past():
+        log.run_action_backward()
+        snapshots[log.action_index] = snapshot(game)
+    while not log.at_far_future():
+        log.run_action_forward()
+        assert snapshot(game) == snapshots[log.action_index], log.action_index
+
+    indices = sorted(snapshots)
+    for _ in range(12):
+        index = rng.choice(indices)
+        log.seek(index)
+        assert log.action_index == index
+        assert snapshot(game) == snapshots[index], index
+
+    # Going through the turnwheel's own moves
+    log.seek(indices[-1])
+    log.set_up()
+    while log.backward() is not None:
+        assert snapshot(game) == snapshots[log.action_index], log.action_index
+    while log.forward() is not None:
+        assert snapshot(game) == snapshots[log.action_index], log.action_index
+    log.reset()
+    assert snapshot(game) == snapshots[indices[-1]]
+
+def test_compact():
+    load_project('lion_throne')
+    rng = random.Random(1)
+    game = game_state.start_level('1')
+    from app.engine import action
+    log = game.action_log
+
+    # A cutscene before the first free action, moving units one step at a time
+    action.do(action.MarkPhase('enemy'))
+    action.do(action.MarkPhase('player'))
+    for unit in sorted(game.units, key=lambda unit: unit.nid):
+        if unit.position and unit.team == 'player':
+            for _ in range(3):
+                action.execute(action.Move(unit, unit.position, []))
+            action.do(action.Message(unit.nid))
+    prelude = len(log.actions)
+    log.set_first_free_action()
+    assert len(log.actions) == 2
+    assert log.first_free_action == log.action_index == 1
+    assert log.get_current_phase() == 'player'
+    start = snapshot(game)
+
+    play_turns(game, 2, rng)
+    end = snapshot(game)
+    num_actions = len(log.actions)
+
+    # Saved before the log was compacted, like an old save
+    actions, first_free_action = log.save()
+    old_actions = [('MarkPhase', actions[0][1])] * prelude + actions[1:]
+    restored = log.restore((old_actions, prelude))
+    assert len(restored.actions) == num_actions
+    assert restored.first_free_action == 1
+
+    log.record = False
+    log.set_up()
+    log.seek(log.first_free_action)
+    assert log.at_far_past()
+    assert snapshot(game) == start
+    log.reset()
+    assert snapshot(game) == end
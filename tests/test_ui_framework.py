@@ -0,0 +1,103 @@
+import pygame
+import pytest
+
+pytest.importorskip('PIL')
+
+from app.engine import engine
+from conftest import load_project
+
+"""
+Checks that the retained rendering of UI components draws the same
+thing as redrawing the whole tree every frame, through animations
+and changes to props, text and children.
+"""
+
+class Clock():
+    def __init__(self):
+        self.time = 0
+
+    def __call__(self):
+        return self.time
+
+def set_all_dirty(component):
+    component._dirty = True
+    for child in component.children:
+        set_all_dirty(child)
+
+def build_tree(clock):
+    from app.engine.graphics.ui_framework import (UIComponent, ResizeMode, HAlignment, VAlignment,
+                                                  UILayoutType, ListLayoutStyle)
+    from app.engine.graphics.ui_framework.premade_components.text_component import TextComponent
+    from app.engine.graphics.ui_framework.premade_animations.animation_templates import translate_anim
+
+    base = UIComponent.create_base_component()
+    base.name = 'base'
+
+    title = UIComponent(name='title')
+    bg = engine.create_surface((20, 10), True)
+    bg.fill((200, 40, 40, 255), (0, 0, 10, 10))
+    bg.fill((40, 40, 200, 128), (10, 0, 10, 10))
+    title.props.bg = bg
+    title.props.bg_resize_mode = ResizeMode.AUTO
+    title.size = (96, 24)
+    title.margin = (4, 4, 4, 4)
+    title.save_animation(translate_anim((-96, 0), (0, 0), duration=200), 'slide_in')
+    text = TextComponent('title text', 'Hello', title)
+    text.props.h_alignment = HAlignment.CENTER
+    text.props.v_alignment = VAlignment.CENTER
+    title.add_child(text)
+
+    column = UIComponent(name='column')
+    column.props.layout = UILayoutType.LIST
+    column.props.list_style = ListLayoutStyle.COLUMN
+    column.props.v_alignment = VAlignment.BOTTOM
+    column.props.bg_color = (0, 128, 0, 255)
+    column.size = ('40%', '40%')
+    column.padding = ('2%', '2%', '2%', '2%')
+    for idx in range(3):
+        item = UIComponent(name='item%d' % idx)
+        item.size = ('30%', '30%')
+        item.props.bg_color = (idx * 80, 0, 255 - idx * 80, 255)
+        column.add_child(item)
+
+    base.add_child(title)
+    base.add_child(column)
+    base.set_chronometer(clock)
+    return base, title, text, column
+
+def test_retained_rendering():
+    load_project('lion_throne')
+    from app.engine.graphics.ui_framework import UIComponent
+    clock = Clock()
+    base, title, text, column = build_tree(clock)
+
+    def check():
+        new = base.to_surf()
+        new_string = pygame.image.tostring(new, 'RGBA')
+        set_all_dirty(base)
+        old = base._to_surf()
+        assert new_string == pygame.image.tostring(old, 'RGBA'), clock.time
+
+    check()
+    # Nothing changed, so the whole tree should come from the cache
+    assert base.to_surf() is base.to_surf()
+
+    title.queue_animation(names=['slide_in'])
+    for _ in range(15):
+        clock.time += 20
+        check()
+
+    edits = [lambda: text.set_text('Goodbye, for now'),
+             lambda: setattr(column.props, 'bg_color', (0, 0, 0, 255)),
+             lambda: column.get_child('item1').__setattr__('width', '60%'),
+             lambda: setattr(base, 'width', 200),
+             lambda: column.remove_child('item0'),
+             lambda: column.add_child(UIComponent(name='item3')),
+             lambda: title.set_background(engine.create_surface((5, 5), True)),
+             lambda: title.disable(),
+             lambda: title.enable()]
+    for edit in edits:
+        before = pygame.image.tostring(base.to_surf(), 'RGBA')
+        edit()
+        check()
+    assert before != pygame.image.tostring(base.to_surf(), 'RGBA')
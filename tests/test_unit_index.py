@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from app.data.database import DB
+from app.engine import game_state
+from conftest import load_project
+
+"""
+Checks that the unit index stays in step with the unit registry while
+units move, change teams, leave and arrive on the map, and through
+saving and loading, and that its queries find the same units as
+filtering every registered unit.
+"""
+
+PROJECTS = ['default', 'lion_throne', 'sacred_stones']
+
+def check_index(game):
+    game.unit_index.check(game.unit_registry)
+    units = list(game.unit_registry.values())
+    assert list(game.units) == units
+    assert game.unit_index.query(on_map=True) == [unit for unit in units if unit.position]
+    assert game.unit_index.query(on_map=False) == [unit for unit in units if not unit.position]
+    for team in DB.teams:
+        assert game.unit_index.query(team=team, on_map=True) == \
+            [unit for unit in units if unit.team == team and unit.position]
+    for position in {unit.position for unit in units if unit.position}:
+        assert game.get_units_at(position) == [unit for unit in units if unit.position == position]
+    assert game.get_player_units() == \
+        [unit for unit in units if unit in game.get_all_units() and unit.team == 'player']
+    assert game.get_all_units_in_party() == \
+        [unit for unit in units if unit.team == 'player' and not unit.generic and unit.party == game.current_party]
+
+def random_action(game, rng):
+    from app.engine import action
+    unit = rng.choice(list(game.unit_registry.values()))
+    choice = rng.randrange(4)
+    if choice == 0 and unit.position:
+        open_tiles = [(x, y) for x in range(game.board.width) for y in range(game.board.height)
+                      if not game.board.get_unit((x, y))]
+        return action.Teleport(unit, rng.choice(open_tiles))
+    elif choice == 1:
+        return action.ChangeTeam(unit, rng.choice(DB.teams))
+    elif choice == 2 and unit.position:
+        return action.LeaveMap(unit)
+    elif choice == 3 and not unit.position:
+        open_tiles = [(x, y) for x in range(game.board.width) for y in range(game.board.height)
+                      if not game.board.get_unit((x, y))]
+        return action.ArriveOnMap(unit, rng.choice(open_tiles))
+    return None
+
+@pytest.mark.parametrize('project', PROJECTS)
+def test_unit_index(project):
+    load_project(project)
+    from app.engine import action
+    rng = random.Random(0)
+    for level in DB.levels:
+        game = game_state.start_level(level.nid)
+        check_index(game)
+        if not game.unit_registry:
+            continue
+
+        acts = []
+        for _ in range(30):
+            act = random_action(game, rng)
+            if act:
+                action.do(act)
+                acts.append(act)
+                check_index(game)
+        for act in reversed(acts[-10:]):
+            action.reverse(act)
+            check_index(game)
+
+        s_dict, meta_dict = game.save()
+        old_units = list(game.unit_registry.values())
+        game.build_new()
+        assert game.units == ()
+        game.load(s_dict)
+        check_index(game)
+        # Units from before the load no longer change the index
+        old_units[0].position = (0, 0)
+        check_index(game)
+
+def test_clean_up():
+    load_project('lion_throne')
+    game = game_state.start_level('1')
+    game.clean_up()
+    game.unit_index.check(game.unit_registry)
+    assert list(game.units) == list(game.unit_registry.values())
+    assert not any(unit.generic for unit in game.units)
+    assert not game.unit_index.query(on_map=True)